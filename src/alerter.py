@@ -1,127 +1,363 @@
 """Telegram notification sender for Polybotz."""
 
+import asyncio
+import functools
+import html
 import logging
+import time
+from typing import Any, Callable
 
 import httpx
 
+from .circuit_breaker import CircuitBreaker
 from .config import Configuration
+from .http_client import JSON_HEADERS, create_http_client, decode_json, encode_json
 from .models import ClosedEventAlert, LiquidityWarning, MADAlert, SpikeAlert, ZScoreAlert
+from .retry import backoff_delay
 
 logger = logging.getLogger("polybotz.alerter")
 
 TELEGRAM_API_BASE = "https://api.telegram.org"
 DEFAULT_TIMEOUT = 10.0
-
-
-def format_alert_message(alert: SpikeAlert) -> str:
-    """Format a spike alert as a Telegram Markdown message."""
-    direction_emoji = "\u2191" if alert.direction == "up" else "\u2193"
-    sign = "+" if alert.direction == "up" else "-"
-
-    return (
-        f"\U0001F6A8 *Price Spike Detected*\n\n"
-        f"*Event*: {_escape_markdown(alert.event_name)}\n"
-        f"*Market*: {_escape_markdown(alert.market_question)}\n"
-        f"*Outcome*: {alert.outcome}\n"
-        f"*Price*: {alert.price_before:.4f} {direction_emoji} {alert.price_after:.4f} "
-        f"({sign}{alert.change_percent:.1f}%)\n"
-        f"*Time*: {alert.detected_at.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+MAX_RETRIES = 3
+# Stay under Telegram's bot-wide cap of 30 messages per second
+TELEGRAM_RATE_LIMIT = 25.0
+TELEGRAM_BURST = 30
+
+# Translation table mapping each Markdown special character to its escaped form
+_MARKDOWN_ESCAPE_TABLE = str.maketrans({char: f"\\{char}" for char in "_*[]()~`>#+-=|{}.!"})
+# Telegram rejects messages over 4096 characters; leave headroom when batching
+TELEGRAM_BATCH_LIMIT = 4000
+BATCH_SEPARATOR = "\n\n---\n\n"
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by all outgoing Telegram sends."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+
+    async def acquire(self, n: int = 1) -> None:
+        """
+        Take n tokens, sleeping until they are available.
+
+        Tokens are reserved before sleeping (the balance may go negative), so
+        concurrent callers queue up behind each other without needing a lock.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        self._tokens -= n
+
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+_bucket = TokenBucket(TELEGRAM_RATE_LIMIT, TELEGRAM_BURST)
+
+# Fail fast instead of retrying every alert while Telegram is unreachable
+_tg_breaker = CircuitBreaker("Telegram")
+
+# Shared HTTP client so keep-alive connections to Telegram are reused across alerts
+_client: httpx.AsyncClient | None = None
+
+# One bound on in-flight Telegram sends, shared by concurrently running batches
+_semaphore: asyncio.Semaphore | None = None
+_semaphore_limit = 0
+
+
+def _get_client(config: Configuration | None = None) -> httpx.AsyncClient:
+    """
+    Return the shared Telegram HTTP client, creating it on first use.
+
+    Pool limits come from config when given, otherwise the defaults.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        if config is not None:
+            _client = create_http_client(
+                config.http_max_connections, config.http_max_keepalive, DEFAULT_TIMEOUT
+            )
+        else:
+            _client = create_http_client(timeout=DEFAULT_TIMEOUT)
+    return _client
+
+
+def _get_semaphore(config: Configuration) -> asyncio.Semaphore:
+    """
+    Return the shared send semaphore, creating it on first use.
+
+    It is recreated if config.telegram_concurrency changes.
+    """
+    global _semaphore, _semaphore_limit
+    if _semaphore is None or _semaphore_limit != config.telegram_concurrency:
+        _semaphore = asyncio.Semaphore(config.telegram_concurrency)
+        _semaphore_limit = config.telegram_concurrency
+    return _semaphore
+
+
+async def close_alerter() -> None:
+    """Close the shared Telegram HTTP client and drop the send semaphore (call on shutdown)."""
+    global _client, _semaphore
+    _semaphore = None
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Telegram parse modes
+PARSE_MODE_HTML = "HTML"
+PARSE_MODE_MARKDOWN = "Markdown"
+
+# Message templates, built once at import time
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_DIRECTION_ARROW = {"up": "↑", "down": "↓"}
+_DIRECTION_SIGN = {"up": "+", "down": "-"}
+
+_HTML_TEMPLATES = {
+    "spike": (
+        "\U0001F6A8 <b>Price Spike Detected</b>\n\n"
+        "<b>Event</b>: {}\n"
+        "<b>Market</b>: {}\n"
+        "<b>Outcome</b>: {}\n"
+        "<b>Price</b>: {:.4f} {} {:.4f} ({}{:.1f}%)\n"
+        "<b>Time</b>: {} UTC"
+    ),
+    "liquidity": (
+        "⚠️ <b>Liquidity Warning</b>\n\n"
+        "<b>Event</b>: {}\n"
+        "<b>Market</b>: {}\n"
+        "<b>Outcome</b>: {}\n"
+        "<b>Price</b>: {:.4f} {} {:.4f} ({}{:.1f}%)\n"
+        "<b>LVR</b>: {:.1f} ({})\n"
+        "<b>Time</b>: {} UTC"
+    ),
+    "event_identifier": "<b>Event</b>: {}\n<b>Outcome</b>: {}\n",
+    "token_identifier": "<b>Token</b>: {} <i>(event details unavailable)</i>\n",
+    "zscore": (
+        "\U0001F4CA <b>Z-Score Alert</b>\n\n"
+        "{}"
+        "<b>Metric</b>: {} ({})\n"
+        "<b>Current</b>: {:.4f}\n"
+        "<b>Median</b>: {:.4f}\n"
+        "<b>MAD</b>: {:.4f}\n"
+        "<b>Z-Score</b>: {:+.2f} ({})\n"
+        "<b>Threshold</b>: ±{:.1f}\n"
+        "<b>Time</b>: {} UTC"
+    ),
+    "mad": (
+        "\U0001F4C8 <b>MAD Alert</b>\n\n"
+        "{}"
+        "<b>Metric</b>: {} ({})\n"
+        "<b>Current</b>: {:.4f}\n"
+        "<b>Median</b>: {:.4f}\n"
+        "<b>MAD</b>: {:.4f}\n"
+        "<b>Deviation</b>: {:.1f}x MAD ({} median)\n"
+        "<b>Threshold</b>: {:.1f}x MAD\n"
+        "<b>Time</b>: {} UTC"
+    ),
+    "closed": (
+        "✅ <b>Market Closed</b>\n\n"
+        "<b>Event</b>: {}\n"
+        "<b>Market</b>: {}\n"
+        "<b>Outcome</b>: {}\n"
+        "<b>Final Price</b>: {}\n"
+        "<b>Time</b>: {} UTC"
+    ),
+}
+
+# Legacy Markdown templates, kept for telegram.parse_mode: Markdown
+_MARKDOWN_TEMPLATES = {
+    "spike": (
+        "\U0001F6A8 *Price Spike Detected*\n\n"
+        "*Event*: {}\n"
+        "*Market*: {}\n"
+        "*Outcome*: {}\n"
+        "*Price*: {:.4f} {} {:.4f} ({}{:.1f}%)\n"
+        "*Time*: {} UTC"
+    ),
+    "liquidity": (
+        "⚠️ *Liquidity Warning*\n\n"
+        "*Event*: {}\n"
+        "*Market*: {}\n"
+        "*Outcome*: {}\n"
+        "*Price*: {:.4f} {} {:.4f} ({}{:.1f}%)\n"
+        "*LVR*: {:.1f} ({})\n"
+        "*Time*: {} UTC"
+    ),
+    "event_identifier": "*Event*: {}\n*Outcome*: {}\n",
+    "token_identifier": "*Token*: {} _\\(event details unavailable\\)_\n",
+    "zscore": (
+        "\U0001F4CA *Z-Score Alert*\n\n"
+        "{}"
+        "*Metric*: {} ({})\n"
+        "*Current*: {:.4f}\n"
+        "*Median*: {:.4f}\n"
+        "*MAD*: {:.4f}\n"
+        "*Z-Score*: {:+.2f} ({})\n"
+        "*Threshold*: ±{:.1f}\n"
+        "*Time*: {} UTC"
+    ),
+    "mad": (
+        "\U0001F4C8 *MAD Alert*\n\n"
+        "{}"
+        "*Metric*: {} ({})\n"
+        "*Current*: {:.4f}\n"
+        "*Median*: {:.4f}\n"
+        "*MAD*: {:.4f}\n"
+        "*Deviation*: {:.1f}x MAD ({} median)\n"
+        "*Threshold*: {:.1f}x MAD\n"
+        "*Time*: {} UTC"
+    ),
+    "closed": (
+        "✅ *Market Closed*\n\n"
+        "*Event*: {}\n"
+        "*Market*: {}\n"
+        "*Outcome*: {}\n"
+        "*Final Price*: {}\n"
+        "*Time*: {} UTC"
+    ),
+}
+
+_TEMPLATES = {PARSE_MODE_HTML: _HTML_TEMPLATES, PARSE_MODE_MARKDOWN: _MARKDOWN_TEMPLATES}
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_html(text: str) -> str:
+    """Escape the characters Telegram HTML treats specially (<, > and &)."""
+    return html.escape(text, quote=False)
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_markdown(text: str) -> str:
+    """Escape special Markdown characters (memoized, event names repeat across alerts)."""
+    return text.translate(_MARKDOWN_ESCAPE_TABLE)
+
+
+def _escapers(parse_mode: str) -> tuple[Callable[[str], str], Callable[[str], str]]:
+    """
+    Return (text, outcome) escape functions for a parse mode.
+
+    Legacy Markdown leaves outcomes unescaped, HTML escapes everything.
+    """
+    if parse_mode == PARSE_MODE_MARKDOWN:
+        return _escape_markdown, str
+    return _escape_html, _escape_html
+
+
+def format_alert_message(alert: SpikeAlert, parse_mode: str = PARSE_MODE_HTML) -> str:
+    """Format a spike alert as a Telegram message in the given parse mode."""
+    escape, escape_outcome = _escapers(parse_mode)
+    return _TEMPLATES[parse_mode]["spike"].format(
+        escape(alert.event_name),
+        escape(alert.market_question),
+        escape_outcome(alert.outcome),
+        alert.price_before,
+        _DIRECTION_ARROW.get(alert.direction, "↓"),
+        alert.price_after,
+        _DIRECTION_SIGN.get(alert.direction, "-"),
+        alert.change_percent,
+        alert.detected_at.strftime(_TIME_FORMAT),
     )
 
 
-def format_liquidity_warning_message(warning: LiquidityWarning) -> str:
-    """Format a liquidity warning as a Telegram Markdown message."""
-    direction_emoji = "\u2191" if warning.direction == "up" else "\u2193"
-    sign = "+" if warning.direction == "up" else "-"
-
-    return (
-        f"\u26A0\uFE0F *Liquidity Warning*\n\n"
-        f"*Event*: {_escape_markdown(warning.event_name)}\n"
-        f"*Market*: {_escape_markdown(warning.market_question)}\n"
-        f"*Outcome*: {warning.outcome}\n"
-        f"*Price*: {warning.price_before:.4f} {direction_emoji} {warning.price_after:.4f} "
-        f"({sign}{warning.change_percent:.1f}%)\n"
-        f"*LVR*: {warning.lvr:.1f} ({warning.health_status})\n"
-        f"*Time*: {warning.detected_at.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+def format_liquidity_warning_message(
+    warning: LiquidityWarning, parse_mode: str = PARSE_MODE_HTML
+) -> str:
+    """Format a liquidity warning as a Telegram message in the given parse mode."""
+    escape, escape_outcome = _escapers(parse_mode)
+    return _TEMPLATES[parse_mode]["liquidity"].format(
+        escape(warning.event_name),
+        escape(warning.market_question),
+        escape_outcome(warning.outcome),
+        warning.price_before,
+        _DIRECTION_ARROW.get(warning.direction, "↓"),
+        warning.price_after,
+        _DIRECTION_SIGN.get(warning.direction, "-"),
+        warning.change_percent,
+        warning.lvr,
+        warning.health_status,
+        warning.detected_at.strftime(_TIME_FORMAT),
     )
 
 
-def format_zscore_alert(alert: ZScoreAlert) -> str:
-    """Format a Z-score alert as a Telegram Markdown message."""
-    direction = "spike" if alert.zscore > 0 else "drop"
-
-    # Use human-readable event info if available, otherwise fallback to market_id
+def _format_identifier_lines(alert: ZScoreAlert | MADAlert, parse_mode: str) -> str:
+    """Use human-readable event info if available, otherwise fall back to market_id."""
+    escape, escape_outcome = _escapers(parse_mode)
+    templates = _TEMPLATES[parse_mode]
     if alert.event_name and alert.outcome:
-        identifier_lines = (
-            f"*Event*: {_escape_markdown(alert.event_name)}\n"
-            f"*Outcome*: {alert.outcome}\n"
+        return templates["event_identifier"].format(
+            escape(alert.event_name), escape_outcome(alert.outcome)
         )
-    else:
-        identifier_lines = (
-            f"*Token*: {_escape_markdown(alert.market_id)} _\\(event details unavailable\\)_\n"
-        )
-
-    return (
-        f"\U0001F4CA *Z-Score Alert*\n\n"
-        f"{identifier_lines}"
-        f"*Metric*: {alert.metric} ({alert.window})\n"
-        f"*Current*: {alert.current_value:.4f}\n"
-        f"*Median*: {alert.median:.4f}\n"
-        f"*MAD*: {alert.mad:.4f}\n"
-        f"*Z-Score*: {alert.zscore:+.2f} ({direction})\n"
-        f"*Threshold*: \u00b1{alert.threshold:.1f}\n"
-        f"*Time*: {alert.detected_at.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+    return templates["token_identifier"].format(escape(alert.market_id))
+
+
+def format_zscore_alert(alert: ZScoreAlert, parse_mode: str = PARSE_MODE_HTML) -> str:
+    """Format a Z-score alert as a Telegram message in the given parse mode."""
+    return _TEMPLATES[parse_mode]["zscore"].format(
+        _format_identifier_lines(alert, parse_mode),
+        alert.metric,
+        alert.window,
+        alert.current_value,
+        alert.median,
+        alert.mad,
+        alert.zscore,
+        "spike" if alert.zscore > 0 else "drop",
+        alert.threshold,
+        alert.detected_at.strftime(_TIME_FORMAT),
     )
 
 
-def format_mad_alert(alert: MADAlert) -> str:
-    """Format a MAD alert as a Telegram Markdown message."""
-    direction = "above" if alert.current_value > alert.median else "below"
-
-    # Use human-readable event info if available, otherwise fallback to market_id
-    if alert.event_name and alert.outcome:
-        identifier_lines = (
-            f"*Event*: {_escape_markdown(alert.event_name)}\n"
-            f"*Outcome*: {alert.outcome}\n"
-        )
-    else:
-        identifier_lines = (
-            f"*Token*: {_escape_markdown(alert.market_id)} _\\(event details unavailable\\)_\n"
-        )
-
-    return (
-        f"\U0001F4C8 *MAD Alert*\n\n"
-        f"{identifier_lines}"
-        f"*Metric*: {alert.metric} ({alert.window})\n"
-        f"*Current*: {alert.current_value:.4f}\n"
-        f"*Median*: {alert.median:.4f}\n"
-        f"*MAD*: {alert.mad:.4f}\n"
-        f"*Deviation*: {alert.multiplier:.1f}x MAD ({direction} median)\n"
-        f"*Threshold*: {alert.threshold_multiplier:.1f}x MAD\n"
-        f"*Time*: {alert.detected_at.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+def format_mad_alert(alert: MADAlert, parse_mode: str = PARSE_MODE_HTML) -> str:
+    """Format a MAD alert as a Telegram message in the given parse mode."""
+    return _TEMPLATES[parse_mode]["mad"].format(
+        _format_identifier_lines(alert, parse_mode),
+        alert.metric,
+        alert.window,
+        alert.current_value,
+        alert.median,
+        alert.mad,
+        alert.multiplier,
+        "above" if alert.current_value > alert.median else "below",
+        alert.threshold_multiplier,
+        alert.detected_at.strftime(_TIME_FORMAT),
     )
 
 
-def format_closed_event_alert(alert: ClosedEventAlert) -> str:
-    """Format a closed event alert as a Telegram Markdown message."""
+def format_closed_event_alert(alert: ClosedEventAlert, parse_mode: str = PARSE_MODE_HTML) -> str:
+    """Format a closed event alert as a Telegram message in the given parse mode."""
+    escape, escape_outcome = _escapers(parse_mode)
     price_str = f"{alert.final_price:.4f}" if alert.final_price is not None else "N/A"
 
-    return (
-        f"\u2705 *Market Closed*\n\n"
-        f"*Event*: {_escape_markdown(alert.event_name)}\n"
-        f"*Market*: {_escape_markdown(alert.market_question)}\n"
-        f"*Outcome*: {alert.outcome}\n"
-        f"*Final Price*: {price_str}\n"
-        f"*Time*: {alert.detected_at.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+    return _TEMPLATES[parse_mode]["closed"].format(
+        escape(alert.event_name),
+        escape(alert.market_question),
+        escape_outcome(alert.outcome),
+        price_str,
+        alert.detected_at.strftime(_TIME_FORMAT),
     )
 
 
-def _escape_markdown(text: str) -> str:
-    """Escape special Markdown characters."""
-    special_chars = ["_", "*", "[", "]", "(", ")", "~", "`", ">", "#", "+", "-", "=", "|", "{", "}", ".", "!"]
-    for char in special_chars:
-        text = text.replace(char, f"\\{char}")
-    return text
+def clear_format_caches() -> None:
+    """Clear memoized formatting helpers."""
+    _escape_html.cache_clear()
+    _escape_markdown.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _send_url(bot_token: str) -> str:
+    """Return the sendMessage URL for a bot token (cached, the token rarely changes)."""
+    return f"{TELEGRAM_API_BASE}/bot{bot_token}/sendMessage"
 
 
 async def send_telegram_alert(
@@ -129,95 +365,211 @@ async def send_telegram_alert(
     chat_id: str,
     message: str,
     timeout: float = DEFAULT_TIMEOUT,
+    client: httpx.AsyncClient | None = None,
+    max_retries: int = MAX_RETRIES,
+    parse_mode: str = PARSE_MODE_HTML,
 ) -> bool:
-    """Send a message via Telegram Bot API."""
-    url = f"{TELEGRAM_API_BASE}/bot{bot_token}/sendMessage"
+    """Send a message via Telegram Bot API.
 
-    payload = {
+    Uses the provided client, or the shared module-level client if omitted.
+    Rate limits (429), server errors and network failures are retried with
+    exponential backoff, honoring Retry-After when Telegram provides it.
+    Returns False immediately while the Telegram circuit breaker is open.
+    """
+    url = _send_url(bot_token)
+
+    content = encode_json({
         "chat_id": chat_id,
         "text": message,
-        "parse_mode": "Markdown",
-    }
+        "parse_mode": parse_mode,
+    })
+
+    if client is None:
+        client = _get_client()
+
+    for attempt in range(max_retries):
+        if not _tg_breaker.allow():
+            logger.warning("Telegram circuit open, skipping alert")
+            return False
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, timeout=timeout)
+        await _bucket.acquire()
+
+        try:
+            response = await client.post(url, content=content, headers=JSON_HEADERS, timeout=timeout)
+            _tg_breaker.record(response.status_code < 500)
 
             if response.status_code == 200:
-                result = response.json()
+                result = decode_json(response)
                 if result.get("ok"):
                     logger.info("Telegram alert sent successfully")
                     return True
                 else:
-                    logger.error(f"Telegram API error: {result.get('description')}")
+                    logger.error("Telegram API error: %s", result.get("description"))
                     return False
 
-            elif response.status_code == 429:
-                logger.warning("Telegram rate limited, alert not sent")
-                return False
-            else:
-                logger.error(f"Telegram HTTP error: {response.status_code}")
-                return False
+            if response.status_code == 429 or response.status_code >= 500:
+                if attempt < max_retries - 1:
+                    delay = backoff_delay(attempt, response)
+                    logger.warning(
+                        "Telegram HTTP %s, retrying in %.1fs (attempt %s/%s)",
+                        response.status_code, delay, attempt + 1, max_retries,
+                    )
+                    await asyncio.sleep(delay)
+                continue
+
+            logger.error("Telegram HTTP error: %s", response.status_code)
+            return False
+
+        except httpx.TimeoutException:
+            _tg_breaker.record(False)
+            logger.warning("Telegram API timeout, attempt %s/%s", attempt + 1, max_retries)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+        except httpx.RequestError as e:
+            _tg_breaker.record(False)
+            logger.warning("Telegram request error: %s, attempt %s/%s", e, attempt + 1, max_retries)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+        except ValueError as e:
+            logger.error("Telegram response parse error: %s", e)
+            return False
+
+    logger.error("Failed to send Telegram alert after %s attempts", max_retries)
+    return False
+
+
+def _group_messages(messages: list[str], limit: int = TELEGRAM_BATCH_LIMIT) -> list[list[str]]:
+    """Greedily group messages so each joined group stays under limit characters."""
+    groups: list[list[str]] = []
+    current: list[str] = []
+    current_len = 0
+
+    for message in messages:
+        added_len = len(message) + (len(BATCH_SEPARATOR) if current else 0)
+        if current and current_len + added_len > limit:
+            groups.append(current)
+            current, current_len = [], 0
+            added_len = len(message)
+        current.append(message)
+        current_len += added_len
+
+    if current:
+        groups.append(current)
+    return groups
+
+
+def batch_format(messages: list[str], limit: int = TELEGRAM_BATCH_LIMIT) -> list[str]:
+    """
+    Combine messages into as few Telegram messages as possible.
+
+    Messages are joined with a separator, each combined message staying
+    under limit characters. A single message longer than limit is kept alone.
+    """
+    return [BATCH_SEPARATOR.join(group) for group in _group_messages(messages, limit)]
+
+
+async def _send_one(
+    semaphore: asyncio.Semaphore,
+    client: httpx.AsyncClient,
+    config: Configuration,
+    message: str,
+) -> bool:
+    """Send a single message while holding the batch concurrency semaphore."""
+    async with semaphore:
+        return await send_telegram_alert(
+            config.telegram_bot_token,
+            config.telegram_chat_id,
+            message,
+            client=client,
+            parse_mode=config.telegram_parse_mode,
+        )
 
-    except httpx.TimeoutException:
-        logger.error("Telegram API timeout")
-        return False
-    except httpx.RequestError as e:
-        logger.error(f"Telegram request error: {e}")
-        return False
 
+def _describe_market(item: SpikeAlert | LiquidityWarning | ClosedEventAlert) -> str:
+    """Identify a Gamma market alert in log messages."""
+    return f"{item.market_question} [{item.outcome}]"
 
-async def send_all_alerts(
-    alerts: list[SpikeAlert],
+
+def _describe_token(item: ZScoreAlert | MADAlert) -> str:
+    """Identify a CLOB token alert in log messages."""
+    return f"{item.market_id} [{item.metric}/{item.window}]"
+
+
+async def _send_all(
+    items: list,
+    formatter: Callable[[Any, str], str],
+    describe: Callable[[Any], str],
+    kind: str,
     config: Configuration,
 ) -> int:
-    """Send all spike alerts via Telegram, return count of successfully sent."""
-    sent_count = 0
-
-    for alert in alerts:
-        message = format_alert_message(alert)
-        success = await send_telegram_alert(
-            config.telegram_bot_token,
-            config.telegram_chat_id,
-            message,
+    """
+    Format and send all items via Telegram, return count of successfully sent.
+
+    Sends run concurrently, bounded by config.telegram_concurrency across
+    all batches in flight. With
+    config.telegram_batch_alerts, items are combined into as few messages
+    as the Telegram length limit allows.
+    """
+    if not items:
+        return 0
+
+    messages = [formatter(item, config.telegram_parse_mode) for item in items]
+    client = _get_client(config)
+    semaphore = _get_semaphore(config)
+
+    if config.telegram_batch_alerts:
+        groups = _group_messages(messages)
+        results = await asyncio.gather(
+            *(_send_one(semaphore, client, config, BATCH_SEPARATOR.join(group)) for group in groups),
+            return_exceptions=True,
         )
 
-        if success:
+        sent_count = 0
+        for group, result in zip(groups, results):
+            if result is True:
+                sent_count += len(group)
+            elif isinstance(result, BaseException):
+                logger.warning("Failed to send batch of %s %ss: %s", len(group), kind, result)
+            else:
+                logger.warning("Failed to send batch of %s %ss", len(group), kind)
+
+        logger.info("Sent %s/%s %ss via Telegram in %s message(s)", sent_count, len(items), kind, len(groups))
+        return sent_count
+
+    results = await asyncio.gather(
+        *(_send_one(semaphore, client, config, message) for message in messages),
+        return_exceptions=True,
+    )
+
+    sent_count = 0
+    for item, result in zip(items, results):
+        if result is True:
             sent_count += 1
+        elif isinstance(result, BaseException):
+            logger.warning("Failed to send %s for %s: %s", kind, describe(item), result)
         else:
-            logger.warning(
-                f"Failed to send alert for {alert.market_question} [{alert.outcome}]"
-            )
+            logger.warning("Failed to send %s for %s", kind, describe(item))
 
-    logger.info(f"Sent {sent_count}/{len(alerts)} alerts via Telegram")
+    logger.info("Sent %s/%s %ss via Telegram", sent_count, len(items), kind)
     return sent_count
 
 
+async def send_all_alerts(
+    alerts: list[SpikeAlert],
+    config: Configuration,
+) -> int:
+    """Send all spike alerts via Telegram, return count of successfully sent."""
+    return await _send_all(alerts, format_alert_message, _describe_market, "alert", config)
+
+
 async def send_all_liquidity_warnings(
     warnings: list[LiquidityWarning],
     config: Configuration,
 ) -> int:
     """Send all liquidity warnings via Telegram, return count of successfully sent."""
-    sent_count = 0
-
-    for warning in warnings:
-        message = format_liquidity_warning_message(warning)
-        success = await send_telegram_alert(
-            config.telegram_bot_token,
-            config.telegram_chat_id,
-            message,
-        )
-
-        if success:
-            sent_count += 1
-        else:
-            logger.warning(
-                f"Failed to send liquidity warning for {warning.market_question} [{warning.outcome}]"
-            )
-
-    if warnings:
-        logger.info(f"Sent {sent_count}/{len(warnings)} liquidity warnings via Telegram")
-    return sent_count
+    return await _send_all(
+        warnings, format_liquidity_warning_message, _describe_market, "liquidity warning", config
+    )
 
 
 async def send_all_zscore_alerts(
@@ -225,26 +577,7 @@ async def send_all_zscore_alerts(
     config: Configuration,
 ) -> int:
     """Send all Z-score alerts via Telegram, return count of successfully sent."""
-    sent_count = 0
-
-    for alert in alerts:
-        message = format_zscore_alert(alert)
-        success = await send_telegram_alert(
-            config.telegram_bot_token,
-            config.telegram_chat_id,
-            message,
-        )
-
-        if success:
-            sent_count += 1
-        else:
-            logger.warning(
-                f"Failed to send Z-score alert for {alert.market_id} [{alert.metric}/{alert.window}]"
-            )
-
-    if alerts:
-        logger.info(f"Sent {sent_count}/{len(alerts)} Z-score alerts via Telegram")
-    return sent_count
+    return await _send_all(alerts, format_zscore_alert, _describe_token, "Z-score alert", config)
 
 
 async def send_all_mad_alerts(
@@ -252,26 +585,7 @@ async def send_all_mad_alerts(
     config: Configuration,
 ) -> int:
     """Send all MAD alerts via Telegram, return count of successfully sent."""
-    sent_count = 0
-
-    for alert in alerts:
-        message = format_mad_alert(alert)
-        success = await send_telegram_alert(
-            config.telegram_bot_token,
-            config.telegram_chat_id,
-            message,
-        )
-
-        if success:
-            sent_count += 1
-        else:
-            logger.warning(
-                f"Failed to send MAD alert for {alert.market_id} [{alert.metric}/{alert.window}]"
-            )
-
-    if alerts:
-        logger.info(f"Sent {sent_count}/{len(alerts)} MAD alerts via Telegram")
-    return sent_count
+    return await _send_all(alerts, format_mad_alert, _describe_token, "MAD alert", config)
 
 
 async def send_all_closed_event_alerts(
@@ -279,23 +593,6 @@ async def send_all_closed_event_alerts(
     config: Configuration,
 ) -> int:
     """Send all closed event alerts via Telegram, return count of successfully sent."""
-    sent_count = 0
-
-    for alert in alerts:
-        message = format_closed_event_alert(alert)
-        success = await send_telegram_alert(
-            config.telegram_bot_token,
-            config.telegram_chat_id,
-            message,
-        )
-
-        if success:
-            sent_count += 1
-        else:
-            logger.warning(
-                f"Failed to send closed event alert for {alert.market_question} [{alert.outcome}]"
-            )
-
-    if alerts:
-        logger.info(f"Sent {sent_count}/{len(alerts)} closed event alerts via Telegram")
-    return sent_count
+    return await _send_all(
+        alerts, format_closed_event_alert, _describe_market, "closed event alert", config
+    )
@@ -0,0 +1,81 @@
+"""Circuit breaker used to fail fast while an upstream API is down."""
+
+import logging
+import time
+
+logger = logging.getLogger("polybotz.circuit_breaker")
+
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Track consecutive failures for an endpoint and short-circuit calls.
+
+    CLOSED: calls are allowed. After failure_threshold consecutive failures
+    the breaker goes OPEN and rejects calls for reset_timeout seconds, then
+    goes HALF_OPEN and lets a single probe through. A successful probe
+    closes the breaker, a failed one reopens it. If the probe never reports
+    back (for example because it was cancelled), another probe is allowed
+    reset_timeout seconds after it was granted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.reset()
+
+    @property
+    def state(self) -> str:
+        """Current breaker state: closed, open or half_open."""
+        return self._state
+
+    def reset(self) -> None:
+        """Close the breaker and forget recorded failures."""
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now."""
+        if self._state == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if now - self._opened_at >= self.reset_timeout:
+            # Let exactly one probe through until its result is recorded, or
+            # until reset_timeout passes without one
+            self._state = HALF_OPEN
+            self._opened_at = now
+            return True
+
+        return False
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of an attempted call."""
+        if success:
+            if self._state != CLOSED:
+                logger.info("%s circuit closed", self.name)
+            self.reset()
+            return
+
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                logger.warning(
+                    "%s circuit opened after %s consecutive failures, pausing for %.0fs",
+                    self.name, self._failures, self.reset_timeout,
+                )
+            self._state = OPEN
+            self._opened_at = time.monotonic()
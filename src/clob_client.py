@@ -2,16 +2,29 @@
 
 import asyncio
 import logging
-from datetime import datetime
 
 import httpx
 
+from .circuit_breaker import CircuitBreaker
+from .config import Configuration
+from .http_client import JSON_HEADERS, create_http_client, decode_json, encode_json
+from .retry import backoff_delay
+
 logger = logging.getLogger("polybotz.clob_client")
 
 CLOB_API_BASE = "https://clob.polymarket.com"
 DEFAULT_TIMEOUT = 10.0
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
+MAX_CONCURRENT_REQUESTS = 10
+
+# Fail fast instead of retrying every token while the CLOB API is unreachable
+_clob_breaker = CircuitBreaker("CLOB")
+
+
+def get_clob_client(config: Configuration) -> httpx.AsyncClient:
+    """Create the tuned HTTP/2 client used for Gamma and CLOB polling."""
+    return create_http_client(config.http_max_connections, config.http_max_keepalive, DEFAULT_TIMEOUT)
 
 
 async def fetch_price(
@@ -29,43 +42,50 @@ async def fetch_price(
     params = {"token_id": token_id}
 
     for attempt in range(max_retries):
+        if not _clob_breaker.allow():
+            logger.warning("CLOB circuit open, skipping price for %s", token_id)
+            return None
+
         try:
             response = await client.get(url, params=params, timeout=timeout)
+            _clob_breaker.record(response.status_code < 500)
 
             if response.status_code == 404:
-                logger.warning(f"Token not found: {token_id}")
+                logger.warning("Token not found: %s", token_id)
                 return None
 
             if response.status_code == 429:
-                delay = RETRY_DELAY * (2**attempt)
-                logger.warning(f"CLOB rate limited, waiting {delay}s (attempt {attempt + 1}/{max_retries})")
+                delay = backoff_delay(attempt, response, base=RETRY_DELAY)
+                logger.warning("CLOB rate limited, waiting %.1fs (attempt %s/%s)", delay, attempt + 1, max_retries)
                 await asyncio.sleep(delay)
                 continue
 
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response)
             price_str = data.get("price")
             if price_str is not None:
                 return float(price_str)
             return None
 
         except httpx.TimeoutException:
-            logger.warning(f"CLOB timeout fetching price for {token_id}, attempt {attempt + 1}/{max_retries}")
+            _clob_breaker.record(False)
+            logger.warning("CLOB timeout fetching price for %s, attempt %s/%s", token_id, attempt + 1, max_retries)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
         except httpx.HTTPStatusError as e:
-            logger.error(f"CLOB HTTP error fetching price for {token_id}: {e.response.status_code}")
+            logger.error("CLOB HTTP error fetching price for %s: %s", token_id, e.response.status_code)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, e.response, base=RETRY_DELAY))
         except httpx.RequestError as e:
-            logger.error(f"CLOB request error fetching price for {token_id}: {e}")
+            _clob_breaker.record(False)
+            logger.error("CLOB request error fetching price for %s: %s", token_id, e)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
         except (ValueError, KeyError) as e:
-            logger.error(f"CLOB parse error for price {token_id}: {e}")
+            logger.error("CLOB parse error for price %s: %s", token_id, e)
             return None
 
-    logger.error(f"Failed to fetch price for {token_id} after {max_retries} attempts")
+    logger.error("Failed to fetch price for %s after %s attempts", token_id, max_retries)
     return None
 
 
@@ -84,43 +104,50 @@ async def fetch_midpoint(
     params = {"token_id": token_id}
 
     for attempt in range(max_retries):
+        if not _clob_breaker.allow():
+            logger.warning("CLOB circuit open, skipping midpoint for %s", token_id)
+            return None
+
         try:
             response = await client.get(url, params=params, timeout=timeout)
+            _clob_breaker.record(response.status_code < 500)
 
             if response.status_code == 404:
-                logger.warning(f"Token not found for midpoint: {token_id}")
+                logger.warning("Token not found for midpoint: %s", token_id)
                 return None
 
             if response.status_code == 429:
-                delay = RETRY_DELAY * (2**attempt)
-                logger.warning(f"CLOB rate limited, waiting {delay}s (attempt {attempt + 1}/{max_retries})")
+                delay = backoff_delay(attempt, response, base=RETRY_DELAY)
+                logger.warning("CLOB rate limited, waiting %.1fs (attempt %s/%s)", delay, attempt + 1, max_retries)
                 await asyncio.sleep(delay)
                 continue
 
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response)
             mid_str = data.get("mid")
             if mid_str is not None:
                 return float(mid_str)
             return None
 
         except httpx.TimeoutException:
-            logger.warning(f"CLOB timeout fetching midpoint for {token_id}, attempt {attempt + 1}/{max_retries}")
+            _clob_breaker.record(False)
+            logger.warning("CLOB timeout fetching midpoint for %s, attempt %s/%s", token_id, attempt + 1, max_retries)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
         except httpx.HTTPStatusError as e:
-            logger.error(f"CLOB HTTP error fetching midpoint for {token_id}: {e.response.status_code}")
+            logger.error("CLOB HTTP error fetching midpoint for %s: %s", token_id, e.response.status_code)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, e.response, base=RETRY_DELAY))
         except httpx.RequestError as e:
-            logger.error(f"CLOB request error fetching midpoint for {token_id}: {e}")
+            _clob_breaker.record(False)
+            logger.error("CLOB request error fetching midpoint for %s: %s", token_id, e)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
         except (ValueError, KeyError) as e:
-            logger.error(f"CLOB parse error for midpoint {token_id}: {e}")
+            logger.error("CLOB parse error for midpoint %s: %s", token_id, e)
             return None
 
-    logger.error(f"Failed to fetch midpoint for {token_id} after {max_retries} attempts")
+    logger.error("Failed to fetch midpoint for %s after %s attempts", token_id, max_retries)
     return None
 
 
@@ -139,76 +166,214 @@ async def fetch_book(
     params = {"token_id": token_id}
 
     for attempt in range(max_retries):
+        if not _clob_breaker.allow():
+            logger.warning("CLOB circuit open, skipping book for %s", token_id)
+            return None
+
         try:
             response = await client.get(url, params=params, timeout=timeout)
+            _clob_breaker.record(response.status_code < 500)
 
             if response.status_code == 404:
-                logger.warning(f"Token not found for book: {token_id}")
+                logger.warning("Token not found for book: %s", token_id)
                 return None
 
             if response.status_code == 429:
-                delay = RETRY_DELAY * (2**attempt)
-                logger.warning(f"CLOB rate limited, waiting {delay}s (attempt {attempt + 1}/{max_retries})")
+                delay = backoff_delay(attempt, response, base=RETRY_DELAY)
+                logger.warning("CLOB rate limited, waiting %.1fs (attempt %s/%s)", delay, attempt + 1, max_retries)
                 await asyncio.sleep(delay)
                 continue
 
             response.raise_for_status()
-            return response.json()
+            return decode_json(response)
 
         except httpx.TimeoutException:
-            logger.warning(f"CLOB timeout fetching book for {token_id}, attempt {attempt + 1}/{max_retries}")
+            _clob_breaker.record(False)
+            logger.warning("CLOB timeout fetching book for %s, attempt %s/%s", token_id, attempt + 1, max_retries)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
         except httpx.HTTPStatusError as e:
-            logger.error(f"CLOB HTTP error fetching book for {token_id}: {e.response.status_code}")
+            logger.error("CLOB HTTP error fetching book for %s: %s", token_id, e.response.status_code)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, e.response, base=RETRY_DELAY))
         except httpx.RequestError as e:
-            logger.error(f"CLOB request error fetching book for {token_id}: {e}")
+            _clob_breaker.record(False)
+            logger.error("CLOB request error fetching book for %s: %s", token_id, e)
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
+        except ValueError as e:
+            logger.error("CLOB parse error for book %s: %s", token_id, e)
+            return None
 
-    logger.error(f"Failed to fetch book for {token_id} after {max_retries} attempts")
+    logger.error("Failed to fetch book for %s after %s attempts", token_id, max_retries)
     return None
 
 
+async def _post_batch(
+    client: httpx.AsyncClient,
+    path: str,
+    token_ids: list[str],
+    timeout: float = DEFAULT_TIMEOUT,
+    max_retries: int = MAX_RETRIES,
+):
+    """
+    POST a list of token IDs to a CLOB batch endpoint.
+
+    Returns the decoded JSON body, or None if the endpoint is unavailable
+    or every attempt failed (callers then fall back to per-token requests).
+    """
+    url = f"{CLOB_API_BASE}{path}"
+    body = [{"token_id": token_id} for token_id in token_ids]
+
+    for attempt in range(max_retries):
+        if not _clob_breaker.allow():
+            logger.warning("CLOB circuit open, skipping batch %s", path)
+            return None
+
+        try:
+            response = await client.post(url, content=encode_json(body), headers=JSON_HEADERS, timeout=timeout)
+            _clob_breaker.record(response.status_code < 500)
+
+            if response.status_code in (400, 404, 405):
+                logger.warning("CLOB batch endpoint %s unavailable: %s", path, response.status_code)
+                return None
+
+            if response.status_code == 429:
+                delay = backoff_delay(attempt, response, base=RETRY_DELAY)
+                logger.warning("CLOB rate limited, waiting %.1fs (attempt %s/%s)", delay, attempt + 1, max_retries)
+                await asyncio.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            return decode_json(response)
+
+        except httpx.TimeoutException:
+            _clob_breaker.record(False)
+            logger.warning("CLOB timeout on batch %s, attempt %s/%s", path, attempt + 1, max_retries)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
+        except httpx.HTTPStatusError as e:
+            logger.error("CLOB HTTP error on batch %s: %s", path, e.response.status_code)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt, e.response, base=RETRY_DELAY))
+        except httpx.RequestError as e:
+            _clob_breaker.record(False)
+            logger.error("CLOB request error on batch %s: %s", path, e)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
+        except ValueError as e:
+            logger.error("CLOB parse error on batch %s: %s", path, e)
+            return None
+
+    logger.error("Failed batch request %s after %s attempts", path, max_retries)
+    return None
+
+
+async def fetch_midpoints_batch(
+    client: httpx.AsyncClient,
+    token_ids: list[str],
+) -> dict[str, float | None] | None:
+    """
+    Fetch midpoint prices for many tokens in a single request.
+
+    Returns a dict mapping token_id to midpoint (None if missing or unparsable),
+    or None if the batch endpoint could not be used.
+    """
+    data = await _post_batch(client, "/midpoints", token_ids)
+    if not isinstance(data, dict):
+        return None
+
+    midpoints = {}
+    for token_id in token_ids:
+        try:
+            mid = data.get(token_id)
+            midpoints[token_id] = float(mid) if mid is not None else None
+        except (ValueError, TypeError):
+            midpoints[token_id] = None
+    return midpoints
+
+
+async def fetch_books_batch(
+    client: httpx.AsyncClient,
+    token_ids: list[str],
+) -> dict[str, dict | None] | None:
+    """
+    Fetch orderbooks for many tokens in a single request.
+
+    Returns a dict mapping token_id to its orderbook (None if missing),
+    or None if the batch endpoint could not be used.
+    """
+    data = await _post_batch(client, "/books", token_ids)
+    if not isinstance(data, list):
+        return None
+
+    books_by_id = {
+        book.get("asset_id"): book for book in data if isinstance(book, dict)
+    }
+    return {token_id: books_by_id.get(token_id) for token_id in token_ids}
+
+
 def calculate_book_volume(book: dict) -> float:
     """
     Calculate total volume from an orderbook.
 
-    Sums the size of all bids and asks.
+    Sums the size of all bids and asks. Well-formed books are summed in a
+    single generator pass; if any size is unparsable, the book is re-summed
+    order by order, skipping the invalid entries.
     """
+    orders = [*(book.get("bids") or ()), *(book.get("asks") or ())]
+    try:
+        return sum((float(order["size"]) for order in orders if "size" in order), 0.0)
+    except (ValueError, TypeError):
+        pass
+
     total = 0.0
-    for side in ("bids", "asks"):
-        for order in book.get(side, []):
-            try:
-                total += float(order.get("size", 0))
-            except (ValueError, TypeError):
-                continue
+    for order in orders:
+        try:
+            total += float(order.get("size", 0))
+        except (ValueError, TypeError):
+            continue
     return total
 
 
 async def poll_clob_markets(
     client: httpx.AsyncClient,
     market_ids: list[str],
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
 ) -> dict[str, tuple[float | None, float | None]]:
     """
     Poll price and volume for multiple markets.
 
+    Uses the batch /midpoints and /books endpoints (one request each, run
+    concurrently). If a batch endpoint is unavailable, falls back to
+    per-token requests with at most max_concurrency in flight.
+
     Returns a dict mapping market_id to (price, volume) tuples.
     """
-    results = {}
-    timestamp = datetime.now()
+    if not market_ids:
+        return {}
 
-    for market_id in market_ids:
-        # Fetch midpoint price
-        price = await fetch_midpoint(client, market_id)
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-        # Fetch orderbook for volume
-        book = await fetch_book(client, market_id)
-        volume = calculate_book_volume(book) if book else None
+    async def fetch_limited(fetch, market_id: str):
+        async with semaphore:
+            return await fetch(client, market_id)
 
+    async def fetch_all(batch_fetch, fetch) -> list:
+        batch = await batch_fetch(client, market_ids)
+        if batch is not None:
+            return [batch[m] for m in market_ids]
+        return await asyncio.gather(*(fetch_limited(fetch, m) for m in market_ids))
+
+    prices, books = await asyncio.gather(
+        fetch_all(fetch_midpoints_batch, fetch_midpoint),
+        fetch_all(fetch_books_batch, fetch_book),
+    )
+
+    results = {}
+    for market_id, price, book in zip(market_ids, prices, books):
+        volume = calculate_book_volume(book) if book else None
         results[market_id] = (price, volume)
-        logger.debug(f"CLOB poll {market_id}: price={price}, volume={volume}")
+        logger.debug("CLOB poll %s: price=%s, volume=%s", market_id, price, volume)
 
     return results
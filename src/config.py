@@ -1,20 +1,42 @@
 """Configuration loading and validation for Polybotz."""
 
+import codecs
 import logging
 import os
-import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
-import yaml
-
 logger = logging.getLogger("polybotz.config")
 
-# Valid detector names for configuration
-VALID_DETECTORS: set[str] = {"spike", "lvr", "zscore", "mad", "closed"}
+# Valid detector names for configuration (immutable, shared as the "all" default)
+VALID_DETECTORS: frozenset[str] = frozenset({"spike", "lvr", "zscore", "mad", "closed"})
+
+# Telegram parse modes the alert formatters can emit
+VALID_PARSE_MODES: frozenset[str] = frozenset({"HTML", "Markdown"})
+
+# Environment variable prefixes that affect load_config_from_env
+_ENV_PREFIXES = ("POLYBOTZ_", "TELEGRAM_")
+
+# Numeric environment settings: (variable, Configuration field, default, type)
+_NUMERIC_ENV: tuple[tuple[str, str, int | float, type], ...] = (
+    ("POLYBOTZ_POLL_INTERVAL", "poll_interval", 60, int),
+    ("POLYBOTZ_SPIKE_THRESHOLD", "spike_threshold", 5.0, float),
+    ("POLYBOTZ_LVR_THRESHOLD", "lvr_threshold", 8.0, float),
+    ("POLYBOTZ_ZSCORE_THRESHOLD", "zscore_threshold", 3.5, float),
+    ("POLYBOTZ_MAD_MULTIPLIER", "mad_multiplier", 3.0, float),
+    ("POLYBOTZ_COOLDOWN_MINUTES", "cooldown_minutes", 30, int),
+    ("POLYBOTZ_ESCALATION_THRESHOLD", "escalation_threshold", 1.0, float),
+    ("POLYBOTZ_TELEGRAM_CONCURRENCY", "telegram_concurrency", 8, int),
+    ("POLYBOTZ_HTTP_MAX_CONNECTIONS", "http_max_connections", 64, int),
+    ("POLYBOTZ_HTTP_MAX_KEEPALIVE", "http_max_keepalive", 32, int),
+)
 
+# Parsed configurations keyed by source file stat (or env snapshot)
+_CONFIG_CACHE: dict[tuple, "Configuration"] = {}
+_CONFIG_CACHE_SIZE = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class Configuration:
     """User-provided settings for the service."""
 
@@ -25,17 +47,22 @@ class Configuration:
     telegram_chat_id: str
     lvr_threshold: float = 8.0
     # CLOB/Z-score configuration
-    clob_token_ids: list[str] = None  # type: ignore
+    clob_token_ids: list[str] = field(default_factory=list)
     zscore_threshold: float = 3.5
     mad_multiplier: float = 3.0
-    detectors: set[str] = field(default_factory=lambda: VALID_DETECTORS.copy())
+    detectors: frozenset[str] = VALID_DETECTORS
     # Alert cooldown configuration
     cooldown_minutes: int = 30
     escalation_threshold: float = 1.0
-
-    def __post_init__(self):
-        if self.clob_token_ids is None:
-            self.clob_token_ids = []
+    # Maximum concurrent Telegram sends per batch
+    telegram_concurrency: int = 8
+    # Combine each batch of alerts into as few Telegram messages as possible
+    telegram_batch_alerts: bool = False
+    # Telegram parse mode for alert messages ("Markdown" keeps the legacy format)
+    telegram_parse_mode: str = "HTML"
+    # HTTP connection pool sizing (shared by Gamma, CLOB and Telegram clients)
+    http_max_connections: int = 64
+    http_max_keepalive: int = 32
 
 
 class ConfigurationError(Exception):
@@ -44,28 +71,74 @@ class ConfigurationError(Exception):
     pass
 
 
-def _substitute_env_vars(value: str) -> str:
-    """Substitute ${VAR} patterns with environment variable values."""
-    pattern = r"\$\{([^}]+)\}"
+def _copy_config(config: Configuration) -> Configuration:
+    """Return a copy of a cached configuration that callers may modify freely."""
+    return replace(config, slugs=list(config.slugs), clob_token_ids=list(config.clob_token_ids))
 
-    def replacer(match: re.Match) -> str:
-        var_name = match.group(1)
-        env_value = os.environ.get(var_name)
-        if env_value is None:
-            return match.group(0)  # Keep original if not found
-        return env_value
 
-    return re.sub(pattern, replacer, value)
+def _cache_config(key: tuple, config: Configuration) -> Configuration:
+    """Remember a validated configuration and return a copy for the caller.
 
+    The oldest entry is evicted when the cache is full.
+    """
+    if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+        del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+    _CONFIG_CACHE[key] = config
+    return _copy_config(config)
+
+
+def clear_config_cache() -> None:
+    """Forget memoized configurations so the next load re-reads its source."""
+    _CONFIG_CACHE.clear()
+
+
+def _substitute_env_vars(value: str) -> str:
+    """Substitute ${VAR} patterns with environment variable values.
 
-def parse_detectors(value: str | list[str] | None) -> set[str]:
+    Single pass over the string using str.find. Unknown variables and
+    empty ${} references are kept as-is.
+    """
+    start = value.find("${")
+    if start < 0:
+        return value
+
+    env = os.environ
+    parts = []
+    pos = 0
+    while start >= 0:
+        end = value.find("}", start + 2)
+        if end < 0:
+            break
+        var_name = value[start + 2:end]
+        env_value = env.get(var_name) if var_name else None
+        parts.append(value[pos:start])
+        parts.append(value[start:end + 1] if env_value is None else env_value)
+        pos = end + 1
+        start = value.find("${", pos)
+
+    parts.append(value[pos:])
+    return "".join(parts)
+
+
+def _split_csv(value: str) -> list[str]:
+    """Split a comma-separated string into stripped, non-empty items."""
+    items = []
+    append = items.append
+    for item in value.split(","):
+        item = item.strip()
+        if item:
+            append(item)
+    return items
+
+
+def parse_detectors(value: str | list[str] | None) -> frozenset[str]:
     """Parse detector configuration to a set of enabled detector names.
 
     Args:
         value: "all", "none", comma-separated string, or list of detector names
 
     Returns:
-        Set of valid detector names to enable
+        Frozen set of valid detector names to enable (VALID_DETECTORS itself when all are enabled)
 
     Special values:
         - None: All detectors enabled (default, backward compatible)
@@ -74,7 +147,7 @@ def parse_detectors(value: str | list[str] | None) -> set[str]:
     """
     # Default: all detectors enabled (backward compatible)
     if value is None:
-        return VALID_DETECTORS.copy()
+        return VALID_DETECTORS
 
     # Handle string values
     if isinstance(value, str):
@@ -82,44 +155,69 @@ def parse_detectors(value: str | list[str] | None) -> set[str]:
 
         # Special value: enable all
         if value_lower == "all":
-            return VALID_DETECTORS.copy()
+            return VALID_DETECTORS
 
         # Special value: disable all
         if value_lower == "none":
-            return set()
+            return frozenset()
 
         # Comma-separated list
-        names = {s.strip().lower() for s in value.split(",") if s.strip()}
+        names = {s.lower() for s in _split_csv(value)}
     else:
         # List of detector names
         names = {str(s).strip().lower() for s in value if s}
 
     # Validate and filter
-    valid = names & VALID_DETECTORS
-    invalid = names - VALID_DETECTORS
+    valid = VALID_DETECTORS & names
 
-    if invalid:
+    if len(valid) != len(names):
+        invalid = names - VALID_DETECTORS
         logger.warning(f"Invalid detector names ignored: {sorted(invalid)}")
 
+    # Every detector listed explicitly: reuse the shared default
+    if len(valid) == len(VALID_DETECTORS):
+        return VALID_DETECTORS
     return valid
 
 
+def _decode_config(content: bytes) -> str:
+    """Decode a config file as UTF-16 when it starts with a UTF-16 BOM, else as UTF-8."""
+    try:
+        if content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return content.decode("utf-16")
+        return content.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise ConfigurationError(f"Configuration file is not valid UTF-8 or UTF-16: {e}") from e
+
+
+def _load_yaml(content: str):
+    """Parse a YAML document safely.
+
+    PyYAML is imported here rather than at module level so env-only
+    deployments never pay for it. Uses libyaml's CSafeLoader when PyYAML
+    was built with it, otherwise the pure-Python SafeLoader.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
 def _process_yaml_values(data: dict) -> dict:
-    """Recursively process YAML values to substitute environment variables."""
-    result = {}
+    """Recursively substitute environment variables in YAML values, in place.
+
+    Returns data for convenience; the parsed tree is owned by the caller.
+    """
     for key, value in data.items():
         if isinstance(value, str):
-            result[key] = _substitute_env_vars(value)
+            data[key] = _substitute_env_vars(value)
         elif isinstance(value, dict):
-            result[key] = _process_yaml_values(value)
+            _process_yaml_values(value)
         elif isinstance(value, list):
-            result[key] = [
-                _substitute_env_vars(item) if isinstance(item, str) else item
-                for item in value
-            ]
-        else:
-            result[key] = value
-    return result
+            for i, item in enumerate(value):
+                if isinstance(item, str):
+                    value[i] = _substitute_env_vars(item)
+    return data
 
 
 def load_config_from_env() -> Configuration:
@@ -134,72 +232,59 @@ def load_config_from_env() -> Configuration:
         POLYBOTZ_ZSCORE_THRESHOLD: Z-score threshold for alerts (default: 3.5)
         POLYBOTZ_MAD_MULTIPLIER: MAD multiplier threshold (default: 3.0)
         POLYBOTZ_DETECTORS: Detectors to enable - "all", "none", or comma-separated list (default: all)
+        POLYBOTZ_TELEGRAM_CONCURRENCY: Maximum concurrent Telegram sends (default: 8)
+        POLYBOTZ_TELEGRAM_BATCH_ALERTS: Combine alerts into fewer messages - "true" or "false" (default: false)
+        POLYBOTZ_TELEGRAM_PARSE_MODE: Telegram message formatting - "HTML" or "Markdown" (default: HTML)
+        POLYBOTZ_HTTP_MAX_CONNECTIONS: Maximum HTTP connections per client (default: 64)
+        POLYBOTZ_HTTP_MAX_KEEPALIVE: Maximum idle keep-alive HTTP connections (default: 32)
         TELEGRAM_BOT_TOKEN: Telegram bot API token (required)
         TELEGRAM_CHAT_ID: Telegram chat ID (required)
-    """
-    slugs_str = os.environ.get("POLYBOTZ_SLUGS", "")
-    slugs = [s.strip() for s in slugs_str.split(",") if s.strip()]
-
-    clob_token_ids_str = os.environ.get("POLYBOTZ_CLOB_TOKEN_IDS", "")
-    clob_token_ids = [s.strip() for s in clob_token_ids_str.split(",") if s.strip()]
 
-    try:
-        poll_interval = int(os.environ.get("POLYBOTZ_POLL_INTERVAL", "60"))
-    except ValueError:
-        poll_interval = 60
-
-    try:
-        spike_threshold = float(os.environ.get("POLYBOTZ_SPIKE_THRESHOLD", "5.0"))
-    except ValueError:
-        spike_threshold = 5.0
-
-    try:
-        lvr_threshold = float(os.environ.get("POLYBOTZ_LVR_THRESHOLD", "8.0"))
-    except ValueError:
-        lvr_threshold = 8.0
-
-    try:
-        zscore_threshold = float(os.environ.get("POLYBOTZ_ZSCORE_THRESHOLD", "3.5"))
-    except ValueError:
-        zscore_threshold = 3.5
-
-    try:
-        mad_multiplier = float(os.environ.get("POLYBOTZ_MAD_MULTIPLIER", "3.0"))
-    except ValueError:
-        mad_multiplier = 3.0
+    Results are memoized per snapshot of the POLYBOTZ_*/TELEGRAM_* variables.
+    Each call returns its own copy, so changes made by one caller never
+    leak into later loads.
+    """
+    # One pass over os.environ; every lookup below reads this snapshot
+    env = {name: value for name, value in os.environ.items() if name.startswith(_ENV_PREFIXES)}
+    key = ("env", frozenset(env.items()))
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return _copy_config(cached)
+
+    slugs = _split_csv(env.get("POLYBOTZ_SLUGS", ""))
+    clob_token_ids = _split_csv(env.get("POLYBOTZ_CLOB_TOKEN_IDS", ""))
+
+    # Numeric settings fall back to their defaults when unset or malformed
+    numeric = {}
+    for name, field_name, default, convert in _NUMERIC_ENV:
+        raw = env.get(name)
+        try:
+            numeric[field_name] = convert(raw) if raw else default
+        except ValueError:
+            numeric[field_name] = default
 
     # Parse detectors from env var (None means use default)
-    detectors_str = os.environ.get("POLYBOTZ_DETECTORS")
+    detectors_str = env.get("POLYBOTZ_DETECTORS")
     detectors = parse_detectors(detectors_str)
 
-    # Parse cooldown configuration
-    try:
-        cooldown_minutes = int(os.environ.get("POLYBOTZ_COOLDOWN_MINUTES", "30"))
-    except ValueError:
-        cooldown_minutes = 30
+    batch_alerts_str = env.get("POLYBOTZ_TELEGRAM_BATCH_ALERTS", "false")
+    telegram_batch_alerts = batch_alerts_str.strip().lower() in ("1", "true", "yes")
 
-    try:
-        escalation_threshold = float(os.environ.get("POLYBOTZ_ESCALATION_THRESHOLD", "1.0"))
-    except ValueError:
-        escalation_threshold = 1.0
+    telegram_parse_mode = env.get("POLYBOTZ_TELEGRAM_PARSE_MODE", "HTML").strip()
 
     config = Configuration(
         slugs=slugs,
-        poll_interval=poll_interval,
-        spike_threshold=spike_threshold,
-        telegram_bot_token=os.environ.get("TELEGRAM_BOT_TOKEN", ""),
-        telegram_chat_id=os.environ.get("TELEGRAM_CHAT_ID", ""),
-        lvr_threshold=lvr_threshold,
+        telegram_bot_token=env.get("TELEGRAM_BOT_TOKEN", ""),
+        telegram_chat_id=env.get("TELEGRAM_CHAT_ID", ""),
         clob_token_ids=clob_token_ids,
-        zscore_threshold=zscore_threshold,
-        mad_multiplier=mad_multiplier,
         detectors=detectors,
-        cooldown_minutes=cooldown_minutes,
-        escalation_threshold=escalation_threshold,
+        telegram_batch_alerts=telegram_batch_alerts,
+        telegram_parse_mode=telegram_parse_mode,
+        **numeric,
     )
 
     validate_config(config)
-    return config
+    return _cache_config(key, config)
 
 
 def load_config(config_path: str | Path | None = None) -> Configuration:
@@ -209,6 +294,10 @@ def load_config(config_path: str | Path | None = None) -> Configuration:
     Otherwise, fall back to environment variables.
 
     Note: POLYBOTZ_DETECTORS env var takes precedence over config file detectors setting.
+
+    Results are memoized on the file's path, mtime and size (plus the
+    environment, which ${VAR} substitution reads), so repeated loads of an
+    unchanged file skip parsing. Each call returns its own copy.
     """
     # If no path provided, check for default config.yaml
     if config_path is None:
@@ -216,26 +305,36 @@ def load_config(config_path: str | Path | None = None) -> Configuration:
     else:
         config_path = Path(config_path)
 
+    try:
+        stat = config_path.stat()
+    except OSError:
+        stat = None
+
     # If config file exists, load from it
-    if config_path.exists():
-        with open(config_path) as f:
-            raw_data = yaml.safe_load(f)
+    if stat is not None:
+        key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size, frozenset(os.environ.items()))
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            return _copy_config(cached)
+
+        content = _decode_config(config_path.read_bytes())
+        raw_data = _load_yaml(content)
 
         if raw_data is None:
             raise ConfigurationError("Configuration file is empty")
 
-        data = _process_yaml_values(raw_data)
+        # Only walk the tree when the file actually references ${VAR}
+        data = _process_yaml_values(raw_data) if "${" in content else raw_data
 
         # Extract telegram config
         telegram = data.get("telegram", {})
 
         # Parse detectors configuration
         # POLYBOTZ_DETECTORS env var takes precedence over config file
-        detectors_env = os.environ.get("POLYBOTZ_DETECTORS")
-        if detectors_env is not None:
-            detectors = parse_detectors(detectors_env)
-        else:
-            detectors = parse_detectors(data.get("detectors"))
+        detectors_value = os.environ.get("POLYBOTZ_DETECTORS")
+        if detectors_value is None:
+            detectors_value = data.get("detectors")
+        detectors = parse_detectors(detectors_value)
 
         config = Configuration(
             slugs=data.get("slugs", []),
@@ -244,64 +343,100 @@ def load_config(config_path: str | Path | None = None) -> Configuration:
             telegram_bot_token=telegram.get("bot_token", ""),
             telegram_chat_id=telegram.get("chat_id", ""),
             lvr_threshold=data.get("lvr_threshold", 8.0),
-            clob_token_ids=data.get("clob_token_ids", []),
+            clob_token_ids=data.get("clob_token_ids") or [],
             zscore_threshold=data.get("zscore_threshold", 3.5),
             mad_multiplier=data.get("mad_multiplier", 3.0),
             detectors=detectors,
             cooldown_minutes=data.get("cooldown_minutes", 30),
             escalation_threshold=data.get("escalation_threshold", 1.0),
+            telegram_concurrency=telegram.get("concurrency", 8),
+            telegram_batch_alerts=telegram.get("batch_alerts", False),
+            telegram_parse_mode=telegram.get("parse_mode", "HTML"),
+            http_max_connections=data.get("http_max_connections", 64),
+            http_max_keepalive=data.get("http_max_keepalive", 32),
         )
 
         validate_config(config)
-        return config
+        return _cache_config(key, config)
 
     # No config file - try environment variables
     return load_config_from_env()
 
 
+def _add_error(errors: list[str] | None, message: str) -> list[str]:
+    """Append a validation error, creating the list on first use."""
+    if errors is None:
+        errors = []
+    errors.append(message)
+    return errors
+
+
 def validate_config(config: Configuration) -> None:
-    """Validate configuration per data-model.md rules."""
-    errors = []
+    """Validate configuration per data-model.md rules.
+
+    All rule violations are reported together; the error list is only
+    allocated once a rule fails, so the valid path allocates nothing.
+    """
+    errors: list[str] | None = None
 
     # slugs: Non-empty list, each slug non-empty string
     if not config.slugs:
-        errors.append("slugs: must be a non-empty list")
-    else:
+        errors = _add_error(errors, "slugs: must be a non-empty list")
+    elif not all(isinstance(slug, str) and slug for slug in config.slugs):
+        # Only walk the list with indices when there is something to report
         for i, slug in enumerate(config.slugs):
             if not slug or not isinstance(slug, str):
-                errors.append(f"slugs[{i}]: must be a non-empty string")
+                errors = _add_error(errors, f"slugs[{i}]: must be a non-empty string")
 
     # poll_interval: Positive integer, minimum 10 seconds
     if not isinstance(config.poll_interval, int) or config.poll_interval < 10:
-        errors.append("poll_interval: must be a positive integer >= 10")
+        errors = _add_error(errors, "poll_interval: must be a positive integer >= 10")
 
     # spike_threshold: Positive float, 0.1 to 100.0
     if not isinstance(config.spike_threshold, (int, float)):
-        errors.append("spike_threshold: must be a number")
+        errors = _add_error(errors, "spike_threshold: must be a number")
     elif config.spike_threshold < 0.1 or config.spike_threshold > 100.0:
-        errors.append("spike_threshold: must be between 0.1 and 100.0")
+        errors = _add_error(errors, "spike_threshold: must be between 0.1 and 100.0")
 
     # lvr_threshold: Positive float, 0.1 to 100.0
     if not isinstance(config.lvr_threshold, (int, float)):
-        errors.append("lvr_threshold: must be a number")
+        errors = _add_error(errors, "lvr_threshold: must be a number")
     elif config.lvr_threshold < 0.1 or config.lvr_threshold > 100.0:
-        errors.append("lvr_threshold: must be between 0.1 and 100.0")
+        errors = _add_error(errors, "lvr_threshold: must be between 0.1 and 100.0")
 
     # telegram_bot_token: Non-empty string
     if not config.telegram_bot_token:
-        errors.append("telegram.bot_token: must be a non-empty string")
+        errors = _add_error(errors, "telegram.bot_token: must be a non-empty string")
 
     # telegram_chat_id: Non-empty string
     if not config.telegram_chat_id:
-        errors.append("telegram.chat_id: must be a non-empty string")
+        errors = _add_error(errors, "telegram.chat_id: must be a non-empty string")
 
     # cooldown_minutes: Non-negative integer (0 = disabled)
     if not isinstance(config.cooldown_minutes, int) or config.cooldown_minutes < 0:
-        errors.append("cooldown_minutes: must be a non-negative integer (0 to disable)")
+        errors = _add_error(errors, "cooldown_minutes: must be a non-negative integer (0 to disable)")
 
     # escalation_threshold: Positive float
     if not isinstance(config.escalation_threshold, (int, float)) or config.escalation_threshold <= 0:
-        errors.append("escalation_threshold: must be a positive number > 0")
+        errors = _add_error(errors, "escalation_threshold: must be a positive number > 0")
+
+    # telegram_concurrency: Positive integer
+    if not isinstance(config.telegram_concurrency, int) or config.telegram_concurrency < 1:
+        errors = _add_error(errors, "telegram.concurrency: must be a positive integer >= 1")
+
+    # telegram_batch_alerts: Boolean
+    if not isinstance(config.telegram_batch_alerts, bool):
+        errors = _add_error(errors, "telegram.batch_alerts: must be true or false")
+
+    # telegram_parse_mode: One of the supported parse modes
+    if config.telegram_parse_mode not in VALID_PARSE_MODES:
+        errors = _add_error(errors, f"telegram.parse_mode: must be one of {', '.join(sorted(VALID_PARSE_MODES))}")
+
+    # http_max_connections / http_max_keepalive: Positive integers
+    if not isinstance(config.http_max_connections, int) or config.http_max_connections < 1:
+        errors = _add_error(errors, "http_max_connections: must be a positive integer >= 1")
+    if not isinstance(config.http_max_keepalive, int) or config.http_max_keepalive < 0:
+        errors = _add_error(errors, "http_max_keepalive: must be a non-negative integer")
 
     if errors:
         raise ConfigurationError("Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors))
@@ -1,12 +1,19 @@
 """Spike detection algorithm for Polybotz."""
 
+import functools
+import heapq
 import json
 import logging
+import time
+from bisect import bisect_right
+from collections.abc import Callable
 from datetime import datetime
+from operator import attrgetter
 
 from .models import (
     ClosedEventAlert,
     CooldownEntry,
+    CooldownKey,
     LiquidityWarning,
     MADAlert,
     MarketStatistics,
@@ -15,10 +22,34 @@ from .models import (
     SpikeAlert,
     ZScoreAlert,
 )
-from .statistics import calculate_zscore_mad
+from .statistics import RollingWindow, zscore_from_mad
 
 logger = logging.getLogger("polybotz.detector")
 
+# LVR health tiers: _LVR_LABELS[i] covers LVRs below _LVR_CUTS[i]
+_LVR_CUTS = (2.0, 10.0)
+_LVR_LABELS = ("Healthy", "Elevated", "High Risk")
+
+# MarketStatistics attribute holding the rolling window for (metric, window)
+_WINDOW_ATTR = {
+    ("volume", "1h"): "volume_1h",
+    ("volume", "4h"): "volume_4h",
+    ("price", "1h"): "price_1h",
+    ("price", "4h"): "price_4h",
+}
+
+# Fixed windows checked by the detect_all_* passes, and per-metric getters
+# returning a market's (1h, 4h) rolling windows in that order
+_WINDOW_NAMES = ("1h", "4h")
+_METRIC_WINDOWS = {
+    "volume": attrgetter("volume_1h", "volume_4h"),
+    "price": attrgetter("price_1h", "price_4h"),
+}
+
+# Alert value compared for cooldown escalation
+_ZSCORE = attrgetter("zscore")
+_MULTIPLIER = attrgetter("multiplier")
+
 
 class CooldownManager:
     """Manages alert cooldown state for (market_id, metric, window) tuples."""
@@ -31,21 +62,26 @@ class CooldownManager:
             cooldown_minutes: Minutes to suppress re-alerts (0 = disabled)
             escalation_threshold: Z-score increase required to re-alert during cooldown
         """
-        self.entries: dict[str, CooldownEntry] = {}
+        self.entries: dict[CooldownKey, CooldownEntry] = {}
         self.cooldown_minutes = cooldown_minutes
+        self._cooldown_secs = cooldown_minutes * 60
+        # Min-heap of (stale_at, key); may hold outdated items for keys that
+        # were re-recorded or cleared, which cleanup_stale skips
+        self._expiry_heap: list[tuple[float, CooldownKey]] = []
         self.escalation_threshold = escalation_threshold
 
-    def _make_key(self, market_id: str, metric: str, window: str) -> str:
+    def _make_key(self, market_id: str, metric: str, window: str) -> CooldownKey:
         """Create a unique key for the (market_id, metric, window) tuple."""
-        return f"{market_id}:{metric}:{window}"
+        return (market_id, metric, window)
 
-    def should_alert(self, key: str, current_zscore: float) -> bool:
+    def should_alert(self, key: CooldownKey, current_zscore: float, now: float | None = None) -> bool:
         """
         Determine if an alert should fire based on cooldown state.
 
         Args:
-            key: Cooldown key (market_id:metric:window)
+            key: Cooldown key (market_id, metric, window)
             current_zscore: Current z-score value
+            now: time.monotonic() reading for this detection pass (default: now)
 
         Returns:
             True if alert should fire, False if suppressed
@@ -59,11 +95,10 @@ class CooldownManager:
             return True
 
         entry = self.entries[key]
-        now = datetime.now()
-        elapsed = (now - entry.last_alert_time).total_seconds() / 60
-
+        if now is None:
+            now = time.monotonic()
         # Cooldown expired - alert
-        if elapsed >= self.cooldown_minutes:
+        if now - entry.last_alert_time >= self._cooldown_secs:
             return True
 
         # Check for escalation (significant increase in z-score)
@@ -74,21 +109,22 @@ class CooldownManager:
         # Still in cooldown, not escalating - suppress
         return False
 
-    def record_alert(self, key: str, zscore: float) -> None:
+    def record_alert(self, key: CooldownKey, zscore: float, now: float | None = None) -> None:
         """
         Record that an alert was sent for this key.
 
         Args:
-            key: Cooldown key (market_id:metric:window)
+            key: Cooldown key (market_id, metric, window)
             zscore: Z-score value at time of alert
+            now: time.monotonic() reading for this detection pass (default: now)
         """
-        self.entries[key] = CooldownEntry(
-            key=key,
-            last_alert_time=datetime.now(),
-            last_zscore=zscore,
-        )
+        if now is None:
+            now = time.monotonic()
+        self.entries[key] = CooldownEntry(key=key, last_alert_time=now, last_zscore=zscore)
+        if self._cooldown_secs:
+            heapq.heappush(self._expiry_heap, (now + self._cooldown_secs * 2, key))
 
-    def clear_entry(self, key: str) -> None:
+    def clear_entry(self, key: CooldownKey) -> None:
         """
         Clear cooldown entry when anomaly resolves.
 
@@ -98,25 +134,32 @@ class CooldownManager:
         if key in self.entries:
             del self.entries[key]
 
-    def cleanup_stale(self) -> None:
-        """Remove cooldown entries older than 2x cooldown_minutes."""
+    def cleanup_stale(self, now: float | None = None) -> None:
+        """
+        Remove cooldown entries older than 2x cooldown_minutes.
+
+        Only the expired prefix of the expiry heap is visited, so a pass
+        where nothing has gone stale costs O(1).
+        """
         if self.cooldown_minutes == 0:
             return
 
-        now = datetime.now()
-        stale_threshold = self.cooldown_minutes * 2
-        stale_keys = []
-
-        for key, entry in self.entries.items():
-            elapsed = (now - entry.last_alert_time).total_seconds() / 60
-            if elapsed > stale_threshold:
-                stale_keys.append(key)
+        if now is None:
+            now = time.monotonic()
+        stale_threshold = self._cooldown_secs * 2
+        heap = self._expiry_heap
+        removed = 0
 
-        for key in stale_keys:
-            del self.entries[key]
+        while heap and heap[0][0] < now:
+            _, key = heapq.heappop(heap)
+            entry = self.entries.get(key)
+            # Skip heap items outdated by a later record_alert or clear_entry
+            if entry is not None and now - entry.last_alert_time > stale_threshold:
+                del self.entries[key]
+                removed += 1
 
-        if stale_keys:
-            logger.debug(f"Cleaned up {len(stale_keys)} stale cooldown entries")
+        if removed:
+            logger.debug("Cleaned up %s stale cooldown entries", removed)
 
 
 def calculate_lvr(volume_24h: float | None, liquidity: float | None) -> float | None:
@@ -128,7 +171,7 @@ def calculate_lvr(volume_24h: float | None, liquidity: float | None) -> float |
     Returns None if liquidity is zero, negative, or missing to avoid division errors.
     """
     if liquidity is None or liquidity <= 0:
-        logger.warning(f"Zero/missing liquidity (liquidity={liquidity}), skipping LVR calculation")
+        logger.warning("Zero/missing liquidity (liquidity=%s), skipping LVR calculation", liquidity)
         return None
 
     if volume_24h is None:
@@ -138,31 +181,32 @@ def calculate_lvr(volume_24h: float | None, liquidity: float | None) -> float |
     return volume_24h / liquidity
 
 
-def detect_spike(market: MonitoredMarket, threshold: float) -> SpikeAlert | None:
+def detect_spike(
+    market: MonitoredMarket,
+    threshold: float,
+    now: datetime | None = None,
+) -> SpikeAlert | None:
     """
     Detect if a market has a price spike exceeding threshold.
 
+    now is the detection time stamped on the alert (default: datetime.now()).
+
     Returns SpikeAlert if spike detected, None otherwise.
     """
-    # Edge case: market is closed - skip detection
-    if market.is_closed:
-        return None
-
-    # Edge case: first poll - no previous price, no spike detection
-    if market.previous_price is None:
+    # Quiet market: update_prices saw no price movement this poll
+    if not market.price_changed:
         return None
 
-    # Edge case: current price not available
-    if market.current_price is None:
-        return None
-
-    # Edge case: previous_price is 0 - skip comparison to avoid division by zero
-    if market.previous_price == 0:
+    # Edge cases: market closed, first poll (no previous price), current price
+    # unavailable, or previous_price of 0 (would divide by zero)
+    previous = market.previous_price
+    current = market.current_price
+    if market.is_closed or not previous or current is None:
         return None
 
     # Calculate percentage change
-    change = market.current_price - market.previous_price
-    change_percent = abs(change / market.previous_price) * 100
+    change = current - previous
+    change_percent = abs(change / previous) * 100
 
     # Check if threshold exceeded
     if change_percent < threshold:
@@ -172,20 +216,19 @@ def detect_spike(market: MonitoredMarket, threshold: float) -> SpikeAlert | None
     direction = "up" if change > 0 else "down"
 
     logger.info(
-        f"Spike detected: {market.question} [{market.outcome}] "
-        f"{market.previous_price:.4f} → {market.current_price:.4f} "
-        f"({direction} {change_percent:.1f}%)"
+        "Spike detected: %s [%s] %.4f → %.4f (%s %.1f%%)",
+        market.question, market.outcome, previous, current, direction, change_percent,
     )
 
     return SpikeAlert(
         event_name="",  # Will be filled by detect_all_spikes
         market_question=market.question,
         outcome=market.outcome,
-        price_before=market.previous_price,
-        price_after=market.current_price,
+        price_before=previous,
+        price_after=current,
         change_percent=change_percent,
         direction=direction,
-        detected_at=datetime.now(),
+        detected_at=now or datetime.now(),
     )
 
 
@@ -198,12 +241,7 @@ def classify_lvr_health(lvr: float) -> str:
         "Elevated" for 2.0 <= LVR < 10.0
         "High Risk" for LVR >= 10.0
     """
-    if lvr < 2.0:
-        return "Healthy"
-    elif lvr < 10.0:
-        return "Elevated"
-    else:
-        return "High Risk"
+    return _LVR_LABELS[bisect_right(_LVR_CUTS, lvr)]
 
 
 def detect_liquidity_warning(
@@ -211,6 +249,7 @@ def detect_liquidity_warning(
     spike: SpikeAlert,
     lvr_threshold: float,
     event_name: str,
+    now: datetime | None = None,
 ) -> LiquidityWarning | None:
     """
     Detect if a spike should trigger a liquidity warning.
@@ -231,8 +270,8 @@ def detect_liquidity_warning(
 
     # Both conditions met - create liquidity warning
     logger.info(
-        f"Liquidity warning: {market.question} [{market.outcome}] "
-        f"LVR={market.lvr:.2f} (threshold={lvr_threshold})"
+        "Liquidity warning: %s [%s] LVR=%.2f (threshold=%s)",
+        market.question, market.outcome, market.lvr, lvr_threshold,
     )
 
     return LiquidityWarning(
@@ -247,7 +286,7 @@ def detect_liquidity_warning(
         health_status=classify_lvr_health(market.lvr),
         volume_24h=market.volume_24h,
         liquidity=market.liquidity,
-        detected_at=datetime.now(),
+        detected_at=now or datetime.now(),
     )
 
 
@@ -256,19 +295,54 @@ def detect_all_spikes(
     threshold: float,
 ) -> list[SpikeAlert]:
     """Detect spikes across all monitored events and markets."""
+    return detect_spikes_and_warnings(events, threshold)[0]
+
+
+def detect_spikes_and_warnings(
+    events: list[MonitoredEvent],
+    spike_threshold: float,
+    lvr_threshold: float | None = None,
+) -> tuple[list[SpikeAlert], list[LiquidityWarning]]:
+    """
+    Detect spikes and their liquidity warnings in one pass over all markets.
+
+    Equivalent to detect_all_spikes followed by detect_all_liquidity_warnings,
+    but each spike's LVR is checked while its market is in hand.
+
+    Args:
+        events: All monitored events
+        spike_threshold: Price change percentage that counts as a spike
+        lvr_threshold: LVR threshold for liquidity warnings (None = skip them)
+
+    Returns:
+        Tuple of (list of SpikeAlert, list of LiquidityWarning)
+    """
     spikes = []
+    warnings = []
+    append = spikes.append
+    now = datetime.now()
 
     for event in events:
+        event_name = event.name
         for market in event.markets:
-            spike = detect_spike(market, threshold)
-            if spike:
-                spike.event_name = event.name
-                spikes.append(spike)
+            spike = detect_spike(market, spike_threshold, now)
+            if not spike:
+                continue
+            spike.event_name = event_name
+            spike.market = market
+            append(spike)
+
+            if lvr_threshold is not None:
+                warning = detect_liquidity_warning(market, spike, lvr_threshold, event_name, now)
+                if warning:
+                    warnings.append(warning)
 
     if spikes:
-        logger.info(f"Total spikes detected: {len(spikes)}")
+        logger.info("Total spikes detected: %s", len(spikes))
+    if warnings:
+        logger.info("Total liquidity warnings: %s", len(warnings))
 
-    return spikes
+    return spikes, warnings
 
 
 def detect_all_liquidity_warnings(
@@ -288,25 +362,31 @@ def detect_all_liquidity_warnings(
         List of LiquidityWarning objects for spikes that also exceed LVR threshold
     """
     warnings = []
+    now = datetime.now()
 
-    # Build lookup for markets by (event_name, question, outcome)
-    market_lookup = {}
-    for event in events:
-        for market in event.markets:
-            key = (event.name, market.question, market.outcome)
-            market_lookup[key] = (market, event.name)
+    events_by_name = None
 
     # Check each spike for LVR condition
     for spike in spikes:
-        key = (spike.event_name, spike.market_question, spike.outcome)
-        if key in market_lookup:
-            market, event_name = market_lookup[key]
-            warning = detect_liquidity_warning(market, spike, lvr_threshold, event_name)
-            if warning:
-                warnings.append(warning)
+        market = spike.market
+        if market is None:
+            # Spike not from detect_all_spikes: look the market up through
+            # its event's (question, outcome) index
+            if events_by_name is None:
+                events_by_name = {event.name: event for event in events}
+            event = events_by_name.get(spike.event_name)
+            if event is None:
+                continue
+            market = event.find_market(spike.market_question, spike.outcome)
+            if market is None:
+                continue
+
+        warning = detect_liquidity_warning(market, spike, lvr_threshold, spike.event_name, now)
+        if warning:
+            warnings.append(warning)
 
     if warnings:
-        logger.info(f"Total liquidity warnings: {len(warnings)}")
+        logger.info("Total liquidity warnings: %s", len(warnings))
 
     return warnings
 
@@ -316,6 +396,7 @@ def detect_zscore_alert(
     threshold: float,
     metric: str = "volume",
     window: str = "1h",
+    now: datetime | None = None,
 ) -> ZScoreAlert | None:
     """
     Detect if current value exceeds Z-score threshold for a given metric/window.
@@ -325,36 +406,42 @@ def detect_zscore_alert(
         threshold: Z-score threshold (e.g., 3.5)
         metric: "volume" or "price"
         window: "1h" or "4h"
+        now: Detection time stamped on the alert (default: datetime.now())
 
     Returns:
         ZScoreAlert if threshold exceeded, None otherwise.
     """
     # Get the appropriate rolling window
-    window_map = {
-        ("volume", "1h"): stats.volume_1h,
-        ("volume", "4h"): stats.volume_4h,
-        ("price", "1h"): stats.price_1h,
-        ("price", "4h"): stats.price_4h,
-    }
-
-    rolling_window = window_map.get((metric, window))
-    if rolling_window is None:
-        logger.warning(f"Unknown metric/window combo: {metric}/{window}")
+    attr = _WINDOW_ATTR.get((metric, window))
+    if attr is None:
+        logger.warning("Unknown metric/window combo: %s/%s", metric, window)
         return None
+    return _zscore_alert(stats, getattr(stats, attr), threshold, metric, window, now)
+
 
+def _zscore_alert(
+    stats: MarketStatistics,
+    rolling_window: RollingWindow,
+    threshold: float,
+    metric: str,
+    window: str,
+    now: datetime | None,
+) -> ZScoreAlert | None:
+    """Z-score check for an already resolved rolling window of stats."""
     # Check if we have enough observations
     if not rolling_window.is_valid:
         return None
 
-    values = rolling_window.values
-    if not values:
+    # Median and MAD come from the window's incrementally sorted values
+    spread = rolling_window.median_and_mad()
+    if spread is None:
         return None
+    median, mad = spread
 
-    # Current value is the most recent
-    current = values[-1]
-
-    # Calculate Z-score using all values (including current)
-    zscore = calculate_zscore_mad(current, values)
+    # Current value is the most recent; the Z-score uses all values
+    # (including current)
+    current = rolling_window.latest
+    zscore = zscore_from_mad(current, median, mad)
     if zscore is None:
         return None
 
@@ -362,12 +449,9 @@ def detect_zscore_alert(
     if abs(zscore) <= threshold:
         return None
 
-    median = rolling_window.median
-    mad = rolling_window.mad
-
     logger.info(
-        f"Z-score alert: {stats.market_id} {metric}/{window} "
-        f"zscore={zscore:.2f} (threshold={threshold})"
+        "Z-score alert: %s %s/%s zscore=%.2f (threshold=%s)",
+        stats.market_id, metric, window, zscore, threshold,
     )
 
     return ZScoreAlert(
@@ -379,7 +463,7 @@ def detect_zscore_alert(
         mad=mad,
         zscore=zscore,
         threshold=threshold,
-        detected_at=datetime.now(),
+        detected_at=now or datetime.now(),
     )
 
 
@@ -388,6 +472,7 @@ def detect_mad_alert(
     multiplier: float,
     metric: str = "price",
     window: str = "1h",
+    now: datetime | None = None,
 ) -> MADAlert | None:
     """
     Detect if current value exceeds MAD multiplier threshold.
@@ -399,37 +484,41 @@ def detect_mad_alert(
         multiplier: MAD multiplier threshold (e.g., 3.0)
         metric: "volume" or "price"
         window: "1h" or "4h"
+        now: Detection time stamped on the alert (default: datetime.now())
 
     Returns:
         MADAlert if threshold exceeded, None otherwise.
     """
     # Get the appropriate rolling window
-    window_map = {
-        ("volume", "1h"): stats.volume_1h,
-        ("volume", "4h"): stats.volume_4h,
-        ("price", "1h"): stats.price_1h,
-        ("price", "4h"): stats.price_4h,
-    }
-
-    rolling_window = window_map.get((metric, window))
-    if rolling_window is None:
-        logger.warning(f"Unknown metric/window combo: {metric}/{window}")
+    attr = _WINDOW_ATTR.get((metric, window))
+    if attr is None:
+        logger.warning("Unknown metric/window combo: %s/%s", metric, window)
         return None
+    return _mad_alert(stats, getattr(stats, attr), multiplier, metric, window, now)
+
 
+def _mad_alert(
+    stats: MarketStatistics,
+    rolling_window: RollingWindow,
+    multiplier: float,
+    metric: str,
+    window: str,
+    now: datetime | None,
+) -> MADAlert | None:
+    """MAD multiplier check for an already resolved rolling window of stats."""
     # Check if we have enough observations
     if not rolling_window.is_valid:
         return None
 
-    values = rolling_window.values
-    if not values:
+    spread = rolling_window.median_and_mad()
+    if spread is None:
         return None
+    median, mad = spread
 
     # Current value is the most recent
-    current = values[-1]
-    median = rolling_window.median
-    mad = rolling_window.mad
+    current = rolling_window.latest
 
-    if median is None or mad is None or mad == 0:
+    if mad == 0:
         return None
 
     # Calculate how many MADs away from median
@@ -441,8 +530,8 @@ def detect_mad_alert(
         return None
 
     logger.info(
-        f"MAD alert: {stats.market_id} {metric}/{window} "
-        f"multiplier={actual_multiplier:.2f} (threshold={multiplier})"
+        "MAD alert: %s %s/%s multiplier=%.2f (threshold=%s)",
+        stats.market_id, metric, window, actual_multiplier, multiplier,
     )
 
     return MADAlert(
@@ -454,10 +543,53 @@ def detect_mad_alert(
         mad=mad,
         multiplier=actual_multiplier,
         threshold_multiplier=multiplier,
-        detected_at=datetime.now(),
+        detected_at=now or datetime.now(),
     )
 
 
+def _detect_all_windowed(
+    stats_dict: dict[str, MarketStatistics],
+    metric: str,
+    check: Callable[..., ZScoreAlert | MADAlert | None],
+    limit: float,
+    score: Callable[[ZScoreAlert | MADAlert], float],
+    cooldown_manager: CooldownManager | None,
+    token_mapping: dict[str, tuple[str, str]] | None,
+) -> list[ZScoreAlert | MADAlert]:
+    """
+    Shared loop behind detect_all_zscore_alerts and detect_all_mad_alerts.
+
+    Runs check (_zscore_alert or _mad_alert) on both windows of metric for
+    every market. score picks the alert value used for cooldown escalation.
+    """
+    alerts = []
+    now = datetime.now()
+    monotonic_now = time.monotonic()
+    get_windows = _METRIC_WINDOWS[metric]
+
+    for market_id, stats in stats_dict.items():
+        event_info = token_mapping.get(market_id) if token_mapping else None
+
+        # Both windows are fetched in one attrgetter call
+        for window, rolling_window in zip(_WINDOW_NAMES, get_windows(stats)):
+            alert = check(stats, rolling_window, limit, metric, window, now)
+            if alert:
+                # Apply cooldown check
+                if cooldown_manager:
+                    key = cooldown_manager._make_key(market_id, metric, window)
+                    if not cooldown_manager.should_alert(key, score(alert), monotonic_now):
+                        continue  # Suppressed by cooldown
+                    cooldown_manager.record_alert(key, score(alert), monotonic_now)
+
+                # Add human-readable event info if available
+                if event_info:
+                    alert.event_name, alert.outcome = event_info
+
+                alerts.append(alert)
+
+    return alerts
+
+
 def detect_all_zscore_alerts(
     stats_dict: dict[str, MarketStatistics],
     threshold: float = 3.5,
@@ -478,30 +610,13 @@ def detect_all_zscore_alerts(
     Returns:
         List of ZScoreAlert objects for all triggered alerts.
     """
-    alerts = []
-
-    for market_id, stats in stats_dict.items():
-        # Check volume on both windows
-        for window in ("1h", "4h"):
-            alert = detect_zscore_alert(stats, threshold, metric="volume", window=window)
-            if alert:
-                # Apply cooldown check
-                if cooldown_manager:
-                    key = cooldown_manager._make_key(market_id, "volume", window)
-                    if not cooldown_manager.should_alert(key, alert.zscore):
-                        continue  # Suppressed by cooldown
-                    cooldown_manager.record_alert(key, alert.zscore)
-
-                # Add human-readable event info if available
-                if token_mapping and market_id in token_mapping:
-                    event_name, outcome = token_mapping[market_id]
-                    alert.event_name = event_name
-                    alert.outcome = outcome
-
-                alerts.append(alert)
+    alerts = _detect_all_windowed(
+        stats_dict, "volume", _zscore_alert, threshold, _ZSCORE,
+        cooldown_manager, token_mapping,
+    )
 
     if alerts:
-        logger.info(f"Total Z-score alerts: {len(alerts)}")
+        logger.info("Total Z-score alerts: %s", len(alerts))
 
     return alerts
 
@@ -526,32 +641,28 @@ def detect_all_mad_alerts(
     Returns:
         List of MADAlert objects for all triggered alerts.
     """
-    alerts = []
+    # Cooldown escalation uses the multiplier as a proxy for zscore
+    alerts = _detect_all_windowed(
+        stats_dict, "price", _mad_alert, multiplier, _MULTIPLIER,
+        cooldown_manager, token_mapping,
+    )
 
-    for market_id, stats in stats_dict.items():
-        # Check price on both windows
-        for window in ("1h", "4h"):
-            alert = detect_mad_alert(stats, multiplier, metric="price", window=window)
-            if alert:
-                # Apply cooldown check (use multiplier as proxy for zscore)
-                if cooldown_manager:
-                    key = cooldown_manager._make_key(market_id, "price", window)
-                    if not cooldown_manager.should_alert(key, alert.multiplier):
-                        continue  # Suppressed by cooldown
-                    cooldown_manager.record_alert(key, alert.multiplier)
+    if alerts:
+        logger.info("Total MAD alerts: %s", len(alerts))
 
-                # Add human-readable event info if available
-                if token_mapping and market_id in token_mapping:
-                    event_name, outcome = token_mapping[market_id]
-                    alert.event_name = event_name
-                    alert.outcome = outcome
+    return alerts
 
-                alerts.append(alert)
 
-    if alerts:
-        logger.info(f"Total MAD alerts: {len(alerts)}")
+@functools.lru_cache(maxsize=1024)
+def _parse_outcome_prices(raw: str) -> tuple:
+    """
+    Decode an outcomePrices JSON string into a tuple.
 
-    return alerts
+    The API repeats the same handful of strings across polls, so decoded
+    results are cached. Invalid JSON raises json.JSONDecodeError (and is
+    not cached).
+    """
+    return tuple(json.loads(raw))
 
 
 def detect_closed_markets(
@@ -574,23 +685,22 @@ def detect_closed_markets(
     """
     alerts = []
     slugs_to_remove = []
+    now = datetime.now()
 
     for slug, event in events.items():
-        if slug not in new_data:
+        api_event = new_data.get(slug)
+        if api_event is None:
             continue
 
-        api_event = new_data[slug]
-        api_markets = api_event.get("markets", [])
-
         # Build lookup of API market data by question
-        api_market_lookup = {}
-        for api_market in api_markets:
-            question = api_market.get("question", "")
-            api_market_lookup[question] = api_market
+        find_api_market = {
+            api_market.get("question", ""): api_market
+            for api_market in api_event.get("markets", [])
+        }.get
 
         all_closed = True
         for market in event.markets:
-            api_market = api_market_lookup.get(market.question)
+            api_market = find_api_market(market.question)
             if api_market is None:
                 continue
 
@@ -605,11 +715,11 @@ def detect_closed_markets(
                     try:
                         # outcomePrices is typically a JSON string like '["0.95", "0.05"]'
                         if isinstance(outcome_prices, str):
-                            prices = json.loads(outcome_prices)
+                            prices = _parse_outcome_prices(outcome_prices)
                         else:
                             prices = outcome_prices
                         # Match outcome to price (Yes=0, No=1)
-                        idx = 0 if market.outcome.lower() == "yes" else 1
+                        idx = 0 if market.is_yes else 1
                         if idx < len(prices):
                             final_price = float(prices[idx])
                     except (json.JSONDecodeError, ValueError, IndexError):
@@ -621,12 +731,12 @@ def detect_closed_markets(
                     market_question=market.question,
                     outcome=market.outcome,
                     final_price=final_price,
-                    detected_at=datetime.now(),
+                    detected_at=now,
                 )
                 alerts.append(alert)
                 logger.info(
-                    f"Market closed: {market.question} [{market.outcome}] "
-                    f"final_price={final_price}"
+                    "Market closed: %s [%s] final_price=%s",
+                    market.question, market.outcome, final_price,
                 )
 
             # Track if any market is still open
@@ -636,9 +746,9 @@ def detect_closed_markets(
         # If all markets are closed, mark event for removal
         if all_closed and event.markets:
             slugs_to_remove.append(slug)
-            logger.info(f"All markets closed for event: {event.name}")
+            logger.info("All markets closed for event: %s", event.name)
 
     if alerts:
-        logger.info(f"Total closed market alerts: {len(alerts)}")
+        logger.info("Total closed market alerts: %s", len(alerts))
 
     return alerts, slugs_to_remove
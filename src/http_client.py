@@ -0,0 +1,41 @@
+"""Shared HTTP client construction for Polybotz."""
+
+from typing import Any
+
+import httpx
+import orjson
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 64
+DEFAULT_MAX_KEEPALIVE = 32
+CONNECT_RETRIES = 1
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def create_http_client(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> httpx.AsyncClient:
+    """
+    Create an HTTP/2-enabled AsyncClient with a tuned connection pool.
+
+    HTTP/2 multiplexes concurrent requests over a few connections, and the
+    transport retries failed connection attempts once.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+    )
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=CONNECT_RETRIES)
+    return httpx.AsyncClient(transport=transport, timeout=timeout)
+
+
+def decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson (raises ValueError on bad JSON)."""
+    return orjson.loads(response.content)
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode a JSON request body with orjson."""
+    return orjson.dumps(payload)
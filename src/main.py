@@ -4,31 +4,38 @@ import asyncio
 import logging
 import signal
 import sys
+from collections.abc import Awaitable
 from datetime import datetime
 from pathlib import Path
 
 import httpx
 
 from .alerter import (
+    close_alerter,
     send_all_alerts,
     send_all_closed_event_alerts,
     send_all_liquidity_warnings,
     send_all_mad_alerts,
     send_all_zscore_alerts,
 )
-from .clob_client import poll_clob_markets
+from .clob_client import get_clob_client, poll_clob_markets
 from .config import ConfigurationError, load_config
 from .detector import (
     CooldownManager,
-    detect_all_liquidity_warnings,
     detect_all_mad_alerts,
-    detect_all_spikes,
     detect_all_zscore_alerts,
     detect_closed_markets,
+    detect_spikes_and_warnings,
 )
 from .models import MarketStatistics, MonitoredEvent
-from .poller import fetch_all_events_raw, parse_event_response, poll_all_events, validate_slugs
-from .statistics import update_market_statistics
+from .poller import (
+    fetch_all_events_raw,
+    fetch_events,
+    parse_event_response,
+    poll_all_events,
+    validate_slugs,
+)
+from .statistics import update_all_market_statistics
 
 # Configure structured logging
 logging.basicConfig(
@@ -40,18 +47,47 @@ logging.basicConfig(
 
 logger = logging.getLogger("polybotz")
 
-# Graceful shutdown flag
-shutdown_requested = False
+# Graceful shutdown event, created by main_async on its running loop
+shutdown_event: asyncio.Event | None = None
 
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
 
-def extract_clob_token_ids(events: dict[str, MonitoredEvent]) -> list[str]:
-    """Extract all CLOB token IDs from monitored events."""
-    token_ids = []
+# CLOB detectors in run order:
+# (detector name, detect function, threshold config field, alert sender, log label)
+CLOB_DETECTORS = (
+    ("zscore", detect_all_zscore_alerts, "zscore_threshold", send_all_zscore_alerts, "Z-score"),
+    ("mad", detect_all_mad_alerts, "mad_multiplier", send_all_mad_alerts, "MAD"),
+)
+
+
+def collect_clob_tokens(
+    events: dict[str, MonitoredEvent],
+) -> tuple[list[str], dict[str, tuple[str, str]]]:
+    """Collect CLOB token IDs and their event info in a single pass over all markets.
+
+    Args:
+        events: Dict mapping slug to MonitoredEvent
+
+    Returns:
+        Tuple of (token IDs of open markets, each listed once in first-seen
+        order, dict mapping every token_id to (event_name, outcome))
+    """
+    open_tokens: dict[str, None] = {}
+    mapping = {}
     for event in events.values():
+        event_name = event.name
         for market in event.markets:
-            if market.clob_token_id and not market.is_closed:
-                token_ids.append(market.clob_token_id)
-    return token_ids
+            token_id = market.clob_token_id
+            if token_id:
+                mapping[token_id] = (event_name, market.outcome)
+                if not market.is_closed:
+                    open_tokens[token_id] = None
+    return list(open_tokens), mapping
+
+
+def extract_clob_token_ids(events: dict[str, MonitoredEvent]) -> list[str]:
+    """Extract all CLOB token IDs from monitored events."""
+    return collect_clob_tokens(events)[0]
 
 
 def build_token_event_mapping(events: dict[str, MonitoredEvent]) -> dict[str, tuple[str, str]]:
@@ -63,19 +99,32 @@ def build_token_event_mapping(events: dict[str, MonitoredEvent]) -> dict[str, tu
     Returns:
         Dict mapping token_id to (event_name, outcome) tuple
     """
-    mapping = {}
-    for event in events.values():
-        for market in event.markets:
-            if market.clob_token_id:
-                mapping[market.clob_token_id] = (event.name, market.outcome)
-    return mapping
+    return collect_clob_tokens(events)[1]
+
 
+async def _send_pending_alerts(pending: list[Awaitable]) -> None:
+    """Send independent alert batches concurrently and log any failures."""
+    if not pending:
+        return
 
-def handle_shutdown(signum: int, frame) -> None:
+    results = await asyncio.gather(*pending, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error sending alerts: {result}")
+
+
+async def _send_spikes_and_warnings(spikes: list, warnings: list, config) -> None:
+    """Send spike alerts, then the liquidity warnings that refer to them."""
+    await send_all_alerts(spikes, config)
+    if warnings:
+        await send_all_liquidity_warnings(warnings, config)
+
+
+def handle_shutdown(signum: int, frame=None) -> None:
     """Handle SIGINT/SIGTERM for graceful shutdown."""
-    global shutdown_requested
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-    shutdown_requested = True
+    if shutdown_event is not None:
+        shutdown_event.set()
 
 
 async def run_poll_cycle(
@@ -92,6 +141,9 @@ async def run_poll_cycle(
     if cooldown_manager:
         cooldown_manager.cleanup_stale()
 
+    # Alert batches are independent once detected and are sent together
+    pending: list[Awaitable] = []
+
     # Fetch raw data first (before updating state)
     raw_data = await fetch_all_events_raw(client, list(events.keys()))
 
@@ -100,46 +152,55 @@ async def run_poll_cycle(
         # Detect closed markets BEFORE updating state
         closed_alerts, slugs_to_remove = detect_closed_markets(events, raw_data)
 
-        # Send alerts for closed markets
+        # Start sending closed market alerts now: their events are removed
+        # below, so these alerts must not depend on the rest of the cycle
         if closed_alerts:
             logger.info(f"Detected {len(closed_alerts)} closed market(s)")
-            await send_all_closed_event_alerts(closed_alerts, config)
+            pending.append(
+                asyncio.create_task(send_all_closed_event_alerts(closed_alerts, config))
+            )
 
         # Remove fully-closed events from monitoring
         for slug in slugs_to_remove:
             logger.info(f"Removing closed event from monitoring: {slug}")
             del events[slug]
 
-    # Poll all Gamma API events (updates remaining events)
-    events = await poll_all_events(client, events)
-
-    # Check if spike detector is enabled
-    if "spike" in config.detectors:
-        # Detect spikes from Gamma API
-        spikes = detect_all_spikes(list(events.values()), config.spike_threshold)
-
-        if spikes:
-            logger.info(f"Detected {len(spikes)} spike(s)")
-            await send_all_alerts(spikes, config)
-
-            # Check if LVR detector is enabled
-            if "lvr" in config.detectors:
-                # Detect liquidity warnings for spikes with high LVR
-                warnings = detect_all_liquidity_warnings(
-                    list(events.values()),
-                    spikes,
-                    config.lvr_threshold,
-                )
-                if warnings:
-                    await send_all_liquidity_warnings(warnings, config)
-        else:
-            logger.debug("No spikes detected")
+    try:
+        # Nothing left to poll once every event has closed, unless CLOB tokens
+        # are configured explicitly
+        if not events and not config.clob_token_ids:
+            logger.info("No events and no CLOB override remaining")
+            return events
+
+        # Poll all Gamma API events (updates remaining events)
+        events = await poll_all_events(client, events)
+
+        # Check if spike detector is enabled
+        if "spike" in config.detectors:
+            # Detect spikes from Gamma API, plus liquidity warnings for spikes
+            # with high LVR when the LVR detector is enabled
+            lvr_threshold = config.lvr_threshold if "lvr" in config.detectors else None
+            spikes, warnings = detect_spikes_and_warnings(
+                list(events.values()),
+                config.spike_threshold,
+                lvr_threshold,
+            )
 
-    # Poll CLOB markets - use config override or extract from events
-    clob_token_ids = config.clob_token_ids if config.clob_token_ids else extract_clob_token_ids(events)
+            if spikes:
+                logger.info(f"Detected {len(spikes)} spike(s)")
+                pending.append(_send_spikes_and_warnings(spikes, warnings, config))
+            else:
+                logger.debug("No spikes detected")
+    finally:
+        # Always deliver what was detected, even if polling failed
+        await _send_pending_alerts(pending)
+
+    # Poll CLOB markets - use config override or extract from events, along
+    # with the token-to-event mapping for human-readable alerts
+    clob_token_ids, token_mapping = collect_clob_tokens(events)
+    if config.clob_token_ids:
+        clob_token_ids = config.clob_token_ids
     if clob_token_ids:
-        # Build token-to-event mapping for human-readable alerts
-        token_mapping = build_token_event_mapping(events)
         await run_clob_poll_cycle(
             client, market_stats, clob_token_ids, config, cooldown_manager, token_mapping
         )
@@ -157,24 +218,19 @@ async def run_clob_poll_cycle(
     token_mapping: dict[str, tuple[str, str]] | None = None,
 ) -> None:
     """Execute CLOB polling and Z-score/MAD detection cycle."""
+    if not clob_token_ids:
+        return
+
     logger.debug(f"Polling {len(clob_token_ids)} CLOB markets")
 
     # Poll CLOB markets for price and volume
     clob_data = await poll_clob_markets(client, clob_token_ids)
     timestamp = datetime.now()
 
-    # Update statistics for each market
-    for market_id, (price, volume) in clob_data.items():
-        if price is None or volume is None:
-            logger.debug(f"Skipping {market_id}: missing price or volume")
-            continue
-
-        # Initialize MarketStatistics if not exists
-        if market_id not in market_stats:
-            market_stats[market_id] = MarketStatistics(market_id=market_id)
-
-        # Update rolling windows
-        update_market_statistics(market_stats[market_id], price, volume, timestamp)
+    # Update statistics for all markets in one pass
+    skipped = update_all_market_statistics(market_stats, clob_data, timestamp)
+    for market_id in skipped:
+        logger.debug(f"Skipping {market_id}: missing price or volume")
 
     # Check warm-up status
     valid_markets = sum(1 for s in market_stats.values() if s.volume_1h.is_valid)
@@ -187,41 +243,44 @@ async def run_clob_poll_cycle(
             f"(need {min_obs} observations)"
         )
 
-    # Check if zscore detector is enabled
-    if "zscore" in config.detectors:
-        # Detect Z-score alerts (volume spikes)
-        zscore_alerts = detect_all_zscore_alerts(
-            market_stats,
-            config.zscore_threshold,
-            cooldown_manager=cooldown_manager,
-            token_mapping=token_mapping,
-        )
-        if zscore_alerts:
-            logger.info(f"Detected {len(zscore_alerts)} Z-score alert(s)")
-            await send_all_zscore_alerts(zscore_alerts, config)
-
-    # Check if mad detector is enabled
-    if "mad" in config.detectors:
-        # Detect MAD alerts (price anomalies)
-        mad_alerts = detect_all_mad_alerts(
+    pending: list[Awaitable] = []
+
+    # Run each enabled CLOB detector: Z-score (volume spikes), MAD (price anomalies)
+    for name, detect, threshold_field, send, label in CLOB_DETECTORS:
+        if name not in config.detectors:
+            continue
+        alerts = detect(
             market_stats,
-            config.mad_multiplier,
+            getattr(config, threshold_field),
             cooldown_manager=cooldown_manager,
             token_mapping=token_mapping,
         )
-        if mad_alerts:
-            logger.info(f"Detected {len(mad_alerts)} MAD alert(s)")
-            await send_all_mad_alerts(mad_alerts, config)
+        if alerts:
+            logger.info(f"Detected {len(alerts)} {label} alert(s)")
+            pending.append(send(alerts, config))
+
+    await _send_pending_alerts(pending)
 
 
 async def main_async() -> int:
     """Async main entry point."""
-    global shutdown_requested
+    global shutdown_event
+    shutdown_event = asyncio.Event()
 
-    # Register signal handlers
-    signal.signal(signal.SIGINT, handle_shutdown)
-    signal.signal(signal.SIGTERM, handle_shutdown)
+    # Register signal handlers on the loop so a signal wakes it immediately
+    loop = asyncio.get_running_loop()
+    for sig in SHUTDOWN_SIGNALS:
+        loop.add_signal_handler(sig, handle_shutdown, sig)
 
+    try:
+        return await _run(shutdown_event)
+    finally:
+        for sig in SHUTDOWN_SIGNALS:
+            loop.remove_signal_handler(sig)
+
+
+async def _run(shutdown_event: asyncio.Event) -> int:
+    """Load configuration, initialize state and poll until shutdown_event is set."""
     logger.info("Polybotz starting...")
 
     # Load configuration (from file if exists, otherwise from environment variables)
@@ -242,9 +301,30 @@ async def main_async() -> int:
     else:
         logger.info("No detectors enabled (monitoring only mode)")
 
+    # One pooled HTTP/2 client serves slug validation, the initial fetch and
+    # every poll cycle, so connections and TLS sessions are reused throughout
+    try:
+        async with get_clob_client(config) as client:
+            exit_code = await _monitor(client, config, shutdown_event)
+    finally:
+        # Close the shared Telegram client however monitoring ended
+        await close_alerter()
+    if exit_code:
+        return exit_code
+
+    logger.info("Polybotz shutdown complete")
+    return 0
+
+
+async def _monitor(
+    client: httpx.AsyncClient,
+    config,
+    shutdown_event: asyncio.Event,
+) -> int:
+    """Validate slugs, load initial events and run poll cycles until shutdown."""
     # Validate slugs on startup
     logger.info(f"Validating {len(config.slugs)} configured slugs...")
-    valid_slugs = await validate_slugs(config)
+    valid_slugs = await validate_slugs(config, client)
 
     if not valid_slugs:
         logger.error("No valid slugs found. Exiting.")
@@ -252,14 +332,12 @@ async def main_async() -> int:
 
     logger.info(f"Monitoring {len(valid_slugs)} valid events")
 
-    # Initialize events dict with first fetch
-    events: dict[str, MonitoredEvent] = {}
-    async with httpx.AsyncClient() as client:
-        for slug in valid_slugs:
-            from .poller import fetch_event_by_slug
-            data = await fetch_event_by_slug(client, slug)
-            if data:
-                events[slug] = parse_event_response(data)
+    # Initialize events dict with first fetch, fetching slugs concurrently
+    events: dict[str, MonitoredEvent] = {
+        slug: parse_event_response(data)
+        for slug, data in await fetch_events(client, valid_slugs)
+        if data
+    }
 
     logger.info(f"Initialized {len(events)} events for monitoring")
 
@@ -296,23 +374,21 @@ async def main_async() -> int:
         logger.info("Alert cooldown disabled (cooldown_minutes=0)")
 
     # Main polling loop
-    async with httpx.AsyncClient() as client:
-        while not shutdown_requested:
-            try:
-                events = await run_poll_cycle(
-                    client, events, market_stats, config, cooldown_manager
-                )
-            except Exception as e:
-                logger.error(f"Error in poll cycle: {e}")
-
-            # Wait for next poll interval
-            logger.debug(f"Sleeping for {config.poll_interval} seconds...")
-            for _ in range(config.poll_interval):
-                if shutdown_requested:
-                    break
-                await asyncio.sleep(1)
+    while not shutdown_event.is_set():
+        try:
+            events = await run_poll_cycle(
+                client, events, market_stats, config, cooldown_manager
+            )
+        except Exception as e:
+            logger.error(f"Error in poll cycle: {e}")
+
+        # Wait for next poll interval, waking early on shutdown
+        logger.debug(f"Sleeping for {config.poll_interval} seconds...")
+        try:
+            await asyncio.wait_for(shutdown_event.wait(), timeout=config.poll_interval)
+        except asyncio.TimeoutError:
+            pass
 
-    logger.info("Polybotz shutdown complete")
     return 0
 
 
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from .statistics import RollingWindow
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitoredMarket:
     """A single market within an event."""
 
@@ -22,9 +22,15 @@ class MonitoredMarket:
     liquidity: float | None = None
     lvr: float | None = None
     clob_token_id: str | None = None  # CLOB token ID for this outcome
+    price_changed: bool = True  # Cleared by update_prices when the price did not move
+    is_yes: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute whether this is the "Yes" outcome."""
+        self.is_yes = self.outcome.strip().lower() == "yes"
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitoredEvent:
     """An event being tracked, with its current state."""
 
@@ -32,9 +38,28 @@ class MonitoredEvent:
     name: str
     markets: list[MonitoredMarket] = field(default_factory=list)
     last_updated: datetime | None = None
-
-
-@dataclass
+    _market_index: dict[tuple[str, str], MonitoredMarket] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_markets: list[MonitoredMarket] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def find_market(self, question: str, outcome: str) -> MonitoredMarket | None:
+        """
+        Return the market with this question and outcome, or None.
+
+        The (question, outcome) index is built on first use and rebuilt
+        whenever markets is replaced or changes length.
+        """
+        markets = self.markets
+        if self._indexed_markets is not markets or len(self._market_index) != len(markets):
+            self._market_index = {(m.question, m.outcome): m for m in markets}
+            self._indexed_markets = markets
+        return self._market_index.get((question, outcome))
+
+
+@dataclass(slots=True)
 class SpikeAlert:
     """A detected price spike ready for notification."""
 
@@ -46,9 +71,11 @@ class SpikeAlert:
     change_percent: float
     direction: str  # "up" or "down"
     detected_at: datetime
+    # Market the spike was detected on, set by detect_all_spikes
+    market: MonitoredMarket | None = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidityWarning:
     """Alert for LVR-triggered liquidity warnings."""
 
@@ -91,16 +118,20 @@ class MarketStatistics:
             self.price_4h = RollingWindow(duration=timedelta(hours=4))
 
 
-@dataclass
+# Cooldown state is keyed by (market_id, metric, window)
+CooldownKey = tuple[str, str, str]
+
+
+@dataclass(slots=True)
 class CooldownEntry:
     """Tracks cooldown state for a specific (market_id, metric, window) tuple."""
 
-    key: str  # Format: "{market_id}:{metric}:{window}"
-    last_alert_time: datetime
+    key: CooldownKey
+    last_alert_time: float  # time.monotonic() seconds
     last_zscore: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ZScoreAlert:
     """Alert triggered when Z-score exceeds threshold."""
 
@@ -117,7 +148,7 @@ class ZScoreAlert:
     outcome: str | None = None  # "Yes" or "No" outcome
 
 
-@dataclass
+@dataclass(slots=True)
 class MADAlert:
     """Alert triggered when value exceeds MAD multiplier."""
 
@@ -134,7 +165,7 @@ class MADAlert:
     outcome: str | None = None  # "Yes" or "No" outcome
 
 
-@dataclass
+@dataclass(slots=True)
 class ClosedEventAlert:
     """Alert when a market transitions from open to closed."""
 
@@ -1,15 +1,17 @@
 """Gamma API polling logic for Polybotz."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 
 import httpx
+import orjson
 
 from .config import Configuration
 from .detector import calculate_lvr
+from .http_client import decode_json
 from .models import MonitoredEvent, MonitoredMarket
+from .retry import backoff_delay
 
 logger = logging.getLogger("polybotz.poller")
 
@@ -17,6 +19,8 @@ GAMMA_API_BASE = "https://gamma-api.polymarket.com"
 DEFAULT_TIMEOUT = 10.0
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
+# Maximum concurrent Gamma API requests when fetching many events
+MAX_CONCURRENT_FETCHES = 16
 
 
 async def fetch_event_by_slug(
@@ -37,54 +41,95 @@ async def fetch_event_by_slug(
                 return None
 
             if response.status_code == 429:
-                logger.warning(f"Rate limited fetching {slug}, attempt {attempt + 1}/{max_retries}")
-                await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+                delay = backoff_delay(attempt, response, base=RETRY_DELAY)
+                logger.warning(
+                    f"Rate limited fetching {slug}, waiting {delay:.1f}s (attempt {attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
                 continue
 
             response.raise_for_status()
-            return response.json()
+            return decode_json(response)
 
         except httpx.TimeoutException:
             logger.warning(f"Timeout fetching {slug}, attempt {attempt + 1}/{max_retries}")
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching {slug}: {e.response.status_code}")
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, e.response, base=RETRY_DELAY))
         except httpx.RequestError as e:
             logger.error(f"Request error fetching {slug}: {e}")
             if attempt < max_retries - 1:
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(backoff_delay(attempt, base=RETRY_DELAY))
 
     logger.error(f"Failed to fetch {slug} after {max_retries} attempts")
     return None
 
 
-async def validate_slugs(config: Configuration) -> list[str]:
-    """Validate each slug on startup, return list of valid slugs."""
+async def validate_slugs(
+    config: Configuration,
+    client: httpx.AsyncClient | None = None,
+) -> list[str]:
+    """
+    Validate each slug on startup, return list of valid slugs.
+
+    Uses the given client if provided, otherwise a temporary one.
+    """
+    if client is None:
+        async with httpx.AsyncClient() as client:
+            return await validate_slugs(config, client)
+
     valid_slugs = []
 
-    async with httpx.AsyncClient() as client:
-        for slug in config.slugs:
-            logger.info(f"Validating slug: {slug}")
-            data = await fetch_event_by_slug(client, slug)
+    for slug in config.slugs:
+        logger.info(f"Validating slug: {slug}")
 
-            if data is None:
-                logger.warning(f"Invalid slug, skipping: {slug}")
-            else:
-                logger.info(f"Valid slug: {slug} ({data.get('title', 'Unknown')})")
-                valid_slugs.append(slug)
+    for slug, data in await fetch_events(client, config.slugs):
+        if data is None:
+            logger.warning(f"Invalid slug, skipping: {slug}")
+        else:
+            logger.info(f"Valid slug: {slug} ({data.get('title', 'Unknown')})")
+            valid_slugs.append(slug)
 
     return valid_slugs
 
 
+async def fetch_events(
+    client: httpx.AsyncClient,
+    slugs: list[str],
+    max_concurrency: int = MAX_CONCURRENT_FETCHES,
+) -> list[tuple[str, dict | None]]:
+    """
+    Fetch several events concurrently, at most max_concurrency at a time.
+
+    Returns (slug, data) pairs in the order of slugs. data is None when the
+    event could not be fetched, including when the fetch raised.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(slug: str) -> dict | None:
+        async with semaphore:
+            return await fetch_event_by_slug(client, slug)
+
+    results = await asyncio.gather(*(fetch(slug) for slug in slugs), return_exceptions=True)
+
+    pairs = []
+    for slug, result in zip(slugs, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error fetching {slug}: {result}")
+            result = None
+        pairs.append((slug, result))
+    return pairs
+
+
 def _parse_json_field(value) -> list:
     """Parse a field that may be a JSON string or already a list."""
     if isinstance(value, str):
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
             return []
     elif isinstance(value, list):
         return value
@@ -162,6 +207,7 @@ def update_prices(event: MonitoredEvent, new_data: dict) -> MonitoredEvent:
         if key in existing:
             # Update existing: current becomes previous
             new_market.previous_price = existing[key].current_price
+            new_market.price_changed = new_market.current_price != new_market.previous_price
         # else: new market, previous_price stays None
 
         # Calculate and store LVR for each market
@@ -183,16 +229,16 @@ async def poll_all_events(
     client: httpx.AsyncClient,
     events: dict[str, MonitoredEvent],
 ) -> dict[str, MonitoredEvent]:
-    """Fetch all configured events and update their data."""
-    for slug, event in events.items():
+    """Fetch all configured events concurrently and update their data."""
+    for slug in events:
         logger.debug(f"Polling event: {slug}")
-        data = await fetch_event_by_slug(client, slug)
 
+    for slug, data in await fetch_events(client, list(events)):
         if data is None:
             logger.error(f"Failed to poll event: {slug}")
             continue
 
-        events[slug] = update_prices(event, data)
+        events[slug] = update_prices(events[slug], data)
 
     return events
 
@@ -214,13 +260,7 @@ async def fetch_all_events_raw(
     Returns:
         Dict mapping slug to raw API response data
     """
-    raw_data = {}
-
     for slug in slugs:
         logger.debug(f"Fetching raw data for: {slug}")
-        data = await fetch_event_by_slug(client, slug)
-
-        if data is not None:
-            raw_data[slug] = data
 
-    return raw_data
+    return {slug: data for slug, data in await fetch_events(client, slugs) if data is not None}
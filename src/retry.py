@@ -0,0 +1,35 @@
+"""Retry backoff helpers shared by the HTTP clients."""
+
+import random
+
+import httpx
+
+BASE_DELAY = 1.0
+MAX_DELAY = 30.0
+
+
+def backoff_delay(
+    attempt: int,
+    response: httpx.Response | None = None,
+    base: float = BASE_DELAY,
+    max_delay: float = MAX_DELAY,
+) -> float:
+    """
+    Return seconds to wait before the next retry.
+
+    A numeric Retry-After header on the response wins, clamped to
+    [0, max_delay] so one long server-requested wait cannot stall the
+    caller indefinitely. Otherwise the
+    delay grows exponentially with the attempt number, capped at max_delay,
+    and is scaled by a random factor in [0.5, 1.5] so concurrent retriers
+    do not retry in lockstep.
+    """
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if isinstance(retry_after, str):
+            try:
+                return min(max_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form, fall back to exponential backoff
+
+    return min(max_delay, base * (2**attempt)) * random.uniform(0.5, 1.5)
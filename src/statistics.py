@@ -1,6 +1,6 @@
 """Statistical calculations for Z-Score/MAD hybrid detection."""
 
-import statistics
+from bisect import bisect_left, insort
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -16,51 +16,124 @@ class Observation:
 
 @dataclass
 class RollingWindow:
-    """A time-based sliding window of observations for statistical calculations."""
+    """
+    A time-based sliding window of observations for statistical calculations.
+
+    Timestamps and values are kept in two parallel deques rather than one
+    deque of Observation objects, so values can be copied out in one step.
+    A sorted copy of the values is maintained incrementally alongside them,
+    so the median is an O(1) lookup and MAD needs no full re-sort. The last
+    (median, MAD) is cached until the window's contents change.
+    """
 
     duration: timedelta
     min_observations: int = 30
-    observations: deque = field(default_factory=deque)
+    # Filled only through add() so they stay in step with _sorted
+    _timestamps: deque = field(default_factory=deque, init=False, repr=False)
+    _samples: deque = field(default_factory=deque, init=False, repr=False)
+    _sorted: list = field(default_factory=list, init=False, repr=False, compare=False)
+    _spread: tuple[float, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add(self, value: float, timestamp: datetime | None = None) -> None:
         """Add an observation and trim expired ones."""
         if timestamp is None:
             timestamp = datetime.now()
-        self.observations.append(Observation(timestamp=timestamp, value=value))
+        self._timestamps.append(timestamp)
+        self._samples.append(value)
+        insort(self._sorted, value)
+        self._spread = None
         self._trim()
 
     def _trim(self) -> None:
         """Remove observations outside the time window."""
         cutoff = datetime.now() - self.duration
-        while self.observations and self.observations[0].timestamp < cutoff:
-            self.observations.popleft()
+        timestamps = self._timestamps
+        ordered = self._sorted
+        while timestamps and timestamps[0] < cutoff:
+            timestamps.popleft()
+            del ordered[bisect_left(ordered, self._samples.popleft())]
+            self._spread = None
+
+    @property
+    def observations(self) -> list[Observation]:
+        """Return current observations as Observation objects."""
+        return [
+            Observation(timestamp=ts, value=value)
+            for ts, value in zip(self._timestamps, self._samples)
+        ]
+
+    @property
+    def latest(self) -> float | None:
+        """Return the most recently added value, or None if the window is empty."""
+        return self._samples[-1] if self._samples else None
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations currently held."""
+        return len(self._samples)
 
     @property
     def values(self) -> list[float]:
         """Return current observation values after trimming."""
         self._trim()
-        return [obs.value for obs in self.observations]
+        return list(self._samples)
 
     @property
     def median(self) -> float | None:
         """Return median of current values, or None if insufficient data."""
-        vals = self.values
-        if len(vals) < 1:
+        self._trim()
+        if not self._sorted:
             return None
-        return statistics.median(vals)
+        return _median_of_sorted(self._sorted)
 
     @property
     def mad(self) -> float | None:
         """Return Median Absolute Deviation of current values."""
-        vals = self.values
-        if len(vals) < 1:
-            return None
-        return calculate_mad(vals)
+        spread = self.median_and_mad()
+        return None if spread is None else spread[1]
+
+    def median_and_mad(self) -> tuple[float, float] | None:
+        """Return (median, MAD) of current values, or None if the window is empty."""
+        self._trim()
+        if self._spread is None and self._sorted:
+            self._spread = _median_and_mad_of_sorted(self._sorted)
+        return self._spread
 
     @property
     def is_valid(self) -> bool:
         """Return True if we have enough observations for valid statistics."""
-        return len(self.observations) >= self.min_observations
+        return len(self._samples) >= self.min_observations
+
+
+def _median_of_sorted(ordered: list[float]) -> float:
+    """Return the median of an already sorted, non-empty list."""
+    half = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[half]
+    return (ordered[half - 1] + ordered[half]) / 2
+
+
+def median_and_mad(values: list[float]) -> tuple[float, float]:
+    """
+    Return (median, MAD) of values, computing the median only once.
+
+    Callers that need both statistics should use this instead of calling
+    statistics.median and calculate_mad separately. Sorts directly rather
+    than going through statistics.median, which re-validates its input on
+    every call.
+    """
+    return _median_and_mad_of_sorted(sorted(values))
+
+
+def _median_and_mad_of_sorted(ordered: list[float]) -> tuple[float, float]:
+    """Return (median, MAD) of an already sorted, non-empty list."""
+    median_val = _median_of_sorted(ordered)
+    # Deviations of sorted input fall then rise, so this sort is a
+    # near-linear merge of two runs
+    deviations = sorted([abs(x - median_val) for x in ordered])
+    return median_val, _median_of_sorted(deviations)
 
 
 def calculate_mad(values: list[float]) -> float:
@@ -71,9 +144,7 @@ def calculate_mad(values: list[float]) -> float:
     """
     if not values:
         return 0.0
-    median_val = statistics.median(values)
-    deviations = [abs(x - median_val) for x in values]
-    return statistics.median(deviations)
+    return median_and_mad(values)[1]
 
 
 def calculate_zscore_mad(current: float, values: list[float]) -> float | None:
@@ -90,9 +161,12 @@ def calculate_zscore_mad(current: float, values: list[float]) -> float | None:
     if not values:
         return None
 
-    median_val = statistics.median(values)
-    mad = calculate_mad(values)
+    median_val, mad = median_and_mad(values)
+    return zscore_from_mad(current, median_val, mad)
 
+
+def zscore_from_mad(current: float, median_val: float, mad: float) -> float | None:
+    """Return the MAD-based Z-score for precomputed median/MAD, or None if MAD is zero."""
     # Avoid division by zero
     if mad == 0:
         return None
@@ -118,6 +192,44 @@ def update_market_statistics(
     stats.last_updated = timestamp
 
 
+def update_all_market_statistics(
+    market_stats: dict[str, "MarketStatistics"],
+    clob_data: dict[str, tuple[float | None, float | None]],
+    timestamp: datetime | None = None,
+) -> list[str]:
+    """
+    Update rolling windows for every market in one CLOB poll.
+
+    Markets seen for the first time get a fresh MarketStatistics entry.
+    Markets missing a price or volume are left untouched.
+
+    Returns:
+        Market IDs that were skipped because of missing data
+    """
+    from .models import MarketStatistics
+
+    if timestamp is None:
+        timestamp = datetime.now()
+
+    skipped = []
+    for market_id, (price, volume) in clob_data.items():
+        if price is None or volume is None:
+            skipped.append(market_id)
+            continue
+
+        stats = market_stats.get(market_id)
+        if stats is None:
+            stats = market_stats[market_id] = MarketStatistics(market_id=market_id)
+
+        stats.volume_1h.add(volume, timestamp)
+        stats.volume_4h.add(volume, timestamp)
+        stats.price_1h.add(price, timestamp)
+        stats.price_4h.add(price, timestamp)
+        stats.last_updated = timestamp
+
+    return skipped
+
+
 def get_statistics_summary(stats: "MarketStatistics") -> dict:
     """
     Return a formatted dictionary with current statistics for a market.
@@ -128,25 +240,25 @@ def get_statistics_summary(stats: "MarketStatistics") -> dict:
         "market_id": stats.market_id,
         "last_updated": stats.last_updated.isoformat() if stats.last_updated else None,
         "volume_1h": {
-            "observations": len(stats.volume_1h.observations),
+            "observations": stats.volume_1h.count,
             "is_valid": stats.volume_1h.is_valid,
             "median": stats.volume_1h.median,
             "mad": stats.volume_1h.mad,
         },
         "volume_4h": {
-            "observations": len(stats.volume_4h.observations),
+            "observations": stats.volume_4h.count,
             "is_valid": stats.volume_4h.is_valid,
             "median": stats.volume_4h.median,
             "mad": stats.volume_4h.mad,
         },
         "price_1h": {
-            "observations": len(stats.price_1h.observations),
+            "observations": stats.price_1h.count,
             "is_valid": stats.price_1h.is_valid,
             "median": stats.price_1h.median,
             "mad": stats.price_1h.mad,
         },
         "price_4h": {
-            "observations": len(stats.price_4h.observations),
+            "observations": stats.price_4h.count,
             "is_valid": stats.price_4h.is_valid,
             "median": stats.price_4h.median,
             "mad": stats.price_4h.mad,
@@ -1,13 +1,39 @@
 """Shared fixtures for Polybotz tests."""
 
+import orjson
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
-from src.config import Configuration
+import src.alerter as alerter
+from src.alerter import _tg_breaker
+from src.clob_client import _clob_breaker
+from src.config import Configuration, clear_config_cache
 from src.models import ClosedEventAlert, LiquidityWarning, MonitoredEvent, MonitoredMarket, SpikeAlert
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Start every test with closed Telegram and CLOB circuit breakers."""
+    _tg_breaker.reset()
+    _clob_breaker.reset()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_send_semaphore(monkeypatch):
+    """Start every test without a Telegram send semaphore bound to an old loop."""
+    monkeypatch.setattr(alerter, "_semaphore", None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Start every test without memoized configurations."""
+    clear_config_cache()
+    yield
+
+
 @pytest.fixture
 def valid_config():
     """A valid Configuration object."""
@@ -223,6 +249,7 @@ def mock_successful_response():
     response = MagicMock()
     response.status_code = 200
     response.json.return_value = {"ok": True, "result": {}}
+    response.content = orjson.dumps(response.json.return_value)
     return response
 
 
@@ -235,6 +262,7 @@ def mock_telegram_success_response():
         "ok": True,
         "result": {"message_id": 123},
     }
+    response.content = orjson.dumps(response.json.return_value)
     return response
 
 
@@ -247,6 +275,7 @@ def mock_telegram_error_response():
         "ok": False,
         "description": "Bad Request: chat not found",
     }
+    response.content = orjson.dumps(response.json.return_value)
     return response
 
 
@@ -1,5 +1,6 @@
 """Integration tests for src/main.py."""
 
+import orjson
 import pytest
 import asyncio
 import signal
@@ -12,6 +13,9 @@ from src.main import (
     main_async,
     main,
     extract_clob_token_ids,
+    collect_clob_tokens,
+    _send_pending_alerts,
+    run_clob_poll_cycle,
 )
 from src.models import MonitoredEvent, MonitoredMarket
 from src.config import Configuration
@@ -149,28 +153,152 @@ class TestExtractClobTokenIds:
         assert "token-2" in result
 
 
+class TestCollectClobTokens:
+    """Tests for collect_clob_tokens function."""
+
+    def test_collect_ids_and_mapping(self):
+        """Test one pass yields open token IDs and a mapping for every token."""
+        events = {
+            "event-1": MonitoredEvent(
+                slug="event-1",
+                name="Event 1",
+                markets=[
+                    MonitoredMarket(
+                        id="m1", question="Q1", outcome="Yes",
+                        clob_token_id="token-yes", is_closed=False,
+                    ),
+                    MonitoredMarket(
+                        id="m1", question="Q1", outcome="No",
+                        clob_token_id="token-no", is_closed=True,
+                    ),
+                    MonitoredMarket(
+                        id="m2", question="Q2", outcome="Yes",
+                        clob_token_id=None, is_closed=False,
+                    ),
+                ],
+            ),
+        }
+
+        token_ids, mapping = collect_clob_tokens(events)
+
+        assert token_ids == ["token-yes"]
+        assert mapping == {
+            "token-yes": ("Event 1", "Yes"),
+            "token-no": ("Event 1", "No"),
+        }
+
+    def test_shared_token_listed_once(self):
+        """Test a token shared across events is polled once, in first-seen order."""
+        def event(slug, tokens):
+            return MonitoredEvent(
+                slug=slug,
+                name=slug,
+                markets=[
+                    MonitoredMarket(id=t, question="Q", outcome="Yes", clob_token_id=t)
+                    for t in tokens
+                ],
+            )
+
+        events = {"a": event("a", ["t1", "t2"]), "b": event("b", ["t2", "t3"])}
+
+        token_ids, _ = collect_clob_tokens(events)
+
+        assert token_ids == ["t1", "t2", "t3"]
+
+
+class TestSendPendingAlerts:
+    """Tests for concurrent alert batch sending."""
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_block_other_batches(self, caplog):
+        """Test a failing batch is logged while the others still complete."""
+        sent = []
+
+        async def ok():
+            sent.append("ok")
+
+        async def fail():
+            raise RuntimeError("telegram down")
+
+        with caplog.at_level("ERROR"):
+            await _send_pending_alerts([fail(), ok()])
+
+        assert sent == ["ok"]
+        assert "Error sending alerts: telegram down" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_empty_is_noop(self):
+        """Test nothing happens when no alerts are pending."""
+        await _send_pending_alerts([])
+
+
+class TestRunClobPollCycle:
+    """Tests for CLOB detector dispatch in run_clob_poll_cycle."""
+
+    @pytest.mark.asyncio
+    async def test_runs_only_enabled_detectors(self, valid_config, monkeypatch):
+        """Test enabled detectors get their threshold and disabled ones are skipped."""
+        import src.main as main_module
+
+        config = Configuration(
+            slugs=valid_config.slugs,
+            poll_interval=valid_config.poll_interval,
+            spike_threshold=valid_config.spike_threshold,
+            telegram_bot_token=valid_config.telegram_bot_token,
+            telegram_chat_id=valid_config.telegram_chat_id,
+            zscore_threshold=4.0,
+            detectors={"zscore"},
+        )
+        zscore_detect = MagicMock(return_value=["zscore-alert"])
+        mad_detect = MagicMock(return_value=["mad-alert"])
+        zscore_send = AsyncMock()
+        mad_send = AsyncMock()
+        monkeypatch.setattr(main_module, "CLOB_DETECTORS", (
+            ("zscore", zscore_detect, "zscore_threshold", zscore_send, "Z-score"),
+            ("mad", mad_detect, "mad_multiplier", mad_send, "MAD"),
+        ))
+
+        with patch("src.main.poll_clob_markets", AsyncMock(return_value={"tok": (0.5, 100.0)})):
+            await run_clob_poll_cycle(AsyncMock(), {}, ["tok"], config)
+
+        assert zscore_detect.call_args.args[1] == 4.0
+        zscore_send.assert_awaited_once_with(["zscore-alert"], config)
+        mad_detect.assert_not_called()
+        mad_send.assert_not_called()
+
+
 class TestHandleShutdown:
     """Tests for handle_shutdown function."""
 
-    def test_handle_shutdown_sets_flag(self):
-        """Test that shutdown handler sets the global flag."""
+    def test_handle_shutdown_sets_event(self, monkeypatch):
+        """Test that shutdown handler sets the global shutdown event."""
         import src.main as main_module
 
-        main_module.shutdown_requested = False
+        monkeypatch.setattr(main_module, "shutdown_event", asyncio.Event())
 
         handle_shutdown(signal.SIGINT, None)
 
-        assert main_module.shutdown_requested is True
+        assert main_module.shutdown_event.is_set()
 
-    def test_handle_shutdown_sigterm(self):
+    def test_handle_shutdown_sigterm(self, monkeypatch):
         """Test handling SIGTERM signal."""
         import src.main as main_module
 
-        main_module.shutdown_requested = False
+        monkeypatch.setattr(main_module, "shutdown_event", asyncio.Event())
+
+        handle_shutdown(signal.SIGTERM)
+
+        assert main_module.shutdown_event.is_set()
+
+    def test_handle_shutdown_before_startup(self, monkeypatch):
+        """Test a signal before main_async has started is ignored."""
+        import src.main as main_module
+
+        monkeypatch.setattr(main_module, "shutdown_event", None)
 
-        handle_shutdown(signal.SIGTERM, None)
+        handle_shutdown(signal.SIGINT, None)
 
-        assert main_module.shutdown_requested is True
+        assert main_module.shutdown_event is None
 
 
 class TestRunPollCycle:
@@ -200,7 +328,9 @@ class TestRunPollCycle:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
+        mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
 
         result = await run_poll_cycle(mock_client, events, market_stats, valid_config)
 
@@ -230,15 +360,18 @@ class TestRunPollCycle:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
+        mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_alert_client:
+        with patch("src.alerter._get_client") as mock_alert_client:
             alert_mock = AsyncMock()
             alert_response = MagicMock()
             alert_response.status_code = 200
             alert_response.json.return_value = {"ok": True}
+            alert_response.content = orjson.dumps(alert_response.json.return_value)
             alert_mock.post.return_value = alert_response
-            mock_alert_client.return_value.__aenter__.return_value = alert_mock
+            mock_alert_client.return_value = alert_mock
 
             result = await run_poll_cycle(mock_client, events, market_stats, valid_config)
 
@@ -257,7 +390,9 @@ class TestRunPollCycle:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
+        mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
 
         with caplog.at_level("INFO"):
             await run_poll_cycle(mock_client, events, market_stats, valid_config)
@@ -265,6 +400,39 @@ class TestRunPollCycle:
         assert "Starting poll cycle for 2 events" in caplog.text
         assert "Poll cycle completed" in caplog.text
 
+    @pytest.mark.asyncio
+    async def test_poll_cycle_stops_when_no_events_remain(self, valid_config, caplog):
+        """Test the cycle skips Gamma and CLOB polling once nothing is monitored."""
+        with patch("src.main.fetch_all_events_raw", AsyncMock(return_value={})), \
+                patch("src.main.poll_all_events") as mock_poll, \
+                patch("src.main.run_clob_poll_cycle") as mock_clob:
+            with caplog.at_level("INFO"):
+                result = await run_poll_cycle(AsyncMock(), {}, {}, valid_config)
+
+        assert result == {}
+        mock_poll.assert_not_called()
+        mock_clob.assert_not_called()
+        assert "No events and no CLOB override remaining" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_closed_alerts_sent_when_polling_fails(self, valid_config):
+        """Test closed-market alerts still go out if the Gamma poll raises."""
+        events = {
+            "closed": MonitoredEvent(slug="closed", name="Closed", markets=[]),
+            "open": MonitoredEvent(slug="open", name="Open", markets=[]),
+        }
+        send_closed = AsyncMock()
+
+        with patch("src.main.fetch_all_events_raw", AsyncMock(return_value={})), \
+                patch("src.main.detect_closed_markets", return_value=(["alert"], ["closed"])), \
+                patch("src.main.send_all_closed_event_alerts", send_closed), \
+                patch("src.main.poll_all_events", AsyncMock(side_effect=RuntimeError("boom"))):
+            with pytest.raises(RuntimeError):
+                await run_poll_cycle(AsyncMock(), events, {}, valid_config)
+
+        send_closed.assert_awaited_once_with(["alert"], valid_config)
+        assert list(events) == ["open"]
+
 
 class TestMainAsync:
     """Tests for main_async function."""
@@ -316,6 +484,7 @@ telegram:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_client.get.return_value = mock_response
+            mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
             exit_code = await main_async()
@@ -339,27 +508,30 @@ telegram:
 """)
         monkeypatch.chdir(tmp_path)
 
-        # Reset shutdown flag
-        main_module.shutdown_requested = False
-
         with patch("src.poller.httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = gamma_api_response
+            mock_response.content = orjson.dumps(mock_response.json.return_value)
             mock_client.get.return_value = mock_response
+            mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
             # Set shutdown flag after a short delay
             async def trigger_shutdown():
                 await asyncio.sleep(0.1)
-                main_module.shutdown_requested = True
+                main_module.handle_shutdown(signal.SIGTERM)
 
-            # Run both concurrently
-            results = await asyncio.gather(
-                main_async(),
-                trigger_shutdown(),
-                return_exceptions=True,
+            # Run both concurrently; shutdown must interrupt the 10s poll
+            # interval rather than wait it out
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    main_async(),
+                    trigger_shutdown(),
+                    return_exceptions=True,
+                ),
+                timeout=5,
             )
 
             exit_code = results[0]
@@ -381,19 +553,20 @@ telegram:
   chat_id: "chatid"
 """)
         monkeypatch.chdir(tmp_path)
-        main_module.shutdown_requested = False
 
         with patch("src.poller.httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = gamma_api_response
+            mock_response.content = orjson.dumps(mock_response.json.return_value)
             mock_client.get.return_value = mock_response
+            mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
             async def trigger_shutdown():
                 await asyncio.sleep(0.1)
-                main_module.shutdown_requested = True
+                main_module.handle_shutdown(signal.SIGTERM)
 
             with caplog.at_level("INFO"):
                 await asyncio.gather(
@@ -405,6 +578,86 @@ telegram:
             assert "Loaded configuration" in caplog.text
 
 
+    @pytest.mark.asyncio
+    async def test_main_fetches_initial_events_concurrently(
+        self, tmp_path, monkeypatch, gamma_api_response, caplog
+    ):
+        """Test startup fetches all valid slugs concurrently."""
+        import src.main as main_module
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+slugs:
+  - "slug-a"
+  - "slug-b"
+  - "slug-c"
+poll_interval: 10
+spike_threshold: 5.0
+detectors: none
+telegram:
+  bot_token: "token"
+  chat_id: "chatid"
+""")
+        monkeypatch.chdir(tmp_path)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_fetch(client, slug):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return gamma_api_response
+
+        async def fake_validate(config, client=None):
+            return list(config.slugs)
+
+        async def fake_cycle(client, events, *args, **kwargs):
+            main_module.handle_shutdown(signal.SIGTERM)
+            return events
+
+        with patch("src.main.validate_slugs", fake_validate), \
+                patch("src.poller.fetch_event_by_slug", fake_fetch), \
+                patch("src.main.run_poll_cycle", fake_cycle), \
+                patch("src.main.get_clob_client") as mock_get_client:
+            mock_get_client.return_value.__aenter__.return_value = AsyncMock()
+
+            with caplog.at_level("INFO"):
+                exit_code = await main_async()
+
+        assert exit_code == 0
+        assert max_in_flight == 3
+        assert "Initialized 3 events for monitoring" in caplog.text
+
+
+    @pytest.mark.asyncio
+    async def test_main_closes_alerter_on_error(self, tmp_path, monkeypatch):
+        """Test the Telegram client is closed even if monitoring raises."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+slugs:
+  - "slug-a"
+poll_interval: 10
+spike_threshold: 5.0
+telegram:
+  bot_token: "token"
+  chat_id: "chatid"
+""")
+        monkeypatch.chdir(tmp_path)
+
+        with patch("src.main.validate_slugs", AsyncMock(side_effect=RuntimeError("boom"))), \
+                patch("src.main.close_alerter", new_callable=AsyncMock) as mock_close, \
+                patch("src.main.get_clob_client") as mock_get_client:
+            mock_get_client.return_value.__aenter__.return_value = AsyncMock()
+
+            with pytest.raises(RuntimeError):
+                await main_async()
+
+        mock_close.assert_awaited_once()
+
+
 class TestMain:
     """Tests for main function."""
 
@@ -449,24 +702,30 @@ telegram:
   chat_id: "chatid"
 """)
         monkeypatch.chdir(tmp_path)
-        main_module.shutdown_requested = False
 
-        with patch("signal.signal") as mock_signal:
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "add_signal_handler") as mock_add, \
+                patch.object(loop, "remove_signal_handler") as mock_remove:
             with patch("src.poller.httpx.AsyncClient") as mock_client_class:
                 mock_client = AsyncMock()
                 mock_response = MagicMock()
                 mock_response.status_code = 404
                 mock_client.get.return_value = mock_response
+                mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
                 mock_client_class.return_value.__aenter__.return_value = mock_client
 
                 await main_async()
 
-                # Check that signal handlers were registered
-                calls = mock_signal.call_args_list
-                signal_nums = [call[0][0] for call in calls]
+                # Check that signal handlers were registered on the loop
+                signal_nums = [call[0][0] for call in mock_add.call_args_list]
                 assert signal.SIGINT in signal_nums
                 assert signal.SIGTERM in signal_nums
 
+                # ...and removed again on exit
+                removed = [call[0][0] for call in mock_remove.call_args_list]
+                assert signal.SIGINT in removed
+                assert signal.SIGTERM in removed
+
 
 class TestPollCycleErrorHandling:
     """Tests for error handling in poll cycle."""
@@ -487,7 +746,6 @@ telegram:
   chat_id: "chatid"
 """)
         monkeypatch.chdir(tmp_path)
-        main_module.shutdown_requested = False
 
         call_count = 0
 
@@ -503,12 +761,14 @@ telegram:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = gamma_api_response
+            mock_response.content = orjson.dumps(mock_response.json.return_value)
             mock_client.get.return_value = mock_response
+            mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
             async def trigger_shutdown():
                 await asyncio.sleep(0.2)
-                main_module.shutdown_requested = True
+                main_module.handle_shutdown(signal.SIGTERM)
 
             with caplog.at_level("INFO"):
                 await asyncio.gather(
@@ -562,15 +822,18 @@ class TestDetectorConfiguration:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
+        mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_alert_client:
+        with patch("src.alerter._get_client") as mock_alert_client:
             alert_mock = AsyncMock()
             alert_response = MagicMock()
             alert_response.status_code = 200
             alert_response.json.return_value = {"ok": True}
+            alert_response.content = orjson.dumps(alert_response.json.return_value)
             alert_mock.post.return_value = alert_response
-            mock_alert_client.return_value.__aenter__.return_value = alert_mock
+            mock_alert_client.return_value = alert_mock
 
             market_stats = {}
             result = await run_poll_cycle(mock_client, events, market_stats, config)
@@ -611,7 +874,9 @@ class TestDetectorConfiguration:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
+        mock_client.post.return_value = MagicMock(status_code=404)  # No CLOB batch endpoints
 
         with caplog.at_level("INFO"):
             market_stats = {}
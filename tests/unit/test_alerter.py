@@ -1,5 +1,6 @@
 """Tests for src/alerter.py."""
 
+import orjson
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -14,12 +15,21 @@ from src.alerter import (
     format_mad_alert,
     format_zscore_alert,
     _escape_markdown,
+    clear_format_caches,
     send_telegram_alert,
     send_all_alerts,
     send_all_closed_event_alerts,
     send_all_liquidity_warnings,
     send_all_mad_alerts,
     send_all_zscore_alerts,
+    close_alerter,
+    _get_semaphore,
+    _get_client,
+    _send_url,
+    TokenBucket,
+    _tg_breaker,
+    BATCH_SEPARATOR,
+    batch_format,
     TELEGRAM_API_BASE,
 )
 
@@ -64,6 +74,22 @@ class TestEscapeMarkdown:
         result = _escape_markdown("")
         assert result == ""
 
+    def test_escape_is_memoized(self):
+        """Test repeated inputs are served from the cache."""
+        clear_format_caches()
+        _escape_markdown("Repeated_Event")
+        _escape_markdown("Repeated_Event")
+
+        info = _escape_markdown.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_clear_format_caches(self):
+        """Test clearing the formatting caches."""
+        _escape_markdown("cached")
+        clear_format_caches()
+        assert _escape_markdown.cache_info().currsize == 0
+
 
 class TestFormatAlertMessage:
     """Tests for format_alert_message function."""
@@ -108,8 +134,8 @@ class TestFormatAlertMessage:
         assert "2024-01-15 12:30:00" in message
 
     def test_format_alert_markdown(self, spike_alert):
-        """Test message uses Markdown formatting."""
-        message = format_alert_message(spike_alert)
+        """Test legacy Markdown mode uses Markdown formatting."""
+        message = format_alert_message(spike_alert, "Markdown")
         assert "*Event*:" in message
         assert "*Market*:" in message
         assert "*Price*:" in message
@@ -126,10 +152,34 @@ class TestFormatAlertMessage:
             direction="up",
             detected_at=datetime(2024, 1, 15, 12, 30, 0),
         )
-        message = format_alert_message(alert)
+        message = format_alert_message(alert, "Markdown")
         assert "\\_" in message
         assert "\\*" in message
 
+    def test_format_alert_html(self, spike_alert):
+        """Test message uses HTML formatting by default."""
+        message = format_alert_message(spike_alert)
+        assert "<b>Event</b>:" in message
+        assert "<b>Market</b>:" in message
+        assert "<b>Price</b>:" in message
+
+    def test_format_alert_html_escapes_special_chars(self):
+        """Test only HTML special characters are escaped in HTML mode."""
+        alert = SpikeAlert(
+            event_name="Rates <5% & falling_fast",
+            market_question="Question_with*special",
+            outcome="A & B",
+            price_before=0.50,
+            price_after=0.75,
+            change_percent=50.0,
+            direction="up",
+            detected_at=datetime(2024, 1, 15, 12, 30, 0),
+        )
+        message = format_alert_message(alert)
+        assert "Rates &lt;5% &amp; falling_fast" in message
+        assert "Question_with*special" in message
+        assert "<b>Outcome</b>: A &amp; B" in message
+
 
 class TestSendTelegramAlert:
     """Tests for send_telegram_alert function."""
@@ -137,10 +187,10 @@ class TestSendTelegramAlert:
     @pytest.mark.asyncio
     async def test_send_alert_success(self, mock_telegram_success_response):
         """Test successful alert sending."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await send_telegram_alert(
                 bot_token="test-token",
@@ -154,10 +204,10 @@ class TestSendTelegramAlert:
     @pytest.mark.asyncio
     async def test_send_alert_api_error(self, mock_telegram_error_response):
         """Test handling Telegram API error response."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_error_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await send_telegram_alert(
                 bot_token="test-token",
@@ -170,12 +220,13 @@ class TestSendTelegramAlert:
     @pytest.mark.asyncio
     async def test_send_alert_http_error(self):
         """Test handling HTTP error status codes."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter.asyncio.sleep", new_callable=AsyncMock):
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await send_telegram_alert(
                 bot_token="test-token",
@@ -184,16 +235,18 @@ class TestSendTelegramAlert:
             )
 
             assert result is False
+            assert mock_client.post.call_count == 3
 
     @pytest.mark.asyncio
     async def test_send_alert_rate_limited(self):
         """Test handling rate limiting (429)."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter.asyncio.sleep", new_callable=AsyncMock):
             mock_response = MagicMock()
             mock_response.status_code = 429
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await send_telegram_alert(
                 bot_token="test-token",
@@ -202,14 +255,184 @@ class TestSendTelegramAlert:
             )
 
             assert result is False
+            assert mock_client.post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_send_alert_rate_limited_then_success(self, mock_telegram_success_response):
+        """Test 429 is retried after the Retry-After delay."""
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            rate_limited = MagicMock()
+            rate_limited.status_code = 429
+            rate_limited.headers = {"retry-after": "7"}
+            mock_client = AsyncMock()
+            mock_client.post.side_effect = [rate_limited, mock_telegram_success_response]
+            mock_get_client.return_value = mock_client
+
+            result = await send_telegram_alert(
+                bot_token="test-token",
+                chat_id="test-chat",
+                message="Test message",
+            )
+
+            assert result is True
+            assert mock_client.post.call_count == 2
+            mock_sleep.assert_called_once_with(7.0)
+
+    @pytest.mark.asyncio
+    async def test_send_alert_malformed_response(self):
+        """Test an unparsable 200 response is treated as a failure."""
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = b"<html>"
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_response
+            mock_get_client.return_value = mock_client
+
+            result = await send_telegram_alert(
+                bot_token="test-token",
+                chat_id="test-chat",
+                message="Test message",
+            )
+
+            assert result is False
+
+    @pytest.mark.asyncio
+    async def test_send_alert_client_error_not_retried(self):
+        """Test 4xx errors other than 429 fail without retrying."""
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_response = MagicMock()
+            mock_response.status_code = 400
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_response
+            mock_get_client.return_value = mock_client
+
+            result = await send_telegram_alert(
+                bot_token="test-token",
+                chat_id="test-chat",
+                message="Test message",
+            )
+
+            assert result is False
+            mock_client.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_send_alert_circuit_open_fails_fast(self):
+        """Test sends are skipped without a request while the circuit is open."""
+        for _ in range(_tg_breaker.failure_threshold):
+            _tg_breaker.record(False)
+
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_get_client.return_value = mock_client
+
+            result = await send_telegram_alert(
+                bot_token="test-token",
+                chat_id="test-chat",
+                message="Test message",
+            )
+
+            assert result is False
+            mock_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_rate_limits_do_not_open_circuit(self, mock_telegram_success_response):
+        """Test a burst of 429s with Retry-After still delivers every alert."""
+        import asyncio
+
+        real_sleep = asyncio.sleep
+        seen = set()
+
+        async def post(url, content=None, **kwargs):
+            # Yield so every concurrent send gets its 429 before any retries
+            await real_sleep(0)
+            if content not in seen:
+                seen.add(content)
+                rate_limited = MagicMock()
+                rate_limited.status_code = 429
+                rate_limited.headers = {"retry-after": "3"}
+                return rate_limited
+            return mock_telegram_success_response
+
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = post
+        count = _tg_breaker.failure_threshold * 2
+
+        with patch("src.alerter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+                patch("src.alerter._bucket", TokenBucket(rate=1000.0, capacity=1000)):
+            results = await asyncio.gather(*(
+                send_telegram_alert("test-token", "test-chat", f"message {i}", client=mock_client)
+                for i in range(count)
+            ))
+
+        assert results == [True] * count
+        assert _tg_breaker.allow() is True
+        mock_sleep.assert_any_call(3.0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_does_not_wedge_circuit(self, mock_telegram_success_response):
+        """Test a half-open probe cancelled before recording lets a later probe through."""
+        import asyncio
+
+        with patch("src.circuit_breaker.time.monotonic", return_value=100.0):
+            for _ in range(_tg_breaker.failure_threshold):
+                _tg_breaker.record(False)
+
+        blocked = asyncio.Event()
+        blocking_bucket = MagicMock()
+        blocking_bucket.acquire = AsyncMock(side_effect=blocked.wait)
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_telegram_success_response
+
+        # The probe is granted, then cancelled while waiting for a rate-limit token
+        with patch("src.circuit_breaker.time.monotonic", return_value=200.0), \
+                patch("src.alerter._bucket", blocking_bucket):
+            probe = asyncio.create_task(
+                send_telegram_alert("test-token", "test-chat", "probe", client=mock_client)
+            )
+            await asyncio.sleep(0)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+        with patch("src.circuit_breaker.time.monotonic", return_value=200.0 + _tg_breaker.reset_timeout), \
+                patch("src.alerter._bucket", TokenBucket(rate=1000.0, capacity=1000)):
+            result = await send_telegram_alert("test-token", "test-chat", "retry", client=mock_client)
+
+        assert result is True
+        assert _tg_breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_send_alert_server_errors_open_circuit(self):
+        """Test repeated 5xx responses open the circuit and stop retrying."""
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter.asyncio.sleep", new_callable=AsyncMock):
+            mock_response = MagicMock()
+            mock_response.status_code = 503
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_response
+            mock_get_client.return_value = mock_client
+
+            result = await send_telegram_alert(
+                bot_token="test-token",
+                chat_id="test-chat",
+                message="Test message",
+                max_retries=10,
+            )
+
+            assert result is False
+            assert mock_client.post.call_count == _tg_breaker.failure_threshold
+            assert _tg_breaker.allow() is False
 
     @pytest.mark.asyncio
     async def test_send_alert_timeout(self):
         """Test handling timeout exception."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter.asyncio.sleep", new_callable=AsyncMock):
             mock_client = AsyncMock()
             mock_client.post.side_effect = httpx.TimeoutException("Timeout")
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await send_telegram_alert(
                 bot_token="test-token",
@@ -218,14 +441,16 @@ class TestSendTelegramAlert:
             )
 
             assert result is False
+            assert mock_client.post.call_count == 3
 
     @pytest.mark.asyncio
     async def test_send_alert_request_error(self):
         """Test handling request error."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter.asyncio.sleep", new_callable=AsyncMock):
             mock_client = AsyncMock()
             mock_client.post.side_effect = httpx.RequestError("Connection failed")
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await send_telegram_alert(
                 bot_token="test-token",
@@ -234,14 +459,15 @@ class TestSendTelegramAlert:
             )
 
             assert result is False
+            assert mock_client.post.call_count == 3
 
     @pytest.mark.asyncio
     async def test_send_alert_correct_url(self, mock_telegram_success_response):
         """Test correct Telegram API URL is used."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await send_telegram_alert(
                 bot_token="my-token",
@@ -253,13 +479,21 @@ class TestSendTelegramAlert:
             url = call_args[0][0]
             assert url == f"{TELEGRAM_API_BASE}/botmy-token/sendMessage"
 
+    def test_send_url_is_cached(self):
+        """Test the sendMessage URL is built once per token."""
+        _send_url.cache_clear()
+
+        assert _send_url("tok") == f"{TELEGRAM_API_BASE}/bottok/sendMessage"
+        assert _send_url("tok") is _send_url("tok")
+        assert _send_url.cache_info().misses == 1
+
     @pytest.mark.asyncio
     async def test_send_alert_correct_payload(self, mock_telegram_success_response):
         """Test correct payload is sent."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await send_telegram_alert(
                 bot_token="token",
@@ -268,10 +502,122 @@ class TestSendTelegramAlert:
             )
 
             call_args = mock_client.post.call_args
-            payload = call_args.kwargs["json"]
+            payload = orjson.loads(call_args.kwargs["content"])
             assert payload["chat_id"] == "chat123"
             assert payload["text"] == "Test message"
-            assert payload["parse_mode"] == "Markdown"
+            assert payload["parse_mode"] == "HTML"
+
+    @pytest.mark.asyncio
+    async def test_send_alert_uses_provided_client(self, mock_telegram_success_response):
+        """Test an explicitly passed client is used instead of the shared one."""
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_telegram_success_response
+
+            result = await send_telegram_alert(
+                bot_token="token",
+                chat_id="chat",
+                message="Test",
+                client=mock_client,
+            )
+
+            assert result is True
+            mock_client.post.assert_called_once()
+            mock_get_client.assert_not_called()
+
+
+class TestSharedClient:
+    """Tests for the shared Telegram HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_instance(self):
+        """Test the shared client is created once and reused."""
+        await close_alerter()
+        client = _get_client()
+        try:
+            assert _get_client() is client
+        finally:
+            await close_alerter()
+
+    @pytest.mark.asyncio
+    async def test_close_alerter_recreates_client(self):
+        """Test closing the alerter discards the shared client."""
+        await close_alerter()
+        client = _get_client()
+        await close_alerter()
+
+        assert client.is_closed
+        new_client = _get_client()
+        try:
+            assert new_client is not client
+        finally:
+            await close_alerter()
+
+    @pytest.mark.asyncio
+    async def test_close_alerter_drops_semaphore(self, valid_config):
+        """Test the send semaphore is shared until the alerter is closed."""
+        semaphore = _get_semaphore(valid_config)
+        assert _get_semaphore(valid_config) is semaphore
+
+        await close_alerter()
+
+        assert _get_semaphore(valid_config) is not semaphore
+
+    @pytest.mark.asyncio
+    async def test_send_all_alerts_single_client(self, valid_config, spike_alert, mock_telegram_success_response):
+        """Test send_all_alerts fetches the shared client once per batch."""
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_telegram_success_response
+            mock_get_client.return_value = mock_client
+
+            await send_all_alerts([spike_alert, spike_alert, spike_alert], valid_config)
+
+            assert mock_get_client.call_count == 1
+            assert mock_client.post.call_count == 3
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_sleep(self):
+        """Test acquiring up to capacity never sleeps."""
+        bucket = TokenBucket(rate=10.0, capacity=5)
+
+        with patch("src.alerter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            for _ in range(5):
+                await bucket.acquire()
+
+            mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_beyond_capacity_sleeps(self):
+        """Test acquiring past capacity waits for refill."""
+        with patch("src.alerter.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=10.0, capacity=2)
+
+            with patch("src.alerter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                await bucket.acquire()
+                await bucket.acquire()
+                await bucket.acquire()
+                await bucket.acquire()
+
+                delays = [call.args[0] for call in mock_sleep.call_args_list]
+                assert delays == pytest.approx([0.1, 0.2])
+
+    @pytest.mark.asyncio
+    async def test_tokens_refill_over_time(self):
+        """Test tokens refill based on elapsed time, capped at capacity."""
+        with patch("src.alerter.time.monotonic") as mock_time:
+            mock_time.return_value = 100.0
+            bucket = TokenBucket(rate=10.0, capacity=2)
+            await bucket.acquire(2)
+
+            mock_time.return_value = 200.0
+            with patch("src.alerter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                await bucket.acquire(2)
+                mock_sleep.assert_not_called()
 
 
 class TestSendAllAlerts:
@@ -282,32 +628,78 @@ class TestSendAllAlerts:
         """Test sending multiple alerts successfully."""
         alerts = [spike_alert, spike_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_alerts(alerts, valid_config)
 
             assert count == 2
             assert mock_client.post.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_send_all_alerts_legacy_markdown_mode(self, valid_config, spike_alert, mock_telegram_success_response):
+        """Test telegram_parse_mode selects the Markdown templates and payload mode."""
+        valid_config.telegram_parse_mode = "Markdown"
+
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_telegram_success_response
+            mock_get_client.return_value = mock_client
+
+            await send_all_alerts([spike_alert], valid_config)
+
+            payload = orjson.loads(mock_client.post.call_args.kwargs["content"])
+            assert payload["parse_mode"] == "Markdown"
+            assert "*Event*:" in payload["text"]
+
+    @pytest.mark.asyncio
+    async def test_send_all_alerts_logs_unexpected_error(self, valid_config, spike_alert, caplog):
+        """Test an exception raised while sending is included in the failure log."""
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post.side_effect = RuntimeError("kaboom")
+            mock_get_client.return_value = mock_client
+
+            count = await send_all_alerts([spike_alert], valid_config)
+
+        assert count == 0
+        assert "Failed to send alert for" in caplog.text
+        assert "kaboom" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_batched_send_logs_unexpected_error(self, valid_config, spike_alert, caplog):
+        """Test an exception raised while sending a batch is included in the failure log."""
+        valid_config.telegram_batch_alerts = True
+
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post.side_effect = RuntimeError("kaboom")
+            mock_get_client.return_value = mock_client
+
+            count = await send_all_alerts([spike_alert, spike_alert], valid_config)
+
+        assert count == 0
+        assert "Failed to send batch of 2 alerts: kaboom" in caplog.text
+
     @pytest.mark.asyncio
     async def test_send_all_alerts_partial_failure(self, valid_config, spike_alert):
         """Test sending alerts with partial failures."""
         alerts = [spike_alert, spike_alert, spike_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             success_response = MagicMock()
             success_response.status_code = 200
             success_response.json.return_value = {"ok": True}
 
+            success_response.content = orjson.dumps(success_response.json.return_value)
             error_response = MagicMock()
-            error_response.status_code = 500
+            error_response.status_code = 400
 
             mock_client = AsyncMock()
             mock_client.post.side_effect = [success_response, error_response, success_response]
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_alerts(alerts, valid_config)
 
@@ -324,10 +716,11 @@ class TestSendAllAlerts:
         """Test when all alerts fail to send."""
         alerts = [spike_alert, spike_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter.asyncio.sleep", new_callable=AsyncMock):
             mock_client = AsyncMock()
             mock_client.post.side_effect = httpx.TimeoutException("Timeout")
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_alerts(alerts, valid_config)
 
@@ -344,16 +737,16 @@ class TestSendAllAlerts:
             telegram_chat_id="config-chat-456",
         )
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await send_all_alerts([spike_alert], config)
 
             call_args = mock_client.post.call_args
             url = call_args[0][0]
-            payload = call_args.kwargs["json"]
+            payload = orjson.loads(call_args.kwargs["content"])
 
             assert "config-token-123" in url
             assert payload["chat_id"] == "config-chat-456"
@@ -361,10 +754,10 @@ class TestSendAllAlerts:
     @pytest.mark.asyncio
     async def test_send_all_alerts_logging(self, valid_config, spike_alert, mock_telegram_success_response, caplog):
         """Test logging during alert sending."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with caplog.at_level("INFO"):
                 await send_all_alerts([spike_alert], valid_config)
@@ -372,6 +765,87 @@ class TestSendAllAlerts:
             assert "Sent 1/1 alerts" in caplog.text
 
 
+    @pytest.mark.asyncio
+    async def test_send_all_alerts_bounded_concurrency(self, spike_alert):
+        """Test concurrent sends never exceed telegram_concurrency."""
+        import asyncio
+
+        config = Configuration(
+            slugs=["slug"],
+            poll_interval=60,
+            spike_threshold=5.0,
+            telegram_bot_token="token",
+            telegram_chat_id="chat",
+            telegram_concurrency=2,
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"ok": True}
+            response.content = orjson.dumps(response.json.return_value)
+            return response
+
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter._bucket", TokenBucket(rate=1000.0, capacity=1000)):
+            mock_client = AsyncMock()
+            mock_client.post.side_effect = slow_post
+            mock_get_client.return_value = mock_client
+
+            count = await send_all_alerts([spike_alert] * 5, config)
+
+            assert count == 5
+            assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_share_concurrency_bound(self, spike_alert):
+        """Test batches sent at the same time share one telegram_concurrency bound."""
+        import asyncio
+
+        config = Configuration(
+            slugs=["slug"],
+            poll_interval=60,
+            spike_threshold=5.0,
+            telegram_bot_token="token",
+            telegram_chat_id="chat",
+            telegram_concurrency=2,
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.status_code = 200
+            response.content = orjson.dumps({"ok": True})
+            return response
+
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter._bucket", TokenBucket(rate=1000.0, capacity=1000)):
+            mock_client = AsyncMock()
+            mock_client.post.side_effect = slow_post
+            mock_get_client.return_value = mock_client
+
+            counts = await asyncio.gather(
+                send_all_alerts([spike_alert] * 3, config),
+                send_all_alerts([spike_alert] * 3, config),
+            )
+
+            assert counts == [3, 3]
+            assert max_in_flight == 2
+
+
 class TestFormatLiquidityWarningMessage:
     """Tests for format_liquidity_warning_message function."""
 
@@ -420,8 +894,8 @@ class TestFormatLiquidityWarningMessage:
         assert "2024-01-15 12:30:00" in message
 
     def test_format_warning_markdown(self, liquidity_warning):
-        """Test message uses Markdown formatting."""
-        message = format_liquidity_warning_message(liquidity_warning)
+        """Test legacy Markdown mode uses Markdown formatting."""
+        message = format_liquidity_warning_message(liquidity_warning, "Markdown")
         assert "*Event*:" in message
         assert "*Market*:" in message
         assert "*Price*:" in message
@@ -443,7 +917,7 @@ class TestFormatLiquidityWarningMessage:
             liquidity=80000.0,
             detected_at=datetime(2024, 1, 15, 12, 30, 0),
         )
-        message = format_liquidity_warning_message(warning)
+        message = format_liquidity_warning_message(warning, "Markdown")
         assert "\\_" in message
         assert "\\*" in message
 
@@ -461,10 +935,10 @@ class TestSendAllLiquidityWarnings:
         """Test sending multiple warnings successfully."""
         warnings = [liquidity_warning, liquidity_warning]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_liquidity_warnings(warnings, valid_config)
 
@@ -476,17 +950,18 @@ class TestSendAllLiquidityWarnings:
         """Test sending warnings with partial failures."""
         warnings = [liquidity_warning, liquidity_warning, liquidity_warning]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             success_response = MagicMock()
             success_response.status_code = 200
             success_response.json.return_value = {"ok": True}
 
+            success_response.content = orjson.dumps(success_response.json.return_value)
             error_response = MagicMock()
-            error_response.status_code = 500
+            error_response.status_code = 400
 
             mock_client = AsyncMock()
             mock_client.post.side_effect = [success_response, error_response, success_response]
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_liquidity_warnings(warnings, valid_config)
 
@@ -503,10 +978,11 @@ class TestSendAllLiquidityWarnings:
         """Test when all warnings fail to send."""
         warnings = [liquidity_warning, liquidity_warning]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client, \
+                patch("src.alerter.asyncio.sleep", new_callable=AsyncMock):
             mock_client = AsyncMock()
             mock_client.post.side_effect = httpx.TimeoutException("Timeout")
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_liquidity_warnings(warnings, valid_config)
 
@@ -523,16 +999,16 @@ class TestSendAllLiquidityWarnings:
             telegram_chat_id="config-chat-456",
         )
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await send_all_liquidity_warnings([liquidity_warning], config)
 
             call_args = mock_client.post.call_args
             url = call_args[0][0]
-            payload = call_args.kwargs["json"]
+            payload = orjson.loads(call_args.kwargs["content"])
 
             assert "config-token-123" in url
             assert payload["chat_id"] == "config-chat-456"
@@ -540,10 +1016,10 @@ class TestSendAllLiquidityWarnings:
     @pytest.mark.asyncio
     async def test_send_warnings_logging(self, valid_config, liquidity_warning, mock_telegram_success_response, caplog):
         """Test logging during warning sending."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with caplog.at_level("INFO"):
                 await send_all_liquidity_warnings([liquidity_warning], valid_config)
@@ -617,12 +1093,19 @@ class TestFormatZScoreAlert:
         assert "100" in message  # MAD
 
     def test_format_zscore_alert_markdown(self, zscore_alert):
-        """Test message uses Markdown formatting."""
-        message = format_zscore_alert(zscore_alert)
+        """Test legacy Markdown mode uses Markdown formatting."""
+        message = format_zscore_alert(zscore_alert, "Markdown")
         # Without event_name, uses *Token*: format
         assert "*Token*:" in message
         assert "*Z-Score*:" in message
 
+    def test_format_zscore_alert_html(self, zscore_alert):
+        """Test message uses HTML formatting by default."""
+        message = format_zscore_alert(zscore_alert)
+        assert "<b>Token</b>:" in message
+        assert "<i>(event details unavailable)</i>" in message
+        assert "<b>Z-Score</b>:" in message
+
 
 class TestFormatMADAlert:
     """Tests for format_mad_alert function."""
@@ -675,8 +1158,8 @@ class TestFormatMADAlert:
         assert "3.0x MAD" in message
 
     def test_format_mad_alert_markdown(self, mad_alert):
-        """Test message uses Markdown formatting."""
-        message = format_mad_alert(mad_alert)
+        """Test legacy Markdown mode uses Markdown formatting."""
+        message = format_mad_alert(mad_alert, "Markdown")
         # Without event_name, uses *Token*: format
         assert "*Token*:" in message
         assert "*Deviation*:" in message
@@ -705,10 +1188,10 @@ class TestSendAllZScoreAlerts:
         """Test sending multiple Z-score alerts successfully."""
         alerts = [zscore_alert, zscore_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_zscore_alerts(alerts, valid_config)
 
@@ -726,17 +1209,18 @@ class TestSendAllZScoreAlerts:
         """Test sending Z-score alerts with partial failures."""
         alerts = [zscore_alert, zscore_alert, zscore_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             success_response = MagicMock()
             success_response.status_code = 200
             success_response.json.return_value = {"ok": True}
 
+            success_response.content = orjson.dumps(success_response.json.return_value)
             error_response = MagicMock()
-            error_response.status_code = 500
+            error_response.status_code = 400
 
             mock_client = AsyncMock()
             mock_client.post.side_effect = [success_response, error_response, success_response]
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_zscore_alerts(alerts, valid_config)
 
@@ -745,10 +1229,10 @@ class TestSendAllZScoreAlerts:
     @pytest.mark.asyncio
     async def test_send_zscore_alerts_logging(self, valid_config, zscore_alert, mock_telegram_success_response, caplog):
         """Test logging during Z-score alert sending."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with caplog.at_level("INFO"):
                 await send_all_zscore_alerts([zscore_alert], valid_config)
@@ -779,10 +1263,10 @@ class TestSendAllMADAlerts:
         """Test sending multiple MAD alerts successfully."""
         alerts = [mad_alert, mad_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_mad_alerts(alerts, valid_config)
 
@@ -800,17 +1284,18 @@ class TestSendAllMADAlerts:
         """Test sending MAD alerts with partial failures."""
         alerts = [mad_alert, mad_alert, mad_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             success_response = MagicMock()
             success_response.status_code = 200
             success_response.json.return_value = {"ok": True}
 
+            success_response.content = orjson.dumps(success_response.json.return_value)
             error_response = MagicMock()
-            error_response.status_code = 500
+            error_response.status_code = 400
 
             mock_client = AsyncMock()
             mock_client.post.side_effect = [success_response, error_response, success_response]
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_mad_alerts(alerts, valid_config)
 
@@ -819,10 +1304,10 @@ class TestSendAllMADAlerts:
     @pytest.mark.asyncio
     async def test_send_mad_alerts_logging(self, valid_config, mad_alert, mock_telegram_success_response, caplog):
         """Test logging during MAD alert sending."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with caplog.at_level("INFO"):
                 await send_all_mad_alerts([mad_alert], valid_config)
@@ -864,8 +1349,8 @@ class TestFormatClosedEventAlert:
         assert "2024-01-15 12:30:00" in message
 
     def test_format_closed_event_alert_markdown(self, closed_event_alert):
-        """Test message uses Markdown formatting."""
-        message = format_closed_event_alert(closed_event_alert)
+        """Test legacy Markdown mode uses Markdown formatting."""
+        message = format_closed_event_alert(closed_event_alert, "Markdown")
         assert "*Event*:" in message
         assert "*Market*:" in message
         assert "*Final Price*:" in message
@@ -885,10 +1370,16 @@ class TestFormatClosedEventAlert:
             final_price=0.95,
             detected_at=datetime(2024, 1, 15, 12, 30, 0),
         )
-        message = format_closed_event_alert(alert)
+        message = format_closed_event_alert(alert, "Markdown")
         assert "\\_" in message
         assert "\\*" in message
 
+    def test_format_closed_event_alert_html(self, closed_event_alert):
+        """Test message uses HTML formatting by default."""
+        message = format_closed_event_alert(closed_event_alert)
+        assert "<b>Event</b>:" in message
+        assert "<b>Final Price</b>:" in message
+
 
 class TestSendAllClosedEventAlerts:
     """Tests for send_all_closed_event_alerts function."""
@@ -898,10 +1389,10 @@ class TestSendAllClosedEventAlerts:
         """Test sending multiple closed event alerts successfully."""
         alerts = [closed_event_alert, closed_event_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_closed_event_alerts(alerts, valid_config)
 
@@ -919,17 +1410,18 @@ class TestSendAllClosedEventAlerts:
         """Test sending closed event alerts with partial failures."""
         alerts = [closed_event_alert, closed_event_alert, closed_event_alert]
 
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             success_response = MagicMock()
             success_response.status_code = 200
             success_response.json.return_value = {"ok": True}
 
+            success_response.content = orjson.dumps(success_response.json.return_value)
             error_response = MagicMock()
-            error_response.status_code = 500
+            error_response.status_code = 400
 
             mock_client = AsyncMock()
             mock_client.post.side_effect = [success_response, error_response, success_response]
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             count = await send_all_closed_event_alerts(alerts, valid_config)
 
@@ -938,10 +1430,10 @@ class TestSendAllClosedEventAlerts:
     @pytest.mark.asyncio
     async def test_send_closed_alerts_logging(self, valid_config, closed_event_alert, mock_telegram_success_response, caplog):
         """Test logging during closed event alert sending."""
-        with patch("src.alerter.httpx.AsyncClient") as mock_client_class:
+        with patch("src.alerter._get_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_telegram_success_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with caplog.at_level("INFO"):
                 await send_all_closed_event_alerts([closed_event_alert], valid_config)
@@ -955,3 +1447,68 @@ class TestSendAllClosedEventAlerts:
             await send_all_closed_event_alerts([], valid_config)
 
         assert "closed event alerts" not in caplog.text
+
+
+class TestBatchFormat:
+    """Tests for batch_format function."""
+
+    def test_batch_combines_messages(self):
+        """Test short messages are combined into one."""
+        result = batch_format(["one", "two", "three"])
+        assert result == [BATCH_SEPARATOR.join(["one", "two", "three"])]
+
+    def test_batch_respects_limit(self):
+        """Test combined messages never exceed the limit."""
+        messages = ["x" * 40] * 5
+        result = batch_format(messages, limit=100)
+
+        assert len(result) == 3
+        assert all(len(batch) <= 100 for batch in result)
+        assert sum(batch.count("x" * 40) for batch in result) == 5
+
+    def test_batch_oversized_message_kept_alone(self):
+        """Test a single message longer than the limit gets its own batch."""
+        result = batch_format(["short", "y" * 200, "tail"], limit=100)
+        assert result == ["short", "y" * 200, "tail"]
+
+    def test_batch_empty(self):
+        """Test empty input yields no batches."""
+        assert batch_format([]) == []
+
+
+class TestSendAllBatched:
+    """Tests for sending alerts with telegram_batch_alerts enabled."""
+
+    @pytest.mark.asyncio
+    async def test_batched_send_uses_single_message(self, valid_config, spike_alert, mock_telegram_success_response):
+        """Test several alerts are sent in one Telegram message."""
+        valid_config.telegram_batch_alerts = True
+
+        with patch("src.alerter._get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_telegram_success_response
+            mock_get_client.return_value = mock_client
+
+            count = await send_all_alerts([spike_alert] * 3, valid_config)
+
+            assert count == 3
+            mock_client.post.assert_called_once()
+            text = orjson.loads(mock_client.post.call_args.kwargs["content"])["text"]
+            assert text.count("Price Spike Detected") == 3
+
+    @pytest.mark.asyncio
+    async def test_batched_send_failure_counts_whole_batch(self, valid_config, spike_alert, caplog):
+        """Test a failed batch counts none of its alerts as sent."""
+        valid_config.telegram_batch_alerts = True
+
+        with patch("src.alerter._get_client") as mock_get_client:
+            error_response = MagicMock()
+            error_response.status_code = 400
+            mock_client = AsyncMock()
+            mock_client.post.return_value = error_response
+            mock_get_client.return_value = mock_client
+
+            count = await send_all_alerts([spike_alert] * 2, valid_config)
+
+            assert count == 0
+            assert "Failed to send batch of 2 alerts" in caplog.text
@@ -0,0 +1,99 @@
+"""Tests for the circuit breaker module."""
+
+from unittest.mock import patch
+
+from src.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_starts_closed(self):
+        """Test a new breaker allows calls."""
+        breaker = CircuitBreaker("test")
+        assert breaker.state == CLOSED
+        assert breaker.allow() is True
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the breaker."""
+        breaker = CircuitBreaker("test", failure_threshold=3)
+
+        breaker.record(False)
+        breaker.record(False)
+        assert breaker.allow() is True
+
+        breaker.record(False)
+        assert breaker.state == OPEN
+        assert breaker.allow() is False
+
+    def test_success_resets_failure_count(self):
+        """Test a success in between failures keeps the breaker closed."""
+        breaker = CircuitBreaker("test", failure_threshold=3)
+
+        breaker.record(False)
+        breaker.record(False)
+        breaker.record(True)
+        breaker.record(False)
+        breaker.record(False)
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_after_timeout_allows_single_probe(self):
+        """Test one probe is allowed once reset_timeout has elapsed."""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30.0)
+
+        with patch("src.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record(False)
+        with patch("src.circuit_breaker.time.monotonic", return_value=120.0):
+            assert breaker.allow() is False
+        with patch("src.circuit_breaker.time.monotonic", return_value=131.0):
+            assert breaker.allow() is True
+            assert breaker.state == HALF_OPEN
+            assert breaker.allow() is False
+
+    def test_unreported_probe_times_out(self):
+        """Test a new probe is allowed if the previous one never records a result."""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30.0)
+
+        with patch("src.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record(False)
+        with patch("src.circuit_breaker.time.monotonic", return_value=131.0):
+            assert breaker.allow() is True
+        with patch("src.circuit_breaker.time.monotonic", return_value=150.0):
+            assert breaker.allow() is False
+        with patch("src.circuit_breaker.time.monotonic", return_value=161.0):
+            assert breaker.allow() is True
+            assert breaker.state == HALF_OPEN
+
+    def test_successful_probe_closes(self):
+        """Test a successful half-open probe closes the breaker."""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.0)
+        breaker.record(False)
+
+        assert breaker.allow() is True
+        breaker.record(True)
+
+        assert breaker.state == CLOSED
+        assert breaker.allow() is True
+
+    def test_failed_probe_reopens(self):
+        """Test a failed half-open probe reopens the breaker."""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30.0)
+
+        with patch("src.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record(False)
+        with patch("src.circuit_breaker.time.monotonic", return_value=131.0):
+            assert breaker.allow() is True
+            breaker.record(False)
+            assert breaker.state == OPEN
+            assert breaker.allow() is False
+
+    def test_reset(self):
+        """Test reset closes an open breaker."""
+        breaker = CircuitBreaker("test", failure_threshold=1)
+        breaker.record(False)
+
+        breaker.reset()
+
+        assert breaker.state == CLOSED
+        assert breaker.allow() is True
@@ -3,13 +3,17 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import orjson
 import pytest
 
 from src.clob_client import (
     CLOB_API_BASE,
+    _clob_breaker,
     calculate_book_volume,
     fetch_book,
+    fetch_books_batch,
     fetch_midpoint,
+    fetch_midpoints_batch,
     fetch_price,
     poll_clob_markets,
 )
@@ -27,6 +31,7 @@ def create_mock_response(status_code: int, json_data: dict | None = None):
     mock_response.status_code = status_code
     if json_data is not None:
         mock_response.json.return_value = json_data
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
     mock_response.raise_for_status = MagicMock()
     return mock_response
 
@@ -107,14 +112,50 @@ class TestFetchPriceErrors:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_fetch_price_circuit_open_fails_fast(self, mock_client):
+        """Test fetches are skipped without a request while the circuit is open."""
+        for _ in range(_clob_breaker.failure_threshold):
+            _clob_breaker.record(False)
+
+        result = await fetch_price(mock_client, "token123")
+
+        assert result is None
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_request_errors_open_circuit(self, mock_client):
+        """Test repeated request errors open the circuit for later fetches."""
+        mock_client.get.side_effect = httpx.RequestError("Connection failed")
+
+        with patch("src.clob_client.asyncio.sleep", new_callable=AsyncMock):
+            await fetch_price(mock_client, "token1", max_retries=3)
+            await fetch_midpoint(mock_client, "token2", max_retries=3)
+            result = await fetch_book(mock_client, "token3", max_retries=3)
+
+        assert result is None
+        assert mock_client.get.call_count == _clob_breaker.failure_threshold
+
+    @pytest.mark.asyncio
+    async def test_not_found_does_not_trip_circuit(self, mock_client):
+        """Test 404 responses count as a healthy endpoint."""
+        mock_client.get.return_value = create_mock_response(404)
+
+        for _ in range(_clob_breaker.failure_threshold + 1):
+            await fetch_price(mock_client, "missing")
+
+        assert _clob_breaker.allow() is True
+
     @pytest.mark.asyncio
     async def test_fetch_price_value_error(self, mock_client):
         """Test fetch_price handles invalid price values."""
         mock_response = create_mock_response(200, {"price": "invalid"})
         mock_response.json.return_value = {"price": "invalid"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         # Simulate ValueError when converting price
         original_json = mock_response.json.return_value
         mock_response.json.return_value = {"price": "not_a_number"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
 
         result = await fetch_price(mock_client, "token123", max_retries=1)
@@ -348,6 +389,12 @@ class TestCalculateBookVolume:
         result = calculate_book_volume(book)
         assert result == 50.0
 
+    def test_calculate_book_volume_null_side(self):
+        """Test volume calculation treats a null side as empty."""
+        book = {"bids": None, "asks": [{"price": "0.66", "size": "25"}]}
+        result = calculate_book_volume(book)
+        assert result == 25.0
+
 
 class TestPollClobMarkets:
     """Tests for poll_clob_markets function."""
@@ -364,6 +411,9 @@ class TestPollClobMarkets:
             "asks": [{"price": "0.66", "size": "100.00"}],
         })
 
+        # Batch endpoints unavailable - fall back to per-token calls
+        mock_client.post.return_value = create_mock_response(404)
+
         # Alternate between midpoint and book calls
         mock_client.get.side_effect = [
             mock_mid_response,
@@ -376,3 +426,144 @@ class TestPollClobMarkets:
         price, volume = result["market1"]
         assert price == 0.65
         assert volume == 200.0
+
+    @pytest.mark.asyncio
+    async def test_poll_clob_markets_multiple(self, mock_client):
+        """Test results are matched to the right market when fetched concurrently."""
+
+        async def fake_get(url, params=None, timeout=None):
+            token_id = params["token_id"]
+            if url.endswith("/midpoint"):
+                return create_mock_response(200, {"mid": "0.5" if token_id == "m1" else "0.25"})
+            size = "10" if token_id == "m1" else "20"
+            return create_mock_response(200, {"bids": [{"size": size}], "asks": []})
+
+        mock_client.post.return_value = create_mock_response(404)
+        mock_client.get.side_effect = fake_get
+
+        result = await poll_clob_markets(mock_client, ["m1", "m2"])
+
+        assert result == {"m1": (0.5, 10.0), "m2": (0.25, 20.0)}
+
+    @pytest.mark.asyncio
+    async def test_poll_clob_markets_bounded_concurrency(self, mock_client):
+        """Test in-flight requests never exceed max_concurrency."""
+        import asyncio
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_get(url, params=None, timeout=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return create_mock_response(200, {"mid": "0.5", "bids": [], "asks": []})
+
+        mock_client.post.return_value = create_mock_response(404)
+        mock_client.get.side_effect = slow_get
+
+        result = await poll_clob_markets(mock_client, [f"m{i}" for i in range(5)], max_concurrency=3)
+
+        assert len(result) == 5
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_poll_clob_markets_uses_batch_endpoints(self, mock_client):
+        """Test batch endpoints replace per-token requests when available."""
+
+        async def fake_post(url, content=None, headers=None, timeout=None):
+            if url.endswith("/midpoints"):
+                return create_mock_response(200, {"m1": "0.5", "m2": "0.25"})
+            return create_mock_response(200, [
+                {"asset_id": "m1", "bids": [{"size": "10"}], "asks": []},
+                {"asset_id": "m2", "bids": [], "asks": [{"size": "5"}]},
+            ])
+
+        mock_client.post.side_effect = fake_post
+
+        result = await poll_clob_markets(mock_client, ["m1", "m2"])
+
+        assert result == {"m1": (0.5, 10.0), "m2": (0.25, 5.0)}
+        assert mock_client.post.call_count == 2
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_poll_clob_markets_empty(self, mock_client):
+        """Test polling no markets makes no requests."""
+        result = await poll_clob_markets(mock_client, [])
+
+        assert result == {}
+        mock_client.post.assert_not_called()
+        mock_client.get.assert_not_called()
+
+
+class TestBatchFetch:
+    """Tests for fetch_midpoints_batch and fetch_books_batch."""
+
+    @pytest.mark.asyncio
+    async def test_midpoints_batch_success(self, mock_client):
+        """Test parsing a batch midpoint response."""
+        mock_client.post.return_value = create_mock_response(200, {"t1": "0.65", "t2": "bad"})
+
+        result = await fetch_midpoints_batch(mock_client, ["t1", "t2", "t3"])
+
+        assert result == {"t1": 0.65, "t2": None, "t3": None}
+        body = orjson.loads(mock_client.post.call_args.kwargs["content"])
+        assert body == [{"token_id": "t1"}, {"token_id": "t2"}, {"token_id": "t3"}]
+        assert mock_client.post.call_args[0][0] == f"{CLOB_API_BASE}/midpoints"
+
+    @pytest.mark.asyncio
+    async def test_midpoints_batch_unavailable(self, mock_client):
+        """Test 404 from batch endpoint returns None for fallback."""
+        mock_client.post.return_value = create_mock_response(404)
+
+        result = await fetch_midpoints_batch(mock_client, ["t1"])
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_midpoints_batch_unexpected_shape(self, mock_client):
+        """Test non-dict midpoint response returns None for fallback."""
+        mock_client.post.return_value = create_mock_response(200, ["unexpected"])
+
+        result = await fetch_midpoints_batch(mock_client, ["t1"])
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_books_batch_success(self, mock_client):
+        """Test books are keyed by asset_id."""
+        book = {"asset_id": "t1", "bids": [], "asks": []}
+        mock_client.post.return_value = create_mock_response(200, [book])
+
+        result = await fetch_books_batch(mock_client, ["t1", "t2"])
+
+        assert result == {"t1": book, "t2": None}
+        assert mock_client.post.call_args[0][0] == f"{CLOB_API_BASE}/books"
+
+    @pytest.mark.asyncio
+    async def test_books_batch_retry_on_429(self, mock_client):
+        """Test batch request retries on rate limit."""
+        book = {"asset_id": "t1", "bids": [], "asks": []}
+        mock_client.post.side_effect = [
+            create_mock_response(429),
+            create_mock_response(200, [book]),
+        ]
+
+        with patch("src.clob_client.asyncio.sleep", new_callable=AsyncMock):
+            result = await fetch_books_batch(mock_client, ["t1"])
+
+        assert result == {"t1": book}
+
+    @pytest.mark.asyncio
+    async def test_books_batch_all_retries_fail(self, mock_client):
+        """Test batch request returns None after exhausting retries."""
+        mock_client.post.side_effect = httpx.TimeoutException("Timeout")
+
+        with patch("src.clob_client.asyncio.sleep", new_callable=AsyncMock):
+            result = await fetch_books_batch(mock_client, ["t1"])
+
+        assert result is None
+        assert mock_client.post.call_count == 3
@@ -2,6 +2,9 @@
 
 import pytest
 import os
+from unittest.mock import patch
+
+import src.config as config_module
 
 from src.config import (
     Configuration,
@@ -9,6 +12,8 @@ from src.config import (
     VALID_DETECTORS,
     _substitute_env_vars,
     _process_yaml_values,
+    _split_csv,
+    clear_config_cache,
     load_config,
     load_config_from_env,
     parse_detectors,
@@ -65,6 +70,32 @@ class TestSubstituteEnvVars:
         result = _substitute_env_vars("${OUTER}")
         assert result == "outer_value"
 
+    def test_unterminated_reference(self, monkeypatch):
+        """Test an unclosed ${ is kept literally after earlier substitutions."""
+        monkeypatch.setenv("VAR1", "one")
+        result = _substitute_env_vars("${VAR1}-${VAR2")
+        assert result == "one-${VAR2"
+
+    def test_adjacent_references(self, monkeypatch):
+        """Test back-to-back references with a missing variable in between."""
+        monkeypatch.setenv("VAR1", "a")
+        monkeypatch.setenv("VAR2", "b")
+        monkeypatch.delenv("MISSING_VAR", raising=False)
+        result = _substitute_env_vars("${VAR1}${MISSING_VAR}${VAR2}")
+        assert result == "a${MISSING_VAR}b"
+
+
+class TestSplitCsv:
+    """Tests for _split_csv function."""
+
+    def test_strips_and_drops_empty_items(self):
+        """Test items are stripped and blanks removed."""
+        assert _split_csv(" a , b,, ,c ") == ["a", "b", "c"]
+
+    def test_empty_string(self):
+        """Test empty input yields no items."""
+        assert _split_csv("") == []
+
 
 class TestProcessYamlValues:
     """Tests for _process_yaml_values function."""
@@ -106,6 +137,16 @@ class TestProcessYamlValues:
         result = _process_yaml_values(data)
         assert result["mixed"] == ["string", 123, "var_value", True]
 
+    def test_process_in_place(self, monkeypatch):
+        """Test values are substituted in the caller's tree without copying."""
+        monkeypatch.setenv("ITEM", "item_value")
+        inner = {"list": ["${ITEM}"]}
+        data = {"outer": inner}
+        result = _process_yaml_values(data)
+        assert result is data
+        assert result["outer"] is inner
+        assert inner["list"] == ["item_value"]
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -136,6 +177,62 @@ class TestLoadConfig:
         assert config.telegram_bot_token == "env-token-123"
         assert config.telegram_chat_id == "env-chat-456"
 
+    def test_load_utf8_config(self, tmp_path):
+        """Test the file is read as bytes and decoded as UTF-8."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_bytes("""
+slugs:
+  - "élection-présidentielle"
+telegram:
+  bot_token: "token"
+  chat_id: "chatid"
+""".encode("utf-8"))
+
+        config = load_config(config_file)
+
+        assert config.slugs == ["élection-présidentielle"]
+
+    def test_load_null_clob_token_ids(self, tmp_path):
+        """Test an empty clob_token_ids key loads as an empty list."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+slugs:
+  - "test-slug"
+clob_token_ids:
+telegram:
+  bot_token: "token"
+  chat_id: "chatid"
+""")
+
+        config = load_config(config_file)
+
+        assert config.clob_token_ids == []
+
+    def test_load_utf16_config_substitutes_env_vars(self, tmp_path, monkeypatch):
+        """Test ${VAR} references are substituted in a UTF-16 config file."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "utf16-token")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_bytes("""
+slugs:
+  - "élection-présidentielle"
+telegram:
+  bot_token: "${TELEGRAM_BOT_TOKEN}"
+  chat_id: "chatid"
+""".encode("utf-16"))
+
+        config = load_config(config_file)
+
+        assert config.slugs == ["élection-présidentielle"]
+        assert config.telegram_bot_token == "utf16-token"
+
+    def test_load_invalid_encoding_raises_configuration_error(self, tmp_path):
+        """Test undecodable bytes surface as a ConfigurationError."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_bytes(b"slugs:\n  - \"\xff\xfe\xfa\"\n")
+
+        with pytest.raises(ConfigurationError, match="not valid UTF-8"):
+            load_config(config_file)
+
     def test_load_missing_file_falls_back_to_env(self, tmp_path):
         """Test loading non-existent config file falls back to env vars."""
         # When file doesn't exist and env vars aren't set, validation fails
@@ -171,6 +268,100 @@ telegram:
         assert config.spike_threshold == 5.0
 
 
+class TestConfigurationSlots:
+    """Tests for the slotted Configuration dataclass."""
+
+    def test_no_instance_dict(self, valid_config):
+        """Test instances store fields in slots rather than a __dict__."""
+        assert not hasattr(valid_config, "__dict__")
+
+    def test_unknown_attribute_rejected(self, valid_config):
+        """Test misspelled field assignments fail instead of being silently stored."""
+        with pytest.raises(AttributeError):
+            valid_config.poll_intervall = 10
+
+
+class TestConfigCache:
+    """Tests for load_config memoization."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, valid_config_yaml):
+        """Test loading an unchanged file twice reuses the parsed Configuration."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(valid_config_yaml)
+
+        with patch("src.config._load_yaml", wraps=config_module._load_yaml) as mock_load:
+            first = load_config(config_file)
+            second = load_config(config_file)
+
+        assert mock_load.call_count == 1
+        assert second == first
+
+    def test_cached_config_is_copied(self, tmp_path, valid_config_yaml):
+        """Test changes to a returned config do not leak into later loads."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(valid_config_yaml)
+
+        first = load_config(config_file)
+        first.slugs.append("injected")
+        first.poll_interval = 999
+        second = load_config(config_file)
+
+        assert second is not first
+        assert "injected" not in second.slugs
+        assert second.poll_interval != 999
+
+    def test_modified_file_is_reparsed(self, tmp_path, valid_config_yaml):
+        """Test a change to the file's size or mtime invalidates the cache."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(valid_config_yaml)
+        first = load_config(config_file)
+
+        config_file.write_text(valid_config_yaml + "poll_interval: 120\n")
+        second = load_config(config_file)
+
+        assert second is not first
+        assert second.poll_interval == 120
+
+    def test_env_change_is_reparsed(self, tmp_path, config_with_env_vars_yaml, monkeypatch):
+        """Test substituted environment variables are part of the cache key."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token-one")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(config_with_env_vars_yaml)
+        assert load_config(config_file).telegram_bot_token == "token-one"
+
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token-two")
+
+        assert load_config(config_file).telegram_bot_token == "token-two"
+
+    def test_env_only_config_cached(self, monkeypatch):
+        """Test env-only loads are memoized per environment snapshot."""
+        monkeypatch.setenv("POLYBOTZ_SLUGS", "test-slug")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        with patch("src.config.validate_config") as mock_validate:
+            first = load_config_from_env()
+            first.clob_token_ids.append("injected")
+            second = load_config_from_env()
+
+        assert mock_validate.call_count == 1
+        assert second is not first
+        assert second.clob_token_ids == []
+
+        monkeypatch.setenv("POLYBOTZ_POLL_INTERVAL", "30")
+        assert load_config_from_env().poll_interval == 30
+
+    def test_clear_config_cache(self, tmp_path, valid_config_yaml):
+        """Test clearing the cache forces a reload."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(valid_config_yaml)
+        first = load_config(config_file)
+
+        clear_config_cache()
+
+        assert load_config(config_file) is not first
+
+
 class TestLoadConfigFromEnv:
     """Tests for load_config_from_env function."""
 
@@ -205,6 +396,21 @@ class TestLoadConfigFromEnv:
         assert config.spike_threshold == 5.0
         assert config.lvr_threshold == 8.0
 
+    def test_load_from_env_malformed_numbers_use_defaults(self, monkeypatch):
+        """Test malformed or empty numeric vars fall back to defaults."""
+        monkeypatch.setenv("POLYBOTZ_SLUGS", "test-slug")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        monkeypatch.setenv("POLYBOTZ_POLL_INTERVAL", "soon")
+        monkeypatch.setenv("POLYBOTZ_SPIKE_THRESHOLD", "")
+        monkeypatch.setenv("POLYBOTZ_COOLDOWN_MINUTES", "1.5")
+
+        config = load_config_from_env()
+
+        assert config.poll_interval == 60
+        assert config.spike_threshold == 5.0
+        assert config.cooldown_minutes == 30
+
     def test_load_from_env_missing_required(self, monkeypatch):
         """Test loading from env fails when required vars missing."""
         # Only set some vars, missing POLYBOTZ_SLUGS
@@ -517,6 +723,16 @@ class TestParseDetectors:
         result = parse_detectors("all")
         assert result == VALID_DETECTORS
 
+    def test_parse_all_shares_immutable_default(self):
+        """Test the "all" paths return the shared frozenset instead of a copy."""
+        assert parse_detectors(None) is VALID_DETECTORS
+        assert parse_detectors("all") is VALID_DETECTORS
+        assert isinstance(parse_detectors("spike,lvr"), frozenset)
+
+    def test_parse_explicit_full_list_shares_default(self):
+        """Test listing every detector explicitly returns the shared frozenset."""
+        assert parse_detectors("closed,mad,zscore,lvr,spike") is VALID_DETECTORS
+
     def test_parse_all_case_insensitive(self):
         """Test 'ALL' is case insensitive."""
         result = parse_detectors("ALL")
@@ -836,3 +1052,191 @@ telegram:
         config = load_config(config_file)
 
         assert config.detectors == set()
+
+
+class TestTelegramConcurrency:
+    """Tests for telegram_concurrency configuration."""
+
+    def test_default_concurrency(self, valid_config):
+        """Test default Telegram concurrency."""
+        assert valid_config.telegram_concurrency == 8
+
+    def test_load_config_concurrency(self, tmp_path):
+        """Test loading telegram.concurrency from config file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+slugs:
+  - "test-slug"
+telegram:
+  bot_token: "token"
+  chat_id: "chatid"
+  concurrency: 4
+""")
+
+        config = load_config(config_file)
+
+        assert config.telegram_concurrency == 4
+
+    def test_env_concurrency(self, monkeypatch):
+        """Test loading POLYBOTZ_TELEGRAM_CONCURRENCY from environment."""
+        monkeypatch.setenv("POLYBOTZ_SLUGS", "test-slug")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        monkeypatch.setenv("POLYBOTZ_TELEGRAM_CONCURRENCY", "16")
+
+        config = load_config_from_env()
+
+        assert config.telegram_concurrency == 16
+
+    def test_validate_concurrency_too_small(self, valid_config):
+        """Test concurrency below 1 is rejected."""
+        valid_config.telegram_concurrency = 0
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            validate_config(valid_config)
+        assert "telegram.concurrency" in str(exc_info.value)
+
+
+class TestTelegramBatchAlerts:
+    """Tests for telegram_batch_alerts configuration."""
+
+    def test_default_disabled(self, valid_config):
+        """Test batching is opt-in."""
+        assert valid_config.telegram_batch_alerts is False
+
+    def test_load_config_batch_alerts(self, tmp_path):
+        """Test loading telegram.batch_alerts from config file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+slugs:
+  - "test-slug"
+telegram:
+  bot_token: "token"
+  chat_id: "chatid"
+  batch_alerts: true
+""")
+
+        config = load_config(config_file)
+
+        assert config.telegram_batch_alerts is True
+
+    def test_env_batch_alerts_true(self, monkeypatch):
+        """Test enabling batching via POLYBOTZ_TELEGRAM_BATCH_ALERTS."""
+        monkeypatch.setenv("POLYBOTZ_SLUGS", "test-slug")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        monkeypatch.setenv("POLYBOTZ_TELEGRAM_BATCH_ALERTS", "True")
+
+        config = load_config_from_env()
+
+        assert config.telegram_batch_alerts is True
+
+    def test_env_batch_alerts_invalid_is_false(self, monkeypatch):
+        """Test unrecognized POLYBOTZ_TELEGRAM_BATCH_ALERTS values disable batching."""
+        monkeypatch.setenv("POLYBOTZ_SLUGS", "test-slug")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        monkeypatch.setenv("POLYBOTZ_TELEGRAM_BATCH_ALERTS", "maybe")
+
+        config = load_config_from_env()
+
+        assert config.telegram_batch_alerts is False
+
+    def test_validate_batch_alerts_not_bool(self, valid_config):
+        """Test non-boolean batch_alerts is rejected."""
+        valid_config.telegram_batch_alerts = "yes"
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            validate_config(valid_config)
+        assert "telegram.batch_alerts" in str(exc_info.value)
+
+
+class TestTelegramParseMode:
+    """Tests for telegram_parse_mode configuration."""
+
+    def test_default_html(self, valid_config):
+        """Test HTML is the default parse mode."""
+        assert valid_config.telegram_parse_mode == "HTML"
+
+    def test_load_config_parse_mode(self, tmp_path):
+        """Test loading telegram.parse_mode from config file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+slugs:
+  - "test-slug"
+telegram:
+  bot_token: "token"
+  chat_id: "chatid"
+  parse_mode: Markdown
+""")
+
+        config = load_config(config_file)
+
+        assert config.telegram_parse_mode == "Markdown"
+
+    def test_env_parse_mode(self, monkeypatch):
+        """Test setting the parse mode via POLYBOTZ_TELEGRAM_PARSE_MODE."""
+        monkeypatch.setenv("POLYBOTZ_SLUGS", "test-slug")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        monkeypatch.setenv("POLYBOTZ_TELEGRAM_PARSE_MODE", "Markdown")
+
+        config = load_config_from_env()
+
+        assert config.telegram_parse_mode == "Markdown"
+
+    def test_validate_parse_mode_invalid(self, valid_config):
+        """Test unsupported parse modes are rejected."""
+        valid_config.telegram_parse_mode = "MarkdownV2"
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            validate_config(valid_config)
+        assert "telegram.parse_mode" in str(exc_info.value)
+
+
+class TestHttpPoolConfig:
+    """Tests for HTTP connection pool configuration."""
+
+    def test_defaults(self, valid_config):
+        """Test default pool limits."""
+        assert valid_config.http_max_connections == 64
+        assert valid_config.http_max_keepalive == 32
+
+    def test_load_config_pool_limits(self, tmp_path):
+        """Test loading pool limits from config file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+slugs:
+  - "test-slug"
+http_max_connections: 20
+http_max_keepalive: 10
+telegram:
+  bot_token: "token"
+  chat_id: "chatid"
+""")
+
+        config = load_config(config_file)
+
+        assert config.http_max_connections == 20
+        assert config.http_max_keepalive == 10
+
+    def test_env_pool_limits(self, monkeypatch):
+        """Test loading pool limits from environment."""
+        monkeypatch.setenv("POLYBOTZ_SLUGS", "test-slug")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        monkeypatch.setenv("POLYBOTZ_HTTP_MAX_CONNECTIONS", "100")
+        monkeypatch.setenv("POLYBOTZ_HTTP_MAX_KEEPALIVE", "50")
+
+        config = load_config_from_env()
+
+        assert config.http_max_connections == 100
+        assert config.http_max_keepalive == 50
+
+    def test_validate_max_connections_too_small(self, valid_config):
+        """Test zero max connections is rejected."""
+        valid_config.http_max_connections = 0
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            validate_config(valid_config)
+        assert "http_max_connections" in str(exc_info.value)
@@ -15,6 +15,7 @@ from src.models import (
     MADAlert,
 )
 from src.detector import (
+    CooldownManager,
     calculate_lvr,
     classify_lvr_health,
     detect_all_liquidity_warnings,
@@ -26,9 +27,109 @@ from src.detector import (
     detect_mad_alert,
     detect_all_zscore_alerts,
     detect_all_mad_alerts,
+    detect_spikes_and_warnings,
+    _parse_outcome_prices,
 )
 
 
+class TestCooldownManager:
+    """Tests for CooldownManager."""
+
+    def test_make_key_is_tuple(self):
+        """Test keys are (market_id, metric, window) tuples."""
+        manager = CooldownManager()
+        assert manager._make_key("m1", "volume", "1h") == ("m1", "volume", "1h")
+
+    def test_first_alert_fires(self):
+        """Test a key with no history always alerts."""
+        manager = CooldownManager(cooldown_minutes=30)
+        assert manager.should_alert(("m1", "volume", "1h"), 4.0) is True
+
+    def test_repeat_alert_suppressed(self):
+        """Test a repeat alert inside the cooldown is suppressed."""
+        manager = CooldownManager(cooldown_minutes=30)
+        key = manager._make_key("m1", "volume", "1h")
+        manager.record_alert(key, 4.0)
+
+        assert manager.should_alert(key, 4.5) is False
+
+    def test_escalation_fires_during_cooldown(self):
+        """Test a large enough z-score increase re-alerts during cooldown."""
+        manager = CooldownManager(cooldown_minutes=30, escalation_threshold=1.0)
+        key = manager._make_key("m1", "volume", "1h")
+        manager.record_alert(key, 4.0)
+
+        assert manager.should_alert(key, 5.0) is True
+
+    def test_cooldown_disabled(self):
+        """Test cooldown_minutes=0 never suppresses."""
+        manager = CooldownManager(cooldown_minutes=0)
+        key = manager._make_key("m1", "volume", "1h")
+        manager.record_alert(key, 4.0)
+
+        assert manager.should_alert(key, 4.0) is True
+
+    def test_cooldown_expires(self):
+        """Test alerts fire again once the cooldown has elapsed on the monotonic clock."""
+        manager = CooldownManager(cooldown_minutes=30)
+        key = manager._make_key("m1", "volume", "1h")
+        manager.record_alert(key, 4.0, now=1000.0)
+
+        assert manager.should_alert(key, 4.0, now=1000.0 + 29 * 60) is False
+        assert manager.should_alert(key, 4.0, now=1000.0 + 30 * 60) is True
+
+    def test_cleanup_stale(self):
+        """Test entries older than twice the cooldown are removed."""
+        manager = CooldownManager(cooldown_minutes=30)
+        manager.record_alert(("old", "volume", "1h"), 4.0, now=0.0)
+        manager.record_alert(("new", "volume", "1h"), 4.0, now=3000.0)
+
+        manager.cleanup_stale(now=3700.0)
+
+        assert list(manager.entries) == [("new", "volume", "1h")]
+
+    def test_cleanup_stale_keeps_rerecorded_entry(self):
+        """Test an entry re-recorded after its first alert is not removed early."""
+        manager = CooldownManager(cooldown_minutes=30)
+        key = manager._make_key("m1", "volume", "1h")
+        manager.record_alert(key, 4.0, now=0.0)
+        manager.record_alert(key, 6.0, now=3000.0)
+
+        manager.cleanup_stale(now=3700.0)
+        assert key in manager.entries
+
+        manager.cleanup_stale(now=3000.0 + 3601.0)
+        assert key not in manager.entries
+        assert manager._expiry_heap == []
+
+    def test_cleanup_stale_after_clear_entry(self):
+        """Test cleared entries leave no lasting heap items behind."""
+        manager = CooldownManager(cooldown_minutes=30)
+        key = manager._make_key("m1", "volume", "1h")
+        manager.record_alert(key, 4.0, now=0.0)
+        manager.clear_entry(key)
+
+        manager.cleanup_stale(now=3700.0)
+
+        assert manager.entries == {}
+        assert manager._expiry_heap == []
+
+    def test_entries_are_slotted(self):
+        """Test cooldown entries carry no per-instance __dict__."""
+        manager = CooldownManager(cooldown_minutes=30)
+        key = manager._make_key("m1", "volume", "1h")
+        manager.record_alert(key, 4.0)
+
+        assert not hasattr(manager.entries[key], "__dict__")
+
+    def test_keys_are_independent(self):
+        """Test cooldown on one window does not affect another."""
+        manager = CooldownManager(cooldown_minutes=30)
+        manager.record_alert(manager._make_key("m1", "volume", "1h"), 4.0)
+
+        assert manager.should_alert(manager._make_key("m1", "volume", "4h"), 4.0) is True
+
+
 class TestDetectSpike:
     """Tests for detect_spike function."""
 
@@ -50,6 +151,19 @@ class TestDetectSpike:
         assert result.price_before == 0.50
         assert result.price_after == 0.60
 
+    def test_detect_spike_skips_unchanged_market(self):
+        """Test markets flagged as unchanged are skipped before any math."""
+        market = MonitoredMarket(
+            id="test-id",
+            question="Question?",
+            outcome="Yes",
+            current_price=0.60,
+            previous_price=0.50,
+            is_closed=False,
+            price_changed=False,
+        )
+        assert detect_spike(market, threshold=5.0) is None
+
     def test_detect_spike_below_threshold(self):
         """Test no spike when change is below threshold."""
         market = MonitoredMarket(
@@ -189,6 +303,7 @@ class TestDetectAllSpikes:
 
         assert len(spikes) == 1
         assert spikes[0].event_name == sample_event.name
+        assert spikes[0].market in sample_event.markets
 
     def test_detect_spikes_multiple_events(self):
         """Test detecting spikes across multiple events."""
@@ -225,6 +340,8 @@ class TestDetectAllSpikes:
         event_names = {s.event_name for s in spikes}
         assert "Event 1" in event_names
         assert "Event 2" in event_names
+        # One timestamp per detection pass
+        assert spikes[0].detected_at == spikes[1].detected_at
 
     def test_detect_spikes_no_spikes(self):
         """Test when no spikes are detected."""
@@ -570,6 +687,58 @@ class TestDetectLiquidityWarning:
         assert "LVR=" in caplog.text
 
 
+class TestDetectSpikesAndWarnings:
+    """Tests for detect_spikes_and_warnings function."""
+
+    def _event(self):
+        high = MonitoredMarket(
+            id="m1", question="Q1", outcome="Yes",
+            current_price=0.60, previous_price=0.50, is_closed=False,
+            volume_24h=1000000.0, liquidity=80000.0, lvr=12.5,
+        )
+        low = MonitoredMarket(
+            id="m2", question="Q2", outcome="No",
+            current_price=0.30, previous_price=0.50, is_closed=False,
+            lvr=2.0,
+        )
+        quiet = MonitoredMarket(
+            id="m3", question="Q3", outcome="Yes",
+            current_price=0.50, previous_price=0.50, is_closed=False,
+            lvr=20.0,
+        )
+        return MonitoredEvent(slug="e1", name="Event", markets=[high, low, quiet])
+
+    def test_spikes_and_warnings_in_one_pass(self):
+        """Test spikes are returned with warnings only for high-LVR spikes."""
+        spikes, warnings = detect_spikes_and_warnings([self._event()], 5.0, 8.0)
+
+        assert [s.market_question for s in spikes] == ["Q1", "Q2"]
+        assert [w.market_question for w in warnings] == ["Q1"]
+        assert warnings[0].event_name == "Event"
+
+    def test_matches_separate_passes(self):
+        """Test results agree with detect_all_spikes + detect_all_liquidity_warnings."""
+        event = self._event()
+        spikes, warnings = detect_spikes_and_warnings([event], 5.0, 8.0)
+
+        separate_spikes = detect_all_spikes([event], 5.0)
+        separate_warnings = detect_all_liquidity_warnings([event], separate_spikes, 8.0)
+
+        assert [(s.market_question, s.change_percent) for s in spikes] == [
+            (s.market_question, s.change_percent) for s in separate_spikes
+        ]
+        assert [(w.market_question, w.lvr) for w in warnings] == [
+            (w.market_question, w.lvr) for w in separate_warnings
+        ]
+
+    def test_no_lvr_threshold_skips_warnings(self):
+        """Test warnings are skipped when lvr_threshold is None."""
+        spikes, warnings = detect_spikes_and_warnings([self._event()], 5.0)
+
+        assert len(spikes) == 2
+        assert warnings == []
+
+
 class TestDetectAllLiquidityWarnings:
     """Tests for detect_all_liquidity_warnings function."""
 
@@ -705,6 +874,23 @@ class TestDetectAllLiquidityWarnings:
         assert len(warnings) == 1
         assert warnings[0].market_question == "Q1"
 
+    def test_detect_warnings_uses_spike_market(self):
+        """Test spikes from detect_all_spikes need no event lookup."""
+        market = MonitoredMarket(
+            id="m1", question="Q", outcome="Yes",
+            current_price=0.60, previous_price=0.50, is_closed=False,
+            volume_24h=1000000.0, liquidity=80000.0, lvr=12.5,
+        )
+        event = MonitoredEvent(slug="e1", name="Event", markets=[market])
+        spikes = detect_all_spikes([event], threshold=5.0)
+
+        # Events are not consulted when the spike carries its market
+        warnings = detect_all_liquidity_warnings([], spikes, lvr_threshold=8.0)
+
+        assert len(warnings) == 1
+        assert warnings[0].event_name == "Event"
+        assert warnings[0].lvr == 12.5
+
     def test_detect_warnings_logging(self, caplog):
         """Test that warning count is logged."""
         market = MonitoredMarket(
@@ -780,6 +966,15 @@ class TestDetectZScoreAlert:
 
         assert alert is None
 
+    def test_unknown_metric_window(self, caplog):
+        """Test unknown metric/window combination returns None with a warning."""
+        stats = MarketStatistics(market_id="test-market")
+
+        alert = detect_zscore_alert(stats, threshold=3.5, metric="volume", window="24h")
+
+        assert alert is None
+        assert "Unknown metric/window combo: volume/24h" in caplog.text
+
 
 class TestDetectMADAlert:
     """Tests for detect_mad_alert function (T029)."""
@@ -836,6 +1031,16 @@ class TestDetectMADAlert:
         assert alert is None
 
 
+    def test_unknown_metric_window(self, caplog):
+        """Test unknown metric/window combination returns None with a warning."""
+        stats = MarketStatistics(market_id="test-market")
+
+        alert = detect_mad_alert(stats, multiplier=3.0, metric="liquidity", window="1h")
+
+        assert alert is None
+        assert "Unknown metric/window combo: liquidity/1h" in caplog.text
+
+
 class TestDetectAllZScoreAlerts:
     """Tests for detect_all_zscore_alerts function (T034)."""
 
@@ -1205,6 +1410,36 @@ class TestDetectClosedMarkets:
         assert len(alerts) == 1
         assert alerts[0].final_price == 0.95
 
+    def test_invalid_outcome_prices_falls_back_to_current_price(self):
+        """Test malformed outcomePrices uses the last known price."""
+        market = MonitoredMarket(
+            id="m1", question="Q", outcome="Yes",
+            current_price=0.42, previous_price=None, is_closed=False,
+        )
+        events = {"test-slug": MonitoredEvent(slug="test-slug", name="E", markets=[market])}
+        new_data = {
+            "test-slug": {
+                "markets": [
+                    {"question": "Q", "closed": True, "outcomePrices": "[0.95,"},
+                ],
+            },
+        }
+
+        alerts, _ = detect_closed_markets(events, new_data)
+
+        assert alerts[0].final_price == 0.42
+
+    def test_parse_outcome_prices_is_cached(self):
+        """Test repeated outcomePrices strings are decoded once."""
+        _parse_outcome_prices.cache_clear()
+
+        assert _parse_outcome_prices('["0.95", "0.05"]') == ("0.95", "0.05")
+        assert _parse_outcome_prices('["0.95", "0.05"]') == ("0.95", "0.05")
+
+        info = _parse_outcome_prices.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
     def test_logging_on_closed_market(self, caplog):
         """Test that closed market transitions are logged."""
         market = MonitoredMarket(
@@ -0,0 +1,88 @@
+"""Tests for src/http_client.py."""
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from src.clob_client import DEFAULT_TIMEOUT, get_clob_client
+from src.http_client import (
+    CONNECT_RETRIES,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE,
+    create_http_client,
+    decode_json,
+    encode_json,
+)
+
+
+class TestCreateHttpClient:
+    """Tests for create_http_client function."""
+
+    def test_defaults(self):
+        """Test client uses HTTP/2 and the default pool limits."""
+        with patch("src.http_client.httpx.AsyncHTTPTransport") as mock_transport, \
+                patch("src.http_client.httpx.AsyncClient") as mock_client:
+            client = create_http_client()
+
+        transport_kwargs = mock_transport.call_args.kwargs
+        assert transport_kwargs["http2"] is True
+        assert transport_kwargs["limits"] == httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE,
+        )
+        assert transport_kwargs["retries"] == CONNECT_RETRIES
+        mock_client.assert_called_once_with(transport=mock_transport.return_value, timeout=10.0)
+        assert client is mock_client.return_value
+
+    def test_custom_limits(self):
+        """Test custom pool limits and timeout."""
+        with patch("src.http_client.httpx.AsyncHTTPTransport") as mock_transport, \
+                patch("src.http_client.httpx.AsyncClient") as mock_client:
+            create_http_client(max_connections=5, max_keepalive=2, timeout=3.0)
+
+        assert mock_transport.call_args.kwargs["limits"] == httpx.Limits(
+            max_connections=5, max_keepalive_connections=2
+        )
+        assert mock_client.call_args.kwargs["timeout"] == 3.0
+
+    @pytest.mark.asyncio
+    async def test_returns_usable_client(self):
+        """Test the real client can be created and closed."""
+        async with create_http_client() as client:
+            assert isinstance(client, httpx.AsyncClient)
+
+
+class TestGetClobClient:
+    """Tests for get_clob_client function."""
+
+    def test_uses_config_limits(self, valid_config):
+        """Test CLOB client pool sizing comes from configuration."""
+        valid_config.http_max_connections = 12
+        valid_config.http_max_keepalive = 6
+
+        with patch("src.clob_client.create_http_client") as mock_create:
+            client = get_clob_client(valid_config)
+
+        mock_create.assert_called_once_with(12, 6, DEFAULT_TIMEOUT)
+        assert client is mock_create.return_value
+
+
+class TestJsonHelpers:
+    """Tests for decode_json and encode_json functions."""
+
+    def test_round_trip(self):
+        """Test encoding then decoding returns the original payload."""
+        payload = {"chat_id": "123", "text": "Hello \u2191", "items": [1, 2.5, None]}
+        response = MagicMock()
+        response.content = encode_json(payload)
+
+        assert decode_json(response) == payload
+
+    def test_decode_invalid_raises_value_error(self):
+        """Test malformed JSON raises a ValueError subclass."""
+        response = MagicMock()
+        response.content = b"not json"
+
+        with pytest.raises(ValueError):
+            decode_json(response)
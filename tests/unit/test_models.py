@@ -37,6 +37,17 @@ class TestMonitoredMarket:
         assert market.previous_price is None
         assert market.is_closed is False
 
+    def test_is_yes(self):
+        """Test is_yes is precomputed from the outcome."""
+        assert MonitoredMarket(id="1", question="Q", outcome="Yes").is_yes is True
+        assert MonitoredMarket(id="1", question="Q", outcome=" YES ").is_yes is True
+        assert MonitoredMarket(id="1", question="Q", outcome="No").is_yes is False
+
+    def test_slotted(self):
+        """Test markets carry no per-instance __dict__."""
+        market = MonitoredMarket(id="1", question="Q", outcome="Yes")
+        assert not hasattr(market, "__dict__")
+
     def test_none_prices(self):
         """Test market with None prices."""
         market = MonitoredMarket(
@@ -154,6 +165,51 @@ class TestMonitoredEvent:
         assert len(event1.markets) == 1
         assert len(event2.markets) == 0
 
+    def test_slotted(self):
+        """Test events carry no per-instance __dict__ but stay mutable."""
+        event = MonitoredEvent(slug="slug", name="name")
+        event.name = "renamed"
+
+        assert event.name == "renamed"
+        assert not hasattr(event, "__dict__")
+
+    def test_find_market(self):
+        """Test looking up a market by question and outcome."""
+        yes = MonitoredMarket(id="1", question="Q", outcome="Yes")
+        no = MonitoredMarket(id="1", question="Q", outcome="No")
+        event = MonitoredEvent(slug="slug", name="name", markets=[yes, no])
+
+        assert event.find_market("Q", "Yes") is yes
+        assert event.find_market("Q", "No") is no
+        assert event.find_market("Other", "Yes") is None
+
+    def test_find_market_after_markets_replaced(self):
+        """Test the index is rebuilt when markets is reassigned or grows."""
+        event = MonitoredEvent(
+            slug="slug", name="name",
+            markets=[MonitoredMarket(id="1", question="Q1", outcome="Yes")],
+        )
+        assert event.find_market("Q2", "Yes") is None
+
+        replacement = MonitoredMarket(id="2", question="Q2", outcome="Yes")
+        event.markets = [replacement]
+        assert event.find_market("Q2", "Yes") is replacement
+        assert event.find_market("Q1", "Yes") is None
+
+        appended = MonitoredMarket(id="3", question="Q3", outcome="No")
+        event.markets.append(appended)
+        assert event.find_market("Q3", "No") is appended
+
+    def test_market_index_excluded_from_equality(self):
+        """Test the cached index does not affect equality or repr."""
+        markets = [MonitoredMarket(id="1", question="Q", outcome="Yes")]
+        event1 = MonitoredEvent(slug="slug", name="name", markets=markets)
+        event2 = MonitoredEvent(slug="slug", name="name", markets=list(markets))
+        event1.find_market("Q", "Yes")
+
+        assert event1 == event2
+        assert "_market_index" not in repr(event1)
+
 
 class TestSpikeAlert:
     """Tests for SpikeAlert dataclass."""
@@ -221,6 +277,25 @@ class TestSpikeAlert:
         assert alert.detected_at.year == 2024
         assert alert.detected_at.month == 6
 
+    def test_slotted_event_name_mutable(self):
+        """Test alerts are slotted but event_name can still be filled in later."""
+        alert = SpikeAlert(
+            event_name="",
+            market_question="Q",
+            outcome="Y",
+            price_before=0.1,
+            price_after=0.2,
+            change_percent=100.0,
+            direction="up",
+            detected_at=datetime.now(),
+        )
+        alert.event_name = "E"
+
+        assert alert.event_name == "E"
+        assert not hasattr(alert, "__dict__")
+        with pytest.raises(AttributeError):
+            alert.evnt_name = "typo"
+
 
 class TestLiquidityWarning:
     """Tests for LiquidityWarning dataclass."""
@@ -1,7 +1,9 @@
 """Tests for src/poller.py."""
 
+import asyncio
 import pytest
 import json
+import orjson
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
@@ -11,6 +13,8 @@ from src.models import MonitoredEvent, MonitoredMarket
 from src.poller import (
     _parse_json_field,
     fetch_event_by_slug,
+    fetch_all_events_raw,
+    fetch_events,
     validate_slugs,
     parse_event_response,
     update_prices,
@@ -83,6 +87,7 @@ class TestFetchEventBySlug:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
 
         result = await fetch_event_by_slug(mock_client, "test-slug")
@@ -113,6 +118,7 @@ class TestFetchEventBySlug:
         success_response = MagicMock()
         success_response.status_code = 200
         success_response.json.return_value = gamma_api_response
+        success_response.content = orjson.dumps(success_response.json.return_value)
 
         mock_client.get.side_effect = [rate_limited_response, success_response]
 
@@ -121,6 +127,40 @@ class TestFetchEventBySlug:
         assert result == gamma_api_response
         assert mock_client.get.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_fetch_rate_limited_honors_retry_after(self, gamma_api_response):
+        """Test a 429 Retry-After header sets the wait before retrying."""
+        mock_client = AsyncMock()
+
+        rate_limited_response = MagicMock()
+        rate_limited_response.status_code = 429
+        rate_limited_response.headers = {"retry-after": "7"}
+
+        success_response = MagicMock()
+        success_response.status_code = 200
+        success_response.content = orjson.dumps(gamma_api_response)
+
+        mock_client.get.side_effect = [rate_limited_response, success_response]
+
+        with patch("src.poller.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await fetch_event_by_slug(mock_client, "test-slug", max_retries=3)
+
+        assert result == gamma_api_response
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    @pytest.mark.asyncio
+    async def test_fetch_retry_delay_grows_with_jitter(self):
+        """Test retry waits back off exponentially with jitter."""
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = httpx.RequestError("Connection failed")
+
+        with patch("src.poller.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+                patch("src.retry.random.uniform", return_value=1.0):
+            result = await fetch_event_by_slug(mock_client, "test-slug", max_retries=3)
+
+        assert result is None
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1.0, 2.0]
+
     @pytest.mark.asyncio
     async def test_fetch_timeout_retry(self, gamma_api_response):
         """Test retry on timeout."""
@@ -129,6 +169,7 @@ class TestFetchEventBySlug:
         success_response = MagicMock()
         success_response.status_code = 200
         success_response.json.return_value = gamma_api_response
+        success_response.content = orjson.dumps(success_response.json.return_value)
 
         mock_client.get.side_effect = [
             httpx.TimeoutException("Timeout"),
@@ -182,6 +223,7 @@ class TestFetchEventBySlug:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
 
         await fetch_event_by_slug(mock_client, "my-event-slug")
@@ -210,6 +252,7 @@ class TestValidateSlugs:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = gamma_api_response
+            mock_response.content = orjson.dumps(mock_response.json.return_value)
             mock_client.get.return_value = mock_response
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -234,6 +277,7 @@ class TestValidateSlugs:
             valid_response = MagicMock()
             valid_response.status_code = 200
             valid_response.json.return_value = gamma_api_response
+            valid_response.content = orjson.dumps(valid_response.json.return_value)
 
             not_found_response = MagicMock()
             not_found_response.status_code = 404
@@ -283,6 +327,7 @@ class TestValidateSlugs:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = gamma_api_response
+            mock_response.content = orjson.dumps(mock_response.json.return_value)
             mock_client.get.return_value = mock_response
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -293,6 +338,32 @@ class TestValidateSlugs:
             assert "Valid slug" in caplog.text
 
 
+    @pytest.mark.asyncio
+    async def test_validate_uses_given_client(self, gamma_api_response):
+        """Test validation reuses a caller-supplied client instead of opening one."""
+        config = Configuration(
+            slugs=["slug1"],
+            poll_interval=60,
+            spike_threshold=5.0,
+            telegram_bot_token="token",
+            telegram_chat_id="chatid",
+        )
+        client = AsyncMock()
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = gamma_api_response
+        response.content = orjson.dumps(response.json.return_value)
+        client.get.return_value = response
+
+        with patch("src.poller.httpx.AsyncClient") as mock_client_class:
+            result = await validate_slugs(config, client)
+
+            mock_client_class.assert_not_called()
+
+        assert result == ["slug1"]
+        client.get.assert_awaited_once()
+
+
 class TestParseEventResponse:
     """Tests for parse_event_response function."""
 
@@ -459,6 +530,16 @@ class TestUpdatePrices:
 
         assert yes_market.current_price == 0.75
         assert yes_market.previous_price == 0.65
+        assert yes_market.price_changed is True
+
+    def test_update_unchanged_price_clears_price_changed(self, gamma_api_response):
+        """Test markets whose price did not move are flagged unchanged."""
+        initial_event = parse_event_response(gamma_api_response)
+
+        result = update_prices(initial_event, gamma_api_response)
+
+        assert result.markets
+        assert all(m.price_changed is False for m in result.markets)
 
     def test_update_new_market(self, gamma_api_response):
         """Test adding new market that wasn't in original."""
@@ -501,6 +582,68 @@ class TestUpdatePrices:
         assert result.last_updated >= initial_time
 
 
+class TestFetchEvents:
+    """Tests for concurrent fetch_events function."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_slug_order(self):
+        """Test results keep slug order even when fetches finish out of order."""
+        delays = {"a": 0.03, "b": 0.0, "c": 0.01}
+
+        async def fake_fetch(client, slug):
+            await asyncio.sleep(delays[slug])
+            return {"slug": slug}
+
+        with patch("src.poller.fetch_event_by_slug", fake_fetch):
+            result = await fetch_events(AsyncMock(), ["a", "b", "c"])
+
+        assert result == [("a", {"slug": "a"}), ("b", {"slug": "b"}), ("c", {"slug": "c"})]
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self):
+        """Test no more than max_concurrency fetches are in flight."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_fetch(client, slug):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        with patch("src.poller.fetch_event_by_slug", fake_fetch):
+            await fetch_events(AsyncMock(), [f"s{i}" for i in range(6)], max_concurrency=2)
+
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_becomes_none(self, caplog):
+        """Test an unexpected error for one slug does not fail the others."""
+        async def fake_fetch(client, slug):
+            if slug == "bad":
+                raise ValueError("malformed body")
+            return {"slug": slug}
+
+        with patch("src.poller.fetch_event_by_slug", fake_fetch):
+            result = await fetch_events(AsyncMock(), ["good", "bad"])
+
+        assert result == [("good", {"slug": "good"}), ("bad", None)]
+        assert "Error fetching bad: malformed body" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_events_raw_drops_failures(self):
+        """Test raw fetch only returns slugs with data."""
+        async def fake_fetch(client, slug):
+            return None if slug == "gone" else {"slug": slug}
+
+        with patch("src.poller.fetch_event_by_slug", fake_fetch):
+            result = await fetch_all_events_raw(AsyncMock(), ["a", "gone"])
+
+        assert result == {"a": {"slug": "a"}}
+
+
 class TestPollAllEvents:
     """Tests for poll_all_events function."""
 
@@ -514,6 +657,7 @@ class TestPollAllEvents:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
 
         result = await poll_all_events(mock_client, events)
@@ -532,6 +676,7 @@ class TestPollAllEvents:
         success_response = MagicMock()
         success_response.status_code = 200
         success_response.json.return_value = gamma_api_response
+        success_response.content = orjson.dumps(success_response.json.return_value)
 
         fail_response = MagicMock()
         fail_response.status_code = 404
@@ -565,6 +710,7 @@ class TestPollAllEvents:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = gamma_api_response
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_client.get.return_value = mock_response
 
         with caplog.at_level("DEBUG"):
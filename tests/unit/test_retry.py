@@ -0,0 +1,69 @@
+"""Tests for src/retry.py."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.retry import backoff_delay
+
+
+def create_response(headers: dict):
+    """Create a mock response with the given headers."""
+    response = MagicMock()
+    response.headers = headers
+    return response
+
+
+class TestBackoffDelay:
+    """Tests for backoff_delay function."""
+
+    def test_exponential_growth(self):
+        """Test delay doubles with each attempt (jitter fixed at 1.0)."""
+        with patch("src.retry.random.uniform", return_value=1.0):
+            assert backoff_delay(0) == 1.0
+            assert backoff_delay(1) == 2.0
+            assert backoff_delay(2) == 4.0
+
+    def test_jitter_bounds(self):
+        """Test jittered delay stays within [0.5, 1.5] of the base delay."""
+        for _ in range(100):
+            delay = backoff_delay(2)
+            assert 2.0 <= delay <= 6.0
+
+    def test_capped_at_max_delay(self):
+        """Test delay never exceeds max_delay before jitter."""
+        with patch("src.retry.random.uniform", return_value=1.0):
+            assert backoff_delay(20, max_delay=30.0) == 30.0
+
+    def test_custom_base(self):
+        """Test custom base delay."""
+        with patch("src.retry.random.uniform", return_value=1.0):
+            assert backoff_delay(1, base=0.5) == 1.0
+
+    def test_retry_after_header_wins(self):
+        """Test numeric Retry-After header is used as-is when under max_delay."""
+        response = create_response({"retry-after": "12"})
+        assert backoff_delay(0, response) == 12.0
+
+    def test_large_retry_after_clamped_to_max_delay(self):
+        """Test a very long Retry-After is capped at max_delay."""
+        response = create_response({"retry-after": "3600"})
+        assert backoff_delay(0, response) == 30.0
+        assert backoff_delay(0, response, max_delay=5.0) == 5.0
+
+    def test_retry_after_http_date_ignored(self):
+        """Test HTTP-date Retry-After falls back to exponential backoff."""
+        response = create_response({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        with patch("src.retry.random.uniform", return_value=1.0):
+            assert backoff_delay(1, response) == 2.0
+
+    def test_missing_retry_after(self):
+        """Test response without Retry-After uses exponential backoff."""
+        response = create_response({})
+        with patch("src.retry.random.uniform", return_value=1.0):
+            assert backoff_delay(0, response) == 1.0
+
+    def test_negative_retry_after_clamped(self):
+        """Test negative Retry-After is clamped to zero."""
+        response = create_response({"retry-after": "-5"})
+        assert backoff_delay(0, response) == pytest.approx(0.0)
@@ -1,5 +1,6 @@
 """Tests for statistics module."""
 
+from collections import deque
 from datetime import datetime, timedelta
 
 import pytest
@@ -10,7 +11,10 @@ from src.statistics import (
     calculate_mad,
     calculate_zscore_mad,
     get_statistics_summary,
+    median_and_mad,
+    update_all_market_statistics,
     update_market_statistics,
+    zscore_from_mad,
 )
 
 
@@ -53,6 +57,34 @@ class TestCalculateMAD:
         assert result == 1.0
 
 
+class TestMedianAndMAD:
+    """Tests for median_and_mad and zscore_from_mad."""
+
+    def test_median_and_mad_with_known_values(self):
+        """Test median and MAD are returned together."""
+        assert median_and_mad([1.0, 2.0, 3.0, 4.0, 5.0]) == (3.0, 1.0)
+
+    def test_median_and_mad_even_length(self):
+        """Test even-length input averages the two middle values."""
+        # Median: 2.5, deviations: [1.5, 0.5, 0.5, 1.5] -> MAD 1.0
+        assert median_and_mad([4.0, 1.0, 3.0, 2.0]) == (2.5, 1.0)
+
+    def test_median_and_mad_matches_calculate_mad(self):
+        """Test MAD agrees with calculate_mad."""
+        values = [10.0, 12.0, 11.0, 50.0, 9.0, 10.5]
+        assert median_and_mad(values)[1] == calculate_mad(values)
+
+    def test_zscore_from_mad_matches_calculate_zscore_mad(self):
+        """Test precomputed Z-score agrees with calculate_zscore_mad."""
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+        median, mad = median_and_mad(values)
+        assert zscore_from_mad(10.0, median, mad) == calculate_zscore_mad(10.0, values)
+
+    def test_zscore_from_mad_zero_mad(self):
+        """Test zero MAD returns None."""
+        assert zscore_from_mad(5.0, 5.0, 0.0) is None
+
+
 class TestCalculateZScoreMAD:
     """Tests for calculate_zscore_mad function."""
 
@@ -175,6 +207,89 @@ class TestRollingWindow:
         assert (datetime.now() - window.observations[0].timestamp).total_seconds() < 1
 
 
+    def test_rolling_window_trim_keeps_columns_aligned(self):
+        """Test trimming drops timestamps and values together."""
+        window = RollingWindow(duration=timedelta(hours=1))
+        now = datetime.now()
+        window.add(1.0, now - timedelta(hours=2))
+        window.add(2.0, now)
+
+        assert window.values == [2.0]
+        assert window.observations == [Observation(timestamp=now, value=2.0)]
+
+
+    def test_rolling_window_median_and_mad(self):
+        """Test median_and_mad matches the standalone calculation."""
+        window = RollingWindow(duration=timedelta(hours=1))
+        now = datetime.now()
+        for value in [5.0, 1.0, 4.0, 2.0, 3.0, 100.0]:
+            window.add(value, now)
+
+        assert window.median_and_mad() == median_and_mad(window.values)
+
+    def test_rolling_window_storage_not_constructor_args(self):
+        """Test samples cannot be injected past the sorted order statistics."""
+        with pytest.raises(TypeError):
+            RollingWindow(duration=timedelta(hours=1), _samples=deque([1.0, 2.0, 3.0]))
+
+    def test_rolling_window_latest_and_count(self):
+        """Test latest returns the newest value and count the window size."""
+        window = RollingWindow(duration=timedelta(hours=1))
+        assert window.latest is None
+        assert window.count == 0
+
+        now = datetime.now()
+        window.add(3.0, now)
+        window.add(1.0, now)
+
+        assert window.latest == 1.0
+        assert window.count == 2
+
+    def test_rolling_window_median_and_mad_empty(self):
+        """Test median_and_mad returns None for an empty window."""
+        window = RollingWindow(duration=timedelta(hours=1))
+        assert window.median_and_mad() is None
+
+    def test_rolling_window_median_after_trim(self):
+        """Test trimmed values drop out of the sorted order statistics."""
+        window = RollingWindow(duration=timedelta(hours=1))
+        now = datetime.now()
+        window.add(1000.0, now - timedelta(hours=2))
+        window.add(1000.0, now - timedelta(hours=2))
+        for value in [1.0, 2.0, 3.0]:
+            window.add(value, now)
+
+        assert window.median == 2.0
+        assert window.mad == 1.0
+
+
+    def test_rolling_window_spread_cached_until_change(self):
+        """Test (median, MAD) is reused until a value is added or trimmed."""
+        window = RollingWindow(duration=timedelta(hours=1))
+        now = datetime.now()
+        for value in [1.0, 2.0, 3.0]:
+            window.add(value, now)
+
+        first = window.median_and_mad()
+        assert window.median_and_mad() is first
+
+        window.add(10.0, now)
+        assert window.median_and_mad() == (2.5, 1.0)
+
+    def test_rolling_window_spread_invalidated_by_trim(self):
+        """Test expiring values invalidates the cached (median, MAD)."""
+        window = RollingWindow(duration=timedelta(hours=1))
+        now = datetime.now()
+        window.add(100.0, now - timedelta(minutes=45))
+        window.add(1.0, now)
+        window.add(2.0, now)
+        assert window.median == 2.0
+
+        # Force the oldest value out of the window
+        window.duration = timedelta(minutes=30)
+        assert window.median_and_mad() == (1.5, 0.5)
+
+
 class TestUpdateMarketStatistics:
     """Tests for update_market_statistics function."""
 
@@ -210,6 +325,40 @@ class TestUpdateMarketStatistics:
         assert (datetime.now() - stats.last_updated).total_seconds() < 1
 
 
+class TestUpdateAllMarketStatistics:
+    """Tests for update_all_market_statistics function."""
+
+    def test_creates_and_updates_entries(self):
+        """Test new markets get statistics and existing ones are appended to."""
+        from src.models import MarketStatistics
+
+        existing = MarketStatistics(market_id="a")
+        market_stats = {"a": existing}
+        timestamp = datetime.now()
+
+        skipped = update_all_market_statistics(
+            market_stats, {"a": (0.5, 100.0), "b": (0.6, 200.0)}, timestamp
+        )
+
+        assert skipped == []
+        assert market_stats["a"] is existing
+        assert existing.price_1h.values == [0.5]
+        assert market_stats["b"].volume_4h.values == [200.0]
+        assert market_stats["b"].last_updated == timestamp
+
+    def test_skips_missing_data(self):
+        """Test markets missing price or volume are skipped and reported."""
+        market_stats = {}
+
+        skipped = update_all_market_statistics(
+            market_stats, {"a": (None, 100.0), "b": (0.5, None), "c": (0.5, 10.0)}
+        )
+
+        assert skipped == ["a", "b"]
+        assert list(market_stats) == ["c"]
+        assert market_stats["c"].last_updated is not None
+
+
 class TestGetStatisticsSummary:
     """Tests for get_statistics_summary function."""
 